@@ -1,13 +1,23 @@
 """FastAPI application entry point."""
 
+import hmac
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.database import init_db, close_db
 from app.clients import init_clients, close_clients
-from app.routers import questions, recordings, analysis
+from app.auth import jwks_cache
+from app.routers import questions, recordings, analysis, storage, me, cohorts
+from app.services.storage_service import storage_service
+from app.services.tts_stream import tts_stream_registry
+from app.services.cohort_stats import cohort_stats_refresher
+from app.services.analysis_events import analysis_event_bus
+from app.utils.audio_upload import RequestSizeLimitMiddleware, MULTIPART_OVERHEAD_BYTES
+from app.utils.db_metrics import RouteContextMiddleware
+from app.utils.metrics import metrics
 
 
 @asynccontextmanager
@@ -16,9 +26,18 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     await init_clients()
+    if settings.SUPABASE_JWKS_URL:
+        # Otherwise started by the first asymmetric token (HS256-only projects never fetch)
+        jwks_cache.start()
+    cohort_stats_refresher.start()
     yield
     # Shutdown: clean up resources
+    await cohort_stats_refresher.close()
+    await analysis_event_bus.close()
+    await jwks_cache.close()
+    await tts_stream_registry.close()
     await close_clients()
+    storage_service.close()
     await close_db()
 
 
@@ -38,11 +57,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized uploads before the multipart body is parsed
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_body_bytes=settings.MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+)
+
+# Lets the database pool hooks attribute connection hold time to routes
+app.add_middleware(RouteContextMiddleware)
+
 prefix = "/api/v1"
 # Include routers
 app.include_router(questions.router, prefix=prefix, tags=["Questions"])
 app.include_router(recordings.router, prefix=prefix, tags=["Recordings"])
 app.include_router(analysis.router, prefix=prefix, tags=["Analysis"])
+app.include_router(storage.router, prefix=prefix, tags=["Storage"])
+app.include_router(me.router, prefix=prefix, tags=["Me"])
+app.include_router(cohorts.router, prefix=prefix, tags=["Cohorts"])
 
 
 @app.get("/")
@@ -55,3 +86,15 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics(authorization: str | None = Header(None)):
+    """Database pool and query metrics in the Prometheus text format."""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if settings.METRICS_TOKEN and not hmac.compare_digest(
+        authorization or "", f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
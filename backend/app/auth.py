@@ -1,27 +1,221 @@
 """
 Authentication module for JWT token verification.
 
-Uses Supabase JWT tokens issued by the frontend auth flow.
+Uses Supabase JWT tokens issued by the frontend auth flow. Tokens signed
+with the legacy shared secret (HS256) and with asymmetric signing keys
+(RS256/ES256, published as a JWKS) are both accepted.
+
+Verified tokens are cached per worker until they expire, so clients that
+poll with the same token are authenticated with a dictionary lookup.
 """
 
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
+from app.clients import get_http_client
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Bearer scheme for endpoints that also accept other credentials (e.g. signed URLs)
+optional_security = HTTPBearer(auto_error=False)
+
+# Algorithms verified against the JWKS (HS256 uses SUPABASE_JWT_SECRET)
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+
+# Minimum seconds between JWKS fetches triggered by an unknown key ID
+JWKS_MIN_FETCH_INTERVAL_SECONDS = 30
+
 
 class AuthenticatedUser(BaseModel):
     """Authenticated user information extracted from JWT token."""
     user_id: str
     email: str | None = None
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified tokens that honours their expiry.
     
+    Keyed by the token's SHA-256 digest so raw tokens are not kept in
+    memory. An entry is only returned between its `nbf` and `exp` claims,
+    the same window jwt.decode() accepts. Accessed from the event loop only,
+    so no locking is needed.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # token digest -> (user, not_before, expires_at), in LRU order
+        self._entries: OrderedDict[bytes, tuple[AuthenticatedUser, float, float]] = OrderedDict()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> AuthenticatedUser | None:
+        """Get the user of a verified token that is currently valid."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user, not_before, expires_at = entry
+        now = time.time()
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        if now < not_before:
+            return None
+        self._entries.move_to_end(key)
+        return user
+    
+    def put(self, token: str, user: AuthenticatedUser, expires_at: float, not_before: float = 0.0) -> None:
+        """Cache a verified token, evicting the least recently used entry if full."""
+        key = self._key(token)
+        self._entries[key] = (user, not_before, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        self._entries.clear()
+
+
+class JwksCache:
+    """Supabase signing keys, fetched from the JWKS endpoint and refreshed in the background.
+    
+    A token signed with a key ID that is not cached triggers an immediate
+    fetch (at most once every JWKS_MIN_FETCH_INTERVAL_SECONDS), so key
+    rotation does not wait for the next background refresh. Projects that
+    only issue HS256 tokens never fetch: the refresh loop starts at startup
+    when SUPABASE_JWKS_URL is set, and otherwise with the first asymmetric
+    token.
+    """
+    
+    def __init__(self, url: str, refresh_seconds: float):
+        self.url = url
+        self.refresh_seconds = refresh_seconds
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+    
+    def start(self) -> None:
+        """Start the refresh loop (no-op if the interval is 0 or it is already running)."""
+        if self.refresh_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                # Started lazily, the loop runs alongside the fetch of the token that started it
+                if self._fetched_at is None or time.monotonic() - self._fetched_at >= JWKS_MIN_FETCH_INTERVAL_SECONDS:
+                    await self.refresh()
+            except Exception as e:
+                # Keep the loop alive; previously fetched keys stay in use
+                logger.error(f"JWKS refresh failed: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+    
+    async def refresh(self) -> None:
+        """Fetch the key set now."""
+        self._fetched_at = time.monotonic()
+        response = await get_http_client().get(self.url, timeout=10.0)
+        response.raise_for_status()
+        
+        keys = {}
+        for jwk in response.json().get("keys", []):
+            if "kid" not in jwk or jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk["kid"]] = jwt.PyJWK(jwk)
+            except jwt.PyJWKError as e:
+                # e.g. RS256/ES256 keys without the cryptography package (pyjwt[crypto])
+                logger.warning(f"Skipping JWKS key {jwk['kid']}: {e}")
+        
+        removed = self._keys.keys() - keys.keys()
+        self._keys = keys
+        if removed:
+            # Tokens signed with a revoked key must be verified again
+            verified_tokens.clear()
+            logger.info(f"JWKS keys removed: {', '.join(sorted(removed))}")
+    
+    async def get_key(self, kid: str) -> jwt.PyJWK | None:
+        """
+        Get a signing key by ID, fetching the key set if the ID is unknown.
+        
+        Raises:
+            Exception: If the key set had to be fetched and the fetch failed
+        """
+        # Asymmetric tokens are in use, so keep the keys fresh from now on
+        self.start()
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+        async with self._lock:
+            key = self._keys.get(kid)
+            recently_fetched = (
+                self._fetched_at is not None
+                and time.monotonic() - self._fetched_at < JWKS_MIN_FETCH_INTERVAL_SECONDS
+            )
+            if key is None and not recently_fetched:
+                await self.refresh()
+                key = self._keys.get(kid)
+        return key
+    
+    async def close(self) -> None:
+        """Stop the refresh loop (app shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+async def _signing_key(header: dict) -> str | jwt.PyJWK:
+    """Pick the verification key for a token from its (unverified) header."""
+    algorithm = header.get("alg")
+    if algorithm == "HS256":
+        if not settings.SUPABASE_JWT_SECRET:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="JWT secret not configured"
+            )
+        return settings.SUPABASE_JWT_SECRET
     
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> AuthenticatedUser:
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid token: unsupported algorithm {algorithm}"
+        )
+    try:
+        key = await jwks_cache.get_key(header.get("kid", ""))
+    except Exception as e:
+        logger.error(f"JWKS fetch failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Signing keys unavailable"
+        )
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: unknown signing key"
+        )
+    return key
+
+
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> AuthenticatedUser:
     """
     Verify JWT token and extract user information.
     
@@ -38,19 +232,19 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
     """
     token = credentials.credentials
     
-    if not settings.SUPABASE_JWT_SECRET:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="JWT secret not configured"
-        )
+    user = verified_tokens.get(token)
+    if user is not None:
+        return user
     
     try:
+        header = jwt.get_unverified_header(token)
+        key = await _signing_key(header)
+        
         # Decode and verify the JWT token
-        # Supabase uses HS256 algorithm by default
         payload = jwt.decode(
             token,
-            settings.SUPABASE_JWT_SECRET,
-            algorithms=["HS256"],
+            key,
+            algorithms=[header["alg"]],
             audience="authenticated",  # Supabase sets this for authenticated users
         )
         
@@ -65,8 +259,19 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         # Extract email if available
         email = payload.get("email")
         
-        return AuthenticatedUser(user_id=user_id, email=email)
+        user = AuthenticatedUser(user_id=user_id, email=email)
+        
+        # Tokens without an expiry are verified every time
+        expires_at = payload.get("exp")
+        not_before = payload.get("nbf")
+        if isinstance(expires_at, (int, float)):
+            verified_tokens.put(
+                token, user, expires_at,
+                not_before=not_before if isinstance(not_before, (int, float)) else 0.0,
+            )
         
+        return user
+    
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,5 +289,29 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         )
 
 
+async def get_optional_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security)
+) -> AuthenticatedUser | None:
+    """
+    Verify the JWT token if one was sent.
+    
+    Returns:
+        AuthenticatedUser, or None when no Authorization header is present
+        
+    Raises:
+        HTTPException 401 if a token is present but invalid or expired
+    """
+    if credentials is None:
+        return None
+    return await verify_token(credentials)
+
+
+# Global instances
+verified_tokens = VerifiedTokenCache(max_entries=settings.JWT_CACHE_SIZE)
+jwks_cache = JwksCache(
+    url=settings.SUPABASE_JWKS_URL or f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1/.well-known/jwks.json",
+    refresh_seconds=settings.JWKS_REFRESH_SECONDS,
+)
+
 # Dependency alias for cleaner imports
 get_current_user = verify_token
@@ -1,28 +1,91 @@
 """Database connection and session management."""
 
 import logging
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
+from app.utils.db_metrics import TimedQueuePool, instrument_engine
 
 # Set SQLAlchemy engine log level to WARNING
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+
+def _create_engine(url: str, **kwargs) -> AsyncEngine:
+    """Create an engine with the shared pool and statement-cache settings."""
+    connect_args = {
+        # asyncpg's per-connection prepared statement cache, plus SQLAlchemy's
+        # cache of prepared statement handles on top of it
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        **kwargs.pop("connect_args", {}),
+    }
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        # No pool_pre_ping: it costs a round trip per checkout. Connections are
+        # recycled before server-side idle timeouts instead, and a connection
+        # found dead mid-query invalidates the pool so the next checkout reconnects.
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        poolclass=TimedQueuePool,
+        connect_args=connect_args,
+        **kwargs,
+    )
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-)
+engine = _create_engine(settings.DATABASE_URL)
+
+
+def _reject_writes(read_only_engine: AsyncEngine) -> None:
+    """Refuse INSERT/UPDATE/DELETE statements on an engine sharing the primary's connections."""
+
+    @event.listens_for(read_only_engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+            raise InvalidRequestError(f"Write on a read-only session: {statement[:80]}")
 
-# Create async session factory
+
+# Engine for read-only requests. Reads run in autocommit, so a read is a
+# single round trip with no BEGIN or COMMIT.
+if settings.DATABASE_READ_URL:
+    # The replica's connections are read-only at the server
+    read_engine = _create_engine(
+        settings.DATABASE_READ_URL,
+        isolation_level="AUTOCOMMIT",
+        connect_args={"server_settings": {"default_transaction_read_only": "on"}},
+    )
+else:
+    # Without a replica, reads share the primary's pool (a second pool would
+    # double the connections per worker); writes are refused client-side
+    read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    _reject_writes(read_engine)
+
+instrument_engine(engine, "primary")
+if read_engine.sync_engine.pool is not engine.sync_engine.pool:
+    instrument_engine(read_engine, "read")
+
+# Create async session factories
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+async_read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -42,6 +105,36 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency to get a read-only database session.
+    
+    Never commits; any write raises. Served by DATABASE_READ_URL when set,
+    so results may lag the primary slightly: endpoints that must see a
+    write the client has just made should keep using get_db.
+    """
+    async with async_read_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Open a short-lived session for one unit of work outside a request.
+    
+    Commits on success and rolls back on error. Long-running tasks should
+    open one scope per batch of writes instead of holding a session (and
+    its pooled connection) across slow external calls.
+    """
+    async with async_session() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -49,5 +142,6 @@ async def init_db():
 
 
 async def close_db():
-    """Close database connection pool."""
+    """Close database connection pools."""
+    await read_engine.dispose()
     await engine.dispose()
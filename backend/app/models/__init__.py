@@ -2,7 +2,12 @@
 
 from app.models.question import Question, QuestionRepository
 from app.models.recording import Recording, RecordingRepository
-from app.models.analysis import AnalysisResult, AnalysisResultRepository
+from app.models.progress import UserProgress, UserProgressRepository, ProgressAttempt
+from app.models.question_stats import QuestionScoreStats, QuestionScoreStatsRepository, ScoreDistribution, HISTOGRAM_SPECS
+from app.models.feedback_search import FeedbackDocument, FeedbackSearchRepository, FeedbackSearchHit
+from app.models.cohort import Cohort, CohortMember, CohortRepository
+from app.models.analysis import AnalysisResult, AnalysisResultRepository, RecordingReport, RecordingSummary, ReportPath
+from app.models.analysis_events import AnalysisEvent, AnalysisEventRepository, AnalysisOutcome
 
 __all__ = [
     "Question",
@@ -11,4 +16,23 @@ __all__ = [
     "RecordingRepository",
     "AnalysisResult", 
     "AnalysisResultRepository",
+    "RecordingReport",
+    "AnalysisEvent",
+    "AnalysisEventRepository",
+    "AnalysisOutcome",
+    "FeedbackDocument",
+    "FeedbackSearchRepository",
+    "FeedbackSearchHit",
+    "Cohort",
+    "CohortMember",
+    "CohortRepository",
+    "UserProgress",
+    "UserProgressRepository",
+    "ProgressAttempt",
+    "QuestionScoreStats",
+    "QuestionScoreStatsRepository",
+    "ScoreDistribution",
+    "HISTOGRAM_SPECS",
+    "RecordingSummary",
+    "ReportPath",
 ]
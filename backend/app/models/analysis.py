@@ -1,13 +1,24 @@
 """Analysis result model and repository."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, select
+from sqlalchemy import (
+    Integer, SmallInteger, REAL, String, Text, DateTime, ForeignKey, JSON, Index,
+    func, select, insert, update, literal, tuple_, text
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import Base
+from app.models.question import Question
+from app.models.recording import Recording
+from app.models.progress import ProgressAttempt, UserProgress, UserProgressRepository
+from app.models.feedback_search import FeedbackSearchRepository, feedback_documents
+from app.models.question_stats import (
+    HISTOGRAM_SPECS, QuestionScoreStatsRepository, ScoreDistribution
+)
 
 
 class AnalysisResult(Base):
@@ -55,6 +66,14 @@ class AnalysisResult(Base):
     # Error message if failed
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     
+    # Scores copied out of report_json on completion, for indexed analytics
+    total_score: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    delivery: Mapped[float | None] = mapped_column(REAL, nullable=True)
+    language_use: Mapped[float | None] = mapped_column(REAL, nullable=True)
+    topic_development: Mapped[float | None] = mapped_column(REAL, nullable=True)
+    level: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    analysis_version: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -62,10 +81,93 @@ class AnalysisResult(Base):
         nullable=False
     )
     
+    __table_args__ = (
+        # Per-user and per-question score aggregates over completed analyses
+        Index(
+            "idx_analysis_results_user_scores",
+            "user_id", "question_id",
+            postgresql_include=["total_score", "delivery", "language_use", "topic_development"],
+            postgresql_where=text("status = 'completed'"),
+        ),
+        Index(
+            "idx_analysis_results_question_scores",
+            "question_id",
+            postgresql_include=["total_score", "delivery", "language_use", "topic_development"],
+            postgresql_where=text("status = 'completed'"),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<AnalysisResult {self.id} status={self.status}>"
 
 
+def score_columns(report_json: dict) -> dict:
+    """
+    Extract the score columns stored alongside a completed report.
+    
+    Args:
+        report_json: ToeflReportV2 dict
+        
+    Returns:
+        Column values for total_score, delivery, language_use,
+        topic_development, level and analysis_version (None when absent)
+    """
+    global_evaluation = report_json.get("global_evaluation") or {}
+    breakdown = global_evaluation.get("score_breakdown") or {}
+    return {
+        "total_score": global_evaluation.get("total_score"),
+        "delivery": breakdown.get("delivery"),
+        "language_use": breakdown.get("language_use"),
+        "topic_development": breakdown.get("topic_development"),
+        "level": global_evaluation.get("level"),
+        "analysis_version": report_json.get("analysis_version"),
+    }
+
+
+# Path into report_json, e.g. ("global_evaluation", "total_score") or ("chunks", 2)
+ReportPath = tuple[str | int, ...]
+
+
+@dataclass
+class RecordingReport:
+    """A recording joined with its analysis result (if any)."""
+    recording: Recording
+    analysis_id: int | None
+    status: str | None
+    error_message: str | None
+    report: dict | None  # Full report_json, or only the requested paths
+
+
+@dataclass
+class RecordingSummary:
+    """One row of a user's practice history."""
+    recording_id: str
+    question_id: str
+    question_title: str | None
+    status: str | None
+    total_score: int | None
+    level: str | None
+    created_at: datetime
+
+
+def _progress_attempt(
+    recording_id: str,
+    question_id: str | None,
+    created_at: datetime,
+    scores: dict
+) -> ProgressAttempt:
+    """Build the rollup entry for a completed analysis."""
+    return ProgressAttempt(
+        recording_id=recording_id,
+        question_id=question_id,
+        total_score=scores["total_score"],
+        delivery=scores["delivery"],
+        language_use=scores["language_use"],
+        topic_development=scores["topic_development"],
+        created_at=created_at,
+    )
+
+
 class AnalysisResultRepository:
     """Repository for AnalysisResult entity database operations."""
     
@@ -86,9 +188,159 @@ class AnalysisResultRepository:
         )
         db.add(analysis)
         await db.flush()
-        await db.refresh(analysis)
         return analysis
     
+    @staticmethod
+    async def create_with_recording(
+        db: AsyncSession,
+        recording_id: str,
+        question_id: str,
+        audio_url: str,
+        user_id: str | None = None,
+        status: str = "processing"
+    ) -> int:
+        """
+        Insert a recording and its analysis result in a single statement.
+        
+        Uses a data-modifying CTE (INSERT ... RETURNING feeding INSERT ...
+        SELECT), so both rows cost one round trip instead of two
+        add/flush/refresh cycles.
+        
+        Returns:
+            ID of the new analysis result
+        """
+        owner = UUID(user_id) if user_id else None
+        now = datetime.utcnow()
+        new_recording = (
+            insert(Recording)
+            .values(
+                recording_id=recording_id,
+                user_id=owner,
+                question_id=question_id,
+                audio_url=audio_url,
+                created_at=now,
+            )
+            .returning(Recording.recording_id)
+            .cte("new_recording")
+        )
+        stmt = (
+            insert(AnalysisResult)
+            .from_select(
+                ["recording_id", "user_id", "question_id", "status", "created_at"],
+                select(
+                    new_recording.c.recording_id,
+                    literal(owner, AnalysisResult.user_id.type),
+                    literal(question_id, AnalysisResult.question_id.type),
+                    literal(status, AnalysisResult.status.type),
+                    literal(now, AnalysisResult.created_at.type),
+                )
+            )
+            .returning(AnalysisResult.id)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one()
+    
+    @staticmethod
+    async def get_recording_report(
+        db: AsyncSession,
+        recording_id: str,
+        report_paths: list[ReportPath] | None = None
+    ) -> RecordingReport | None:
+        """
+        Get a recording and its analysis result in one joined query.
+        
+        Args:
+            db: Database session
+            recording_id: Recording ID (ULID format)
+            report_paths: Only select these parts of report_json (extracted in SQL)
+            
+        Returns:
+            RecordingReport, or None if the recording does not exist. With
+            report_paths, report maps each path to its value.
+        """
+        if report_paths is None:
+            report_columns = [AnalysisResult.report_json]
+        else:
+            report_columns = [AnalysisResult.report_json[path] for path in report_paths]
+        
+        result = await db.execute(
+            select(
+                Recording,
+                AnalysisResult.id,
+                AnalysisResult.status,
+                AnalysisResult.error_message,
+                *report_columns
+            )
+            .outerjoin(AnalysisResult, AnalysisResult.recording_id == Recording.recording_id)
+            .where(Recording.recording_id == recording_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        
+        recording, analysis_id, status, error_message, *report_values = row
+        if analysis_id is None:
+            report = None
+        elif report_paths is None:
+            report = report_values[0]
+        elif all(value is None for value in report_values):
+            report = None
+        else:
+            report = dict(zip(report_paths, report_values))
+        return RecordingReport(
+            recording=recording,
+            analysis_id=analysis_id,
+            status=status,
+            error_message=error_message,
+            report=report
+        )
+    
+    @staticmethod
+    async def get_user_history(
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        before: tuple[datetime, str] | None = None
+    ) -> list[RecordingSummary]:
+        """
+        Get a page of a user's recordings, newest first, with score summaries.
+        
+        Keyset pagination on (created_at, recording_id) walks the
+        idx_recordings_user_history index, so every page costs the same
+        regardless of how many attempts the user has. Scores come from the
+        extracted columns; report_json is never read.
+        
+        Args:
+            db: Database session
+            user_id: Owner of the recordings
+            limit: Maximum number of rows
+            before: (created_at, recording_id) of the last row of the previous page
+            
+        Returns:
+            Recording summaries ordered by created_at DESC, recording_id DESC
+        """
+        stmt = (
+            select(
+                Recording.recording_id,
+                Recording.question_id,
+                Question.title,
+                AnalysisResult.status,
+                AnalysisResult.total_score,
+                AnalysisResult.level,
+                Recording.created_at,
+            )
+            .join(Question, Question.question_id == Recording.question_id)
+            .outerjoin(AnalysisResult, AnalysisResult.recording_id == Recording.recording_id)
+            .where(Recording.user_id == UUID(user_id))
+            .order_by(Recording.created_at.desc(), Recording.recording_id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Recording.created_at, Recording.recording_id) < tuple_(*before))
+        
+        result = await db.execute(stmt)
+        return [RecordingSummary(*row) for row in result.all()]
+    
     @staticmethod
     async def get_by_user_id(db: AsyncSession, user_id: str) -> list[AnalysisResult]:
         """Get all analysis results for a user."""
@@ -123,10 +375,28 @@ class AnalysisResultRepository:
     
     @staticmethod
     async def update_completed(db: AsyncSession, analysis: AnalysisResult, report_json: dict) -> None:
-        """Update analysis result as completed with report."""
+        """Update analysis result as completed with report (rollups and the feedback search index too)."""
+        was_completed = analysis.status == "completed"
         analysis.status = "completed"
         analysis.report_json = report_json
+        scores = score_columns(report_json)
+        for column, value in scores.items():
+            setattr(analysis, column, value)
         await db.flush()
+        if analysis.user_id is not None:
+            await FeedbackSearchRepository.index_report(db, feedback_documents(
+                analysis.id, analysis.user_id, analysis.recording_id,
+                analysis.question_id, analysis.created_at, report_json
+            ))
+        if was_completed:
+            return
+        if analysis.user_id is not None:
+            attempt = _progress_attempt(
+                analysis.recording_id, analysis.question_id, analysis.created_at, scores
+            )
+            await UserProgressRepository.record_attempt(db, analysis.user_id, attempt)
+        if analysis.question_id is not None:
+            await QuestionScoreStatsRepository.record(db, analysis.question_id, scores)
     
     @staticmethod
     async def update_failed(db: AsyncSession, analysis: AnalysisResult, error_message: str) -> None:
@@ -135,6 +405,188 @@ class AnalysisResultRepository:
         analysis.error_message = error_message
         await db.flush()
     
+    @staticmethod
+    async def mark_completed(db: AsyncSession, analysis_id: int, report_json: dict) -> bool:
+        """
+        Mark an analysis result completed with a targeted UPDATE (no prior SELECT).
+        
+        The owner's progress rollup and feedback search index, and the
+        question's score histograms, are updated in the same transaction.
+        
+        Returns:
+            False if the analysis was already completed (nothing recorded)
+        """
+        scores = score_columns(report_json)
+        result = await db.execute(
+            update(AnalysisResult)
+            .where(AnalysisResult.id == analysis_id, AnalysisResult.status != "completed")
+            .values(status="completed", report_json=report_json, **scores)
+            .returning(
+                AnalysisResult.user_id,
+                AnalysisResult.recording_id,
+                AnalysisResult.question_id,
+                AnalysisResult.created_at,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return False
+        if row.user_id is not None:
+            attempt = _progress_attempt(row.recording_id, row.question_id, row.created_at, scores)
+            await UserProgressRepository.record_attempt(db, row.user_id, attempt)
+            await FeedbackSearchRepository.index_report(db, feedback_documents(
+                analysis_id, row.user_id, row.recording_id, row.question_id, row.created_at, report_json
+            ))
+        if row.question_id is not None:
+            await QuestionScoreStatsRepository.record(db, row.question_id, scores)
+        return True
+    
+    @staticmethod
+    async def rebuild_user_progress(db: AsyncSession, user_id: UUID) -> UserProgress:
+        """
+        Recompute a user's progress rollup from their completed analyses.
+        
+        Reads only the score columns (run backfill_score_columns.py first
+        for analyses completed before they existed).
+        """
+        result = await db.execute(
+            select(
+                AnalysisResult.recording_id,
+                AnalysisResult.question_id,
+                AnalysisResult.created_at,
+                AnalysisResult.total_score,
+                AnalysisResult.delivery,
+                AnalysisResult.language_use,
+                AnalysisResult.topic_development,
+            )
+            .where(AnalysisResult.user_id == user_id, AnalysisResult.status == "completed")
+            .order_by(AnalysisResult.created_at, AnalysisResult.id)
+        )
+        attempts = [
+            ProgressAttempt(
+                recording_id=row.recording_id,
+                question_id=row.question_id,
+                total_score=row.total_score,
+                delivery=row.delivery,
+                language_use=row.language_use,
+                topic_development=row.topic_development,
+                created_at=row.created_at,
+            )
+            for row in result.all()
+        ]
+        return await UserProgressRepository.rebuild(db, user_id, attempts)
+    
+    @staticmethod
+    async def rebuild_question_score_stats(db: AsyncSession) -> int:
+        """
+        Recompute every question's score histograms from completed analyses.
+        
+        Groups by distinct score value in SQL, so only a few rows per
+        question are read. Like rebuild_user_progress, relies on the score
+        columns being populated.
+        
+        Returns:
+            Number of questions rebuilt
+        """
+        result = await db.execute(
+            select(AnalysisResult.question_id, func.count())
+            .where(AnalysisResult.status == "completed", AnalysisResult.question_id.is_not(None))
+            .group_by(AnalysisResult.question_id)
+        )
+        attempt_counts = dict(result.all())
+        histograms = {
+            question_id: {d: [0] * spec.bins for d, spec in HISTOGRAM_SPECS.items()}
+            for question_id in attempt_counts
+        }
+        
+        for dimension, spec in HISTOGRAM_SPECS.items():
+            column = getattr(AnalysisResult, dimension)
+            result = await db.execute(
+                select(AnalysisResult.question_id, column, func.count())
+                .where(
+                    AnalysisResult.status == "completed",
+                    AnalysisResult.question_id.is_not(None),
+                    column.is_not(None),
+                )
+                .group_by(AnalysisResult.question_id, column)
+            )
+            for question_id, value, count in result.all():
+                histograms[question_id][dimension][spec.bin_of(value)] += count
+        
+        distributions = [
+            ScoreDistribution(
+                question_id=question_id,
+                attempt_count=attempt_count,
+                histograms={d: tuple(counts) for d, counts in histograms[question_id].items()},
+            )
+            for question_id, attempt_count in attempt_counts.items()
+        ]
+        await QuestionScoreStatsRepository.rebuild(db, distributions)
+        return len(distributions)
+    
+    @staticmethod
+    async def get_user_ids_with_completed(db: AsyncSession) -> list[UUID]:
+        """Get every user that has at least one completed analysis."""
+        result = await db.execute(
+            select(AnalysisResult.user_id)
+            .where(AnalysisResult.status == "completed", AnalysisResult.user_id.is_not(None))
+            .distinct()
+        )
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def backfill_score_columns(db: AsyncSession, batch_size: int = 500) -> int:
+        """
+        Populate score columns for one batch of completed analyses that lack them.
+        
+        Extraction runs in SQL (JSONB path operators), so documents never
+        leave the database. Call repeatedly, committing between batches,
+        until it returns 0.
+        
+        Args:
+            db: Database session
+            batch_size: Maximum rows updated per call
+            
+        Returns:
+            Number of rows updated
+        """
+        batch = (
+            select(AnalysisResult.id)
+            .where(
+                AnalysisResult.status == "completed",
+                AnalysisResult.analysis_version.is_(None),
+                AnalysisResult.report_json.is_not(None),
+            )
+            .order_by(AnalysisResult.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        report = AnalysisResult.report_json
+        result = await db.execute(
+            update(AnalysisResult)
+            .where(AnalysisResult.id.in_(batch))
+            .values(
+                total_score=report[("global_evaluation", "total_score")].as_float().cast(SmallInteger),
+                delivery=report[("global_evaluation", "score_breakdown", "delivery")].as_float(),
+                language_use=report[("global_evaluation", "score_breakdown", "language_use")].as_float(),
+                topic_development=report[("global_evaluation", "score_breakdown", "topic_development")].as_float(),
+                level=report[("global_evaluation", "level")].as_string(),
+                # Pre-v2 reports have no version field; mark them so they are not revisited
+                analysis_version=func.coalesce(report[("analysis_version",)].as_string(), "1.0"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    @staticmethod
+    async def mark_failed(db: AsyncSession, analysis_id: int, error_message: str) -> None:
+        """Mark an analysis result failed with a targeted UPDATE (no prior SELECT)."""
+        await db.execute(
+            update(AnalysisResult)
+            .where(AnalysisResult.id == analysis_id)
+            .values(status="failed", error_message=error_message)
+        )
+    
     @staticmethod
     async def delete(db: AsyncSession, analysis: AnalysisResult) -> None:
         """Delete an analysis result."""
@@ -0,0 +1,125 @@
+"""Persisted progress events of analysis pipeline runs (GET /analysis/{id}/events replay)."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import Integer, DateTime, ForeignKey, JSON, select, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base
+from app.models.analysis import AnalysisResult
+from app.models.recording import Recording
+
+
+class AnalysisEvent(Base):
+    """One SSE event of an analysis run, keyed by its SSE event ID."""
+
+    __tablename__ = "analysis_events"
+
+    analysis_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("analysis_results.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    event_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # SSEEvent.model_dump() of the event
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AnalysisEvent {self.analysis_id}/{self.event_id}>"
+
+
+@dataclass
+class AnalysisOutcome:
+    """What a finished analysis's terminal event is rebuilt from."""
+    status: str
+    error_message: str | None
+    recording_id: str
+    audio_key: str  # Storage key of the recording's MP3
+    report: dict | None
+
+
+class AnalysisEventRepository:
+    """Repository for the analysis event log."""
+
+    @staticmethod
+    async def append(db: AsyncSession, analysis_id: int, events: list[tuple[int, dict]]) -> None:
+        """
+        Store events of a run (already stored IDs are skipped).
+
+        Args:
+            db: Database session
+            analysis_id: Analysis the events belong to
+            events: (event ID, payload) pairs
+        """
+        if not events:
+            return
+        await db.execute(
+            pg_insert(AnalysisEvent)
+            .values([
+                {"analysis_id": analysis_id, "event_id": event_id, "payload": payload}
+                for event_id, payload in events
+            ])
+            .on_conflict_do_nothing(index_elements=["analysis_id", "event_id"])
+        )
+
+    @staticmethod
+    async def list_after(db: AsyncSession, analysis_id: int, after: int) -> list[tuple[int, dict]]:
+        """Get the (event ID, payload) pairs of an analysis after an event ID, in order."""
+        result = await db.execute(
+            select(AnalysisEvent.event_id, AnalysisEvent.payload)
+            .where(AnalysisEvent.analysis_id == analysis_id, AnalysisEvent.event_id > after)
+            .order_by(AnalysisEvent.event_id)
+        )
+        return [(row.event_id, row.payload) for row in result.all()]
+
+    @staticmethod
+    async def delete_for_analysis(db: AsyncSession, analysis_id: int) -> None:
+        """Drop the logged events of an analysis."""
+        await db.execute(delete(AnalysisEvent).where(AnalysisEvent.analysis_id == analysis_id))
+
+    @staticmethod
+    async def get_owner_and_status(db: AsyncSession, analysis_id: int) -> tuple[UUID | None, str] | None:
+        """Get (user_id, status) of an analysis without loading its report, or None if missing."""
+        result = await db.execute(
+            select(AnalysisResult.user_id, AnalysisResult.status).where(AnalysisResult.id == analysis_id)
+        )
+        row = result.one_or_none()
+        return (row.user_id, row.status) if row else None
+
+    @staticmethod
+    async def get_last_event_time(db: AsyncSession, analysis_id: int) -> datetime | None:
+        """Get when the last event of an analysis was logged, or None if none is logged."""
+        return await db.scalar(
+            select(func.max(AnalysisEvent.created_at)).where(AnalysisEvent.analysis_id == analysis_id)
+        )
+
+    @staticmethod
+    async def get_outcome(db: AsyncSession, analysis_id: int) -> AnalysisOutcome | None:
+        """Get the status, report and recording of an analysis, or None if missing."""
+        result = await db.execute(
+            select(
+                AnalysisResult.status,
+                AnalysisResult.error_message,
+                Recording.recording_id,
+                Recording.audio_url,
+                AnalysisResult.report_json
+            )
+            .join(Recording, Recording.recording_id == AnalysisResult.recording_id)
+            .where(AnalysisResult.id == analysis_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return AnalysisOutcome(
+            status=row.status,
+            error_message=row.error_message,
+            recording_id=row.recording_id,
+            audio_key=row.audio_url,
+            report=row.report_json
+        )
@@ -0,0 +1,201 @@
+"""Cohort models, dashboard views and repository."""
+
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import (
+    BigInteger, Column, DateTime, ForeignKey, MetaData, REAL, SmallInteger, String, Table,
+    select, text
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base
+
+
+class Cohort(Base):
+    """A class of students owned by a teacher."""
+
+    __tablename__ = "cohorts"
+
+    cohort_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    teacher_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<Cohort {self.cohort_id}>"
+
+
+class CohortMember(Base):
+    """Membership of a student in a cohort."""
+
+    __tablename__ = "cohort_members"
+
+    cohort_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("cohorts.cohort_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, index=True)
+    joined_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+
+# Materialized views (created by migration 20251231000001_add_cohort_stats).
+# Kept out of Base.metadata so init_db() never tries to create them as tables.
+view_metadata = MetaData()
+
+
+def _score_columns() -> list[Column]:
+    return [
+        Column("avg_total_score", REAL),
+        Column("avg_delivery", REAL),
+        Column("avg_language_use", REAL),
+        Column("avg_topic_development", REAL),
+        Column("last_attempt_at", DateTime),
+    ]
+
+
+cohort_summary_view = Table(
+    "mv_cohort_summary",
+    view_metadata,
+    Column("cohort_id", String(50), primary_key=True),
+    Column("member_count", BigInteger),
+    Column("active_student_count", BigInteger),
+    Column("completed_count", BigInteger),
+    *_score_columns(),
+)
+
+cohort_question_stats_view = Table(
+    "mv_cohort_question_stats",
+    view_metadata,
+    Column("cohort_id", String(50), primary_key=True),
+    Column("question_id", String(50), primary_key=True),
+    Column("attempt_count", BigInteger),
+    Column("student_count", BigInteger),
+    *_score_columns(),
+)
+
+cohort_score_histogram_view = Table(
+    "mv_cohort_score_histogram",
+    view_metadata,
+    Column("cohort_id", String(50), primary_key=True),
+    Column("question_id", String(50), primary_key=True),
+    Column("total_score", SmallInteger, primary_key=True),
+    Column("attempt_count", BigInteger),
+)
+
+# Refresh order does not matter; each view reads only base tables
+COHORT_STATS_VIEWS = [
+    cohort_summary_view.name,
+    cohort_question_stats_view.name,
+    cohort_score_histogram_view.name,
+]
+
+
+class CohortRepository:
+    """Repository for cohorts and their dashboard views."""
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, cohort_id: str) -> Cohort | None:
+        """Get a cohort by ID."""
+        result = await db.execute(
+            select(Cohort).where(Cohort.cohort_id == cohort_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def list_summaries(
+        db: AsyncSession,
+        teacher_id: str,
+        limit: int,
+        after: str | None = None
+    ) -> list:
+        """
+        Get a page of a teacher's cohorts with their summary stats.
+
+        Returns:
+            Rows with Cohort columns plus mv_cohort_summary columns (None
+            before the first refresh), ordered by cohort_id
+        """
+        view = cohort_summary_view
+        stmt = (
+            select(
+                Cohort.cohort_id,
+                Cohort.name,
+                view.c.member_count,
+                view.c.active_student_count,
+                view.c.completed_count,
+                view.c.avg_total_score,
+                view.c.avg_delivery,
+                view.c.avg_language_use,
+                view.c.avg_topic_development,
+                view.c.last_attempt_at,
+            )
+            .outerjoin(view, view.c.cohort_id == Cohort.cohort_id)
+            .where(Cohort.teacher_id == UUID(teacher_id))
+            .order_by(Cohort.cohort_id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(Cohort.cohort_id > after)
+        result = await db.execute(stmt)
+        return list(result.all())
+
+    @staticmethod
+    async def list_question_stats(
+        db: AsyncSession,
+        cohort_id: str,
+        limit: int,
+        after: str | None = None
+    ) -> list:
+        """Get a page of per-question stats for a cohort, ordered by question_id."""
+        view = cohort_question_stats_view
+        stmt = (
+            select(view)
+            .where(view.c.cohort_id == cohort_id)
+            .order_by(view.c.question_id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(view.c.question_id > after)
+        result = await db.execute(stmt)
+        return list(result.all())
+
+    @staticmethod
+    async def get_score_histogram(db: AsyncSession, cohort_id: str, question_id: str) -> dict[int, int]:
+        """Get the total-score distribution of a cohort on a question (score -> attempts)."""
+        view = cohort_score_histogram_view
+        result = await db.execute(
+            select(view.c.total_score, view.c.attempt_count)
+            .where(view.c.cohort_id == cohort_id, view.c.question_id == question_id)
+        )
+        return {score: count for score, count in result.all()}
+
+    @staticmethod
+    async def refresh_views(db: AsyncSession) -> bool:
+        """
+        Refresh all cohort views concurrently (readers are never blocked).
+
+        Guarded by a transaction-level advisory lock so only one worker
+        refreshes at a time.
+
+        Returns:
+            False if another worker is already refreshing
+        """
+        locked = await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(hashtext('cohort_stats_refresh'))")
+        )
+        if not locked:
+            return False
+        for view_name in COHORT_STATS_VIEWS:
+            await db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+        return True
@@ -0,0 +1,249 @@
+"""Full-text search index over analysis feedback."""
+
+import html
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import (
+    Integer, String, Text, DateTime, ForeignKey, Index, Computed,
+    delete, insert, select, func, literal, literal_column, tuple_
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base
+
+# Text search configuration for documents and queries. Feedback is mostly
+# Chinese, which no built-in parser segments, so every CJK character is
+# spaced out into its own token before parsing, in the stored vector
+# and in queries alike.
+SEARCH_CONFIG = "english"
+CJK_CHARS = "\u3400-\u9fff\uf900-\ufaff"
+_CJK_PATTERN = f"([{CJK_CHARS}])"
+
+# ts_headline match markers (private-use characters, swapped for <mark> after escaping)
+_MARK_START = "\ue000"
+_MARK_STOP = "\ue001"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_MARK_START}, StopSel={_MARK_STOP}, "
+    'MaxFragments=2, MaxWords=30, MinWords=12, FragmentDelimiter=" … "'
+)
+_UNSEGMENT_RE = re.compile(f" ?({_MARK_START}?[{CJK_CHARS}]{_MARK_STOP}?) ?")
+_CJK_RUN_RE = re.compile(f"[{CJK_CHARS}]+")
+
+# Searchable fields and their tsvector weights (A ranks highest)
+_WEIGHTED_FIELDS = (
+    ("weaknesses", "A"),
+    ("overview", "B"),
+    ("corrected_text", "C"),
+    ("transcript", "D"),
+)
+
+
+def _segment_cjk_sql(column: str) -> str:
+    return f"regexp_replace(coalesce({column}, ''), '{_CJK_PATTERN}', ' \\1 ', 'g')"
+
+
+def _search_vector_sql() -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', {_segment_cjk_sql(column)}), '{weight}')"
+        for column, weight in _WEIGHTED_FIELDS
+    )
+
+
+# Inlined rather than bound, so the driver never has to send a regconfig parameter
+_SEARCH_CONFIG_SQL = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+
+def _segment_cjk(expr):
+    """Space out CJK characters in a SQL text expression (same rule as the stored vector)."""
+    return func.regexp_replace(expr, _CJK_PATTERN, r" \1 ", "g")
+
+
+class FeedbackDocument(Base):
+    """One report chunk's feedback and transcript, indexed for search."""
+
+    __tablename__ = "feedback_documents"
+
+    analysis_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("analysis_results.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    chunk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Denormalized from the analysis so searches never join
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
+    recording_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    question_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    chunk_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    weaknesses: Mapped[str | None] = mapped_column(Text, nullable=True)
+    overview: Mapped[str | None] = mapped_column(Text, nullable=True)
+    corrected_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    transcript: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(_search_vector_sql(), persisted=True)
+    )
+
+    __table_args__ = (
+        Index("idx_feedback_documents_search", "search_vector", postgresql_using="gin"),
+        Index("idx_feedback_documents_user_recent", "user_id", "created_at", "analysis_id", "chunk_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FeedbackDocument {self.analysis_id}/{self.chunk_id}>"
+
+
+@dataclass
+class FeedbackSearchHit:
+    """One matching chunk with a highlighted snippet."""
+    analysis_id: int
+    chunk_id: int
+    recording_id: str
+    question_id: str | None
+    chunk_type: str | None
+    created_at: datetime
+    snippet: str  # HTML-escaped, matches wrapped in <mark>
+
+
+def _search_query(query: str):
+    """
+    Parse a user query (web search syntax: "phrases", OR, -excluded).
+
+    Runs of CJK characters are quoted so they match as phrases rather
+    than as independent characters.
+    """
+    query = _CJK_RUN_RE.sub(lambda m: f'"{m.group(0)}"', query)
+    return func.websearch_to_tsquery(_SEARCH_CONFIG_SQL, _segment_cjk(literal(query)))
+
+
+def _render_snippet(headline: str) -> str:
+    """Undo CJK segmentation, escape, then turn match markers into <mark> tags."""
+    text = _UNSEGMENT_RE.sub(r"\1", headline).strip()
+    return html.escape(text).replace(_MARK_START, "<mark>").replace(_MARK_STOP, "</mark>")
+
+
+def feedback_documents(
+    analysis_id: int,
+    user_id: UUID,
+    recording_id: str,
+    question_id: str | None,
+    created_at: datetime,
+    report_json: dict
+) -> list[dict]:
+    """Build the search rows for a completed report (one per chunk)."""
+    rows = []
+    for chunk in report_json.get("chunks") or []:
+        feedback = chunk.get("feedback_structured") or {}
+        rows.append({
+            "analysis_id": analysis_id,
+            "chunk_id": chunk.get("chunk_id", len(rows)),
+            "user_id": user_id,
+            "recording_id": recording_id,
+            "question_id": question_id,
+            "chunk_type": chunk.get("chunk_type"),
+            "created_at": created_at,
+            "weaknesses": "\n".join(feedback.get("weaknesses") or []),
+            "overview": feedback.get("overview"),
+            "corrected_text": feedback.get("corrected_text"),
+            "transcript": chunk.get("text"),
+        })
+    return rows
+
+
+class FeedbackSearchRepository:
+    """Repository for the feedback search index."""
+
+    @staticmethod
+    async def index_report(db: AsyncSession, rows: list[dict]) -> None:
+        """
+        Replace the indexed chunks of an analysis.
+
+        Must run in the same transaction that marks the analysis completed.
+
+        Args:
+            db: Database session
+            rows: feedback_documents() of one analysis
+        """
+        if not rows:
+            return
+        await db.execute(
+            delete(FeedbackDocument).where(FeedbackDocument.analysis_id == rows[0]["analysis_id"])
+        )
+        await db.execute(insert(FeedbackDocument), rows)
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        limit: int,
+        before: tuple[datetime, int, int] | None = None
+    ) -> list[FeedbackSearchHit]:
+        """
+        Search a user's feedback, newest first.
+
+        Matching uses the GIN index; snippets are generated only for the
+        returned page.
+
+        Args:
+            db: Database session
+            user_id: Owner of the feedback
+            query: Search text (web search syntax)
+            limit: Maximum number of hits
+            before: Keyset cursor (created_at, analysis_id, chunk_id) of the
+                last hit on the previous page
+
+        Returns:
+            Hits ordered by (created_at, analysis_id, chunk_id) descending
+        """
+        tsquery = _search_query(query)
+        sort_key = (FeedbackDocument.created_at, FeedbackDocument.analysis_id, FeedbackDocument.chunk_id)
+        page = (
+            select(FeedbackDocument)
+            .where(
+                FeedbackDocument.user_id == UUID(user_id),
+                FeedbackDocument.search_vector.bool_op("@@")(tsquery),
+            )
+            .order_by(*(column.desc() for column in sort_key))
+            .limit(limit)
+        )
+        if before is not None:
+            page = page.where(tuple_(*sort_key) < tuple_(*before))
+        page = page.subquery()
+
+        document = func.concat_ws(
+            "\n", page.c.weaknesses, page.c.overview, page.c.corrected_text, page.c.transcript
+        )
+        result = await db.execute(
+            select(
+                page.c.analysis_id,
+                page.c.chunk_id,
+                page.c.recording_id,
+                page.c.question_id,
+                page.c.chunk_type,
+                page.c.created_at,
+                func.ts_headline(
+                    _SEARCH_CONFIG_SQL, _segment_cjk(document), tsquery, _HEADLINE_OPTIONS
+                ).label("headline"),
+            )
+            .order_by(page.c.created_at.desc(), page.c.analysis_id.desc(), page.c.chunk_id.desc())
+        )
+        return [
+            FeedbackSearchHit(
+                analysis_id=row.analysis_id,
+                chunk_id=row.chunk_id,
+                recording_id=row.recording_id,
+                question_id=row.question_id,
+                chunk_type=row.chunk_type,
+                created_at=row.created_at,
+                snippet=_render_snippet(row.headline),
+            )
+            for row in result.all()
+        ]
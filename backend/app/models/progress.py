@@ -0,0 +1,182 @@
+"""User progress rollup model and repository."""
+
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import Integer, SmallInteger, Float, DateTime, JSON, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert as pg_insert
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import Base
+
+# Score dimensions tracked by the rollup (column names on analysis_results)
+SCORE_DIMENSIONS = ("total_score", "delivery", "language_use", "topic_development")
+
+
+@dataclass
+class ProgressAttempt:
+    """One completed analysis as recorded in the rollup."""
+    recording_id: str
+    question_id: str | None
+    total_score: int | None
+    delivery: float | None
+    language_use: float | None
+    topic_development: float | None
+    created_at: datetime
+
+    def to_json(self) -> dict:
+        """Serialize for the recent_attempts JSON column."""
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return data
+
+
+class UserProgress(Base):
+    """Per-user rollup of completed analyses, maintained incrementally."""
+
+    __tablename__ = "user_progress"
+
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+
+    attempt_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Running sums per dimension (averages = sum / count of scored attempts)
+    score_sums: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    score_counts: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+
+    best_total_score: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+
+    # Last PROGRESS_HISTORY_SIZE attempts, newest first
+    recent_attempts: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+
+    # question_id -> {"total_score": int, "recording_id": str}
+    question_bests: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+
+    last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserProgress {self.user_id} attempts={self.attempt_count}>"
+
+    def average(self, dimension: str) -> float | None:
+        """All-time average of a score dimension."""
+        count = self.score_counts.get(dimension)
+        return self.score_sums[dimension] / count if count else None
+
+    def recent_average(self, dimension: str) -> float | None:
+        """Average of a score dimension over recent_attempts."""
+        values = [a[dimension] for a in self.recent_attempts if a.get(dimension) is not None]
+        return sum(values) / len(values) if values else None
+
+    def add_attempt(self, attempt: ProgressAttempt) -> None:
+        """Fold one attempt into the rollup (assigns new containers so JSON changes are tracked)."""
+        score_sums = dict(self.score_sums or {})
+        score_counts = dict(self.score_counts or {})
+        for dimension in SCORE_DIMENSIONS:
+            value = getattr(attempt, dimension)
+            if value is not None:
+                score_sums[dimension] = score_sums.get(dimension, 0) + value
+                score_counts[dimension] = score_counts.get(dimension, 0) + 1
+        self.score_sums = score_sums
+        self.score_counts = score_counts
+        self.attempt_count = (self.attempt_count or 0) + 1
+
+        if attempt.total_score is not None:
+            if self.best_total_score is None or attempt.total_score > self.best_total_score:
+                self.best_total_score = attempt.total_score
+
+            if attempt.question_id is not None:
+                best = (self.question_bests or {}).get(attempt.question_id)
+                if best is None or attempt.total_score > best["total_score"]:
+                    self.question_bests = {
+                        **(self.question_bests or {}),
+                        attempt.question_id: {
+                            "total_score": attempt.total_score,
+                            "recording_id": attempt.recording_id,
+                        },
+                    }
+
+        recent = [attempt.to_json(), *(self.recent_attempts or [])]
+        recent.sort(key=lambda a: a["created_at"], reverse=True)
+        self.recent_attempts = recent[:settings.PROGRESS_HISTORY_SIZE]
+
+        if self.last_attempt_at is None or attempt.created_at > self.last_attempt_at:
+            self.last_attempt_at = attempt.created_at
+        self.updated_at = datetime.utcnow()
+
+
+class UserProgressRepository:
+    """Repository for UserProgress rollup operations."""
+
+    @staticmethod
+    async def get(db: AsyncSession, user_id: str) -> UserProgress | None:
+        """Get a user's progress rollup."""
+        result = await db.execute(
+            select(UserProgress).where(UserProgress.user_id == UUID(user_id))
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def _lock(db: AsyncSession, user_id: UUID) -> UserProgress:
+        """Get a user's rollup row, creating it if needed, locked until commit."""
+        await db.execute(
+            pg_insert(UserProgress)
+            .values(
+                user_id=user_id,
+                attempt_count=0,
+                score_sums={},
+                score_counts={},
+                recent_attempts=[],
+                question_bests={},
+                updated_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=[UserProgress.user_id])
+        )
+        result = await db.execute(
+            select(UserProgress)
+            .where(UserProgress.user_id == user_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    async def record_attempt(db: AsyncSession, user_id: UUID, attempt: ProgressAttempt) -> None:
+        """
+        Add a completed attempt to the user's rollup.
+
+        Must run in the same transaction that marks the analysis completed.
+        The row lock serializes concurrent completions for the same user.
+        """
+        progress = await UserProgressRepository._lock(db, user_id)
+        progress.add_attempt(attempt)
+        await db.flush()
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, user_id: UUID, attempts: list[ProgressAttempt]) -> UserProgress:
+        """
+        Replace a user's rollup with one computed from all their attempts.
+
+        Args:
+            db: Database session
+            user_id: User whose rollup to rebuild
+            attempts: Every completed attempt of the user, oldest first
+        """
+        progress = await UserProgressRepository._lock(db, user_id)
+        progress.attempt_count = 0
+        progress.score_sums = {}
+        progress.score_counts = {}
+        progress.best_total_score = None
+        progress.recent_attempts = []
+        progress.question_bests = {}
+        progress.last_attempt_at = None
+        for attempt in attempts:
+            progress.add_attempt(attempt)
+        await db.flush()
+        return progress
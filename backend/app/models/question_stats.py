@@ -0,0 +1,215 @@
+"""Per-question score histogram model and repository."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base
+
+
+@dataclass(frozen=True)
+class HistogramSpec:
+    """Fixed bins for one score dimension: bin i covers minimum + i * width."""
+    minimum: float
+    width: float
+    bins: int
+
+    def bin_of(self, value: float | None) -> int | None:
+        """Index of the bin holding a score (None for missing scores)."""
+        if value is None:
+            return None
+        index = round((value - self.minimum) / self.width)
+        return min(max(index, 0), self.bins - 1)
+
+
+# total_score is 0-30 in whole points; sub-scores are 0-4 in tenths
+HISTOGRAM_SPECS: dict[str, HistogramSpec] = {
+    "total_score": HistogramSpec(minimum=0, width=1, bins=31),
+    "delivery": HistogramSpec(minimum=0, width=0.1, bins=41),
+    "language_use": HistogramSpec(minimum=0, width=0.1, bins=41),
+    "topic_development": HistogramSpec(minimum=0, width=0.1, bins=41),
+}
+
+
+def _histogram_column() -> Mapped[list[int]]:
+    # zero_indexes: Python bin i is Postgres array element i + 1
+    return mapped_column(ARRAY(Integer, zero_indexes=True), nullable=False)
+
+
+class QuestionScoreStats(Base):
+    """Score distribution of all completed attempts at a question."""
+
+    __tablename__ = "question_score_stats"
+
+    question_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("questions.question_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    attempt_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Attempt counts per bin, laid out by HISTOGRAM_SPECS
+    total_score_hist: Mapped[list[int]] = _histogram_column()
+    delivery_hist: Mapped[list[int]] = _histogram_column()
+    language_use_hist: Mapped[list[int]] = _histogram_column()
+    topic_development_hist: Mapped[list[int]] = _histogram_column()
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<QuestionScoreStats {self.question_id} attempts={self.attempt_count}>"
+
+
+def _empty_histograms() -> dict[str, list[int]]:
+    return {f"{dimension}_hist": [0] * spec.bins for dimension, spec in HISTOGRAM_SPECS.items()}
+
+
+@dataclass(frozen=True)
+class ScoreDistribution:
+    """Immutable copy of a question's histograms."""
+    question_id: str
+    attempt_count: int
+    histograms: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def from_row(cls, row: QuestionScoreStats) -> "ScoreDistribution":
+        return cls(
+            question_id=row.question_id,
+            attempt_count=row.attempt_count,
+            histograms={
+                dimension: tuple(getattr(row, f"{dimension}_hist"))
+                for dimension in HISTOGRAM_SPECS
+            },
+        )
+
+    @classmethod
+    def empty(cls, question_id: str) -> "ScoreDistribution":
+        return cls(
+            question_id=question_id,
+            attempt_count=0,
+            histograms={d: (0,) * spec.bins for d, spec in HISTOGRAM_SPECS.items()},
+        )
+
+    def with_attempt(self, scores: dict) -> "ScoreDistribution":
+        """Copy with one more attempt added (mirrors QuestionScoreStatsRepository.record)."""
+        histograms = dict(self.histograms)
+        for dimension, spec in HISTOGRAM_SPECS.items():
+            index = spec.bin_of(scores.get(dimension))
+            if index is not None:
+                counts = list(histograms[dimension])
+                counts[index] += 1
+                histograms[dimension] = tuple(counts)
+        return ScoreDistribution(self.question_id, self.attempt_count + 1, histograms)
+
+    def percentile(self, dimension: str, value: float | None) -> float | None:
+        """
+        Percentile rank of a score among the recorded attempts.
+
+        Attempts in the same bin count as half below, so the rank of a
+        score shared by everyone is 50.
+
+        Returns:
+            0-100, or None if the score or the distribution is empty
+        """
+        index = HISTOGRAM_SPECS[dimension].bin_of(value)
+        counts = self.histograms[dimension]
+        total = sum(counts)
+        if index is None or total == 0:
+            return None
+        below = sum(counts[:index])
+        return round(100 * (below + 0.5 * counts[index]) / total, 1)
+
+    def percentiles(self, scores: dict) -> dict[str, float]:
+        """Percentile rank of every present score dimension."""
+        ranks = {d: self.percentile(d, scores.get(d)) for d in HISTOGRAM_SPECS}
+        return {d: rank for d, rank in ranks.items() if rank is not None}
+
+
+class QuestionScoreStatsRepository:
+    """Repository for per-question score histograms."""
+
+    @staticmethod
+    async def get(db: AsyncSession, question_id: str) -> ScoreDistribution | None:
+        """Get a question's score distribution (None if it has no recorded attempts)."""
+        result = await db.execute(
+            select(QuestionScoreStats).where(QuestionScoreStats.question_id == question_id)
+        )
+        row = result.scalar_one_or_none()
+        return ScoreDistribution.from_row(row) if row else None
+
+    @staticmethod
+    async def record(db: AsyncSession, question_id: str, scores: dict) -> None:
+        """
+        Add one completed attempt to a question's histograms.
+
+        Increments a single element of each array in place, so the cost
+        does not grow with the number of attempts. Must run in the same
+        transaction that marks the analysis completed.
+
+        Args:
+            db: Database session
+            question_id: Question answered
+            scores: score_columns() of the completed report
+        """
+        await db.execute(
+            pg_insert(QuestionScoreStats)
+            .values(
+                question_id=question_id,
+                attempt_count=0,
+                updated_at=datetime.utcnow(),
+                **_empty_histograms(),
+            )
+            .on_conflict_do_nothing(index_elements=[QuestionScoreStats.question_id])
+        )
+        values = {
+            QuestionScoreStats.attempt_count: QuestionScoreStats.attempt_count + 1,
+            QuestionScoreStats.updated_at: datetime.utcnow(),
+        }
+        for dimension, spec in HISTOGRAM_SPECS.items():
+            index = spec.bin_of(scores.get(dimension))
+            if index is not None:
+                column = getattr(QuestionScoreStats, f"{dimension}_hist")
+                values[column[index]] = column[index] + 1
+        await db.execute(
+            update(QuestionScoreStats)
+            .where(QuestionScoreStats.question_id == question_id)
+            .values(values)
+        )
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, distributions: list[ScoreDistribution]) -> None:
+        """
+        Replace the histograms of the given questions.
+
+        Args:
+            db: Database session
+            distributions: Distributions recomputed from analysis_results
+        """
+        for distribution in distributions:
+            histograms = {
+                f"{dimension}_hist": list(counts)
+                for dimension, counts in distribution.histograms.items()
+            }
+            stmt = pg_insert(QuestionScoreStats).values(
+                question_id=distribution.question_id,
+                attempt_count=distribution.attempt_count,
+                updated_at=datetime.utcnow(),
+                **histograms,
+            )
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[QuestionScoreStats.question_id],
+                    set_={
+                        "attempt_count": stmt.excluded.attempt_count,
+                        "updated_at": stmt.excluded.updated_at,
+                        **{column: stmt.excluded[column] for column in histograms},
+                    },
+                )
+            )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 from ulid import ULID
-from sqlalchemy import String, DateTime, ForeignKey, select
+from sqlalchemy import String, DateTime, ForeignKey, Index, select
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,6 +52,16 @@ class Recording(Base):
         nullable=False
     )
     
+    __table_args__ = (
+        # Keyset pagination of a user's history (GET /me/recordings)
+        Index(
+            "idx_recordings_user_history",
+            "user_id",
+            created_at.desc(),
+            recording_id.desc(),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Recording {self.recording_id}>"
 
@@ -76,7 +86,6 @@ class RecordingRepository:
         )
         db.add(recording)
         await db.flush()
-        await db.refresh(recording)
         return recording
     
     @staticmethod
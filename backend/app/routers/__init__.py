@@ -1,5 +1,5 @@
 """API routers."""
 
-from app.routers import questions, recordings, analysis
+from app.routers import questions, recordings, analysis, storage, me, cohorts
 
-__all__ = ["questions", "recordings", "analysis"]
+__all__ = ["questions", "recordings", "analysis", "storage", "me", "cohorts"]
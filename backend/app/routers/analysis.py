@@ -1,26 +1,118 @@
 """Analysis API endpoints."""
 
-import asyncio
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+import re
+from datetime import timedelta
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile, File, Form, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from ulid import ULID
 
-from app.database import get_db
-from app.models import AnalysisResult
-from app.schemas import AnalysisResponse
-from app.services.analysis_service import run_streaming_analysis, AudioFile
+from app.database import get_db, get_read_db, session_scope
+from app.models import AnalysisResult, AnalysisEventRepository, QuestionRepository, Recording
+from app.schemas import AnalysisResponse, UploadUrlRequest, UploadUrlResponse, SSEEvent, SSEErrorEvent
+from app.schemas.sse import SSE_HEARTBEAT
+from app.services.analysis_service import run_streaming_analysis, AudioFile, StoredAudio
+from app.services.analysis_events import analysis_event_bus, tail_persisted
+from app.services.storage_service import storage_service
+from app.utils.audio_upload import upload_file
+from app.config import settings
 from app.auth import get_current_user, AuthenticatedUser
 
 router = APIRouter(prefix="/analysis")
 
+# Content types accepted for direct uploads, with the extension stored in the object key
+UPLOAD_CONTENT_TYPES = {
+    "audio/webm": "webm",
+    "audio/mp4": "mp4",
+    "audio/ogg": "ogg",
+    "audio/wav": "wav",
+    "audio/mpeg": "mp3",
+}
+UPLOAD_URL_EXPIRES = timedelta(minutes=15)
+
+
+def _upload_object_key(user_id: str, question_id: str, recording_id: str, extension: str) -> str:
+    """
+    Build the storage key for a direct recording upload.
+    
+    Raw uploads live under uploads/, apart from the converted MP3 stored under
+    recordings/, so they never share a key (an MP3 upload would otherwise be
+    overwritten by its conversion); the pipeline deletes them once converted.
+    """
+    return f"uploads/{user_id}/{question_id}/{recording_id}.{extension}"
+
+
+def _parse_upload_object_key(object_key: str, user_id: str, question_id: str) -> str | None:
+    """Return the recording ID if object_key was issued to this user for this question."""
+    extensions = "|".join(re.escape(ext) for ext in UPLOAD_CONTENT_TYPES.values())
+    pattern = (
+        rf"uploads/{re.escape(user_id)}/{re.escape(question_id)}/"
+        rf"(recording_[0-9A-Z]{{26}})\.(?:{extensions})"
+    )
+    match = re.fullmatch(pattern, object_key)
+    return match.group(1) if match else None
+
+
+@router.post("/uploads", response_model=UploadUrlResponse)
+async def create_upload_url(
+    request: UploadUrlRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get a presigned URL for uploading a recording straight to storage.
+    
+    The client PUTs the audio to `upload_url`, then calls POST /analysis with
+    the returned `object_key` instead of the audio file, so the recording
+    never passes through the API server.
+    """
+    content_type = request.content_type.split(";", 1)[0].strip().lower()
+    extension = UPLOAD_CONTENT_TYPES.get(content_type)
+    if extension is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported content type: {request.content_type}"
+        )
+    
+    question = await QuestionRepository.get_by_id(db, request.question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Question {request.question_id} not found"
+        )
+    
+    recording_id = f"recording_{ULID()}"
+    object_key = _upload_object_key(current_user.user_id, request.question_id, recording_id, extension)
+    try:
+        upload_url = await storage_service.get_presigned_upload_url(
+            bucket=storage_service.bucket_recordings,
+            object_key=object_key,
+            content_type=content_type,
+            expires=UPLOAD_URL_EXPIRES
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    
+    return UploadUrlResponse(
+        recording_id=recording_id,
+        object_key=object_key,
+        upload_url=upload_url,
+        headers={"Content-Type": content_type},
+        expires_in=int(UPLOAD_URL_EXPIRES.total_seconds())
+    )
+
 
 @router.post("")
 async def create_analysis(
     question_id: str = Form(...),
-    audio: UploadFile = File(...),
-    current_user: AuthenticatedUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    audio: UploadFile | None = File(None),
+    object_key: str | None = Form(None),
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     """
     Submit audio for AI analysis with SSE progress events.
@@ -28,67 +120,149 @@ async def create_analysis(
     This endpoint combines audio upload and analysis into a single streaming response.
     The client receives real-time progress updates via Server-Sent Events (SSE).
     
-    SSE Event Format:
+    SSE Event Format (each event carries an `id:` line, numbered from 1):
     - Step progress: {"type": "uploading|transcribing|analyzing|generating", "status": "start|completed"}
     - Completion: {"type": "completed", "report": {...}}
     - Error: {"type": "error", "message": "...", "step": "..."}
+    - Heartbeat: `: keep-alive` comment lines while no event is pending
     
     Args:
         question_id: The question ID being answered
         audio: The audio file (WebM/MP4/OGG format from browser)
+        object_key: Key of audio already uploaded via POST /analysis/uploads (instead of audio)
         
     Returns:
         StreamingResponse with text/event-stream content type
     """
-    # Read audio data and create AudioFile object
-    audio_data = await audio.read()
-    audio_file = AudioFile(
-        data=audio_data,
-        filename=audio.filename or "audio.webm",
-        content_type=audio.content_type or "audio/webm"
+    if object_key is not None:
+        recording_id = _parse_upload_object_key(object_key, current_user.user_id, question_id)
+        if recording_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid object_key for this user and question"
+            )
+        # Checked here so a resubmission gets a 409 instead of a failed stream
+        async with session_scope() as db:
+            submitted = await db.scalar(
+                select(Recording.recording_id).where(Recording.recording_id == recording_id)
+            )
+        if submitted is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Recording {recording_id} was already submitted"
+            )
+        # Presigned PUTs cannot cap the object size, so check it before anything downloads it
+        size = await storage_service.get_object_size(storage_service.bucket_recordings, object_key)
+        if size is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Uploaded audio {object_key} not found"
+            )
+        if size > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Audio exceeds {settings.MAX_UPLOAD_BYTES} bytes"
+            )
+        extension = object_key.rsplit(".", 1)[-1]
+        audio_file = StoredAudio(
+            object_key=object_key,
+            recording_id=recording_id,
+            content_type=next(
+                content_type for content_type, ext in UPLOAD_CONTENT_TYPES.items() if ext == extension
+            )
+        )
+    elif audio is not None:
+        # The body limit includes the multipart overhead, so check the file itself as well
+        if audio.size is not None and audio.size > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Audio exceeds {settings.MAX_UPLOAD_BYTES} bytes"
+            )
+        # Hand over the spooled upload itself instead of reading it into a new bytes object
+        filename = audio.filename or "audio.webm"
+        audio_file = AudioFile(
+            file=upload_file(audio, filename),
+            filename=filename,
+            content_type=audio.content_type or "audio/webm"
+        )
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either audio or object_key is required"
+        )
+    
+    run = analysis_event_bus.start(
+        lambda publish: run_streaming_analysis(
+            audio_file, question_id, publish, user_id=current_user.user_id
+        ),
+        user_id=current_user.user_id
     )
+    return _event_stream_response(
+        run.subscribe(heartbeat_seconds=settings.SSE_HEARTBEAT_SECONDS)
+    )
+
+
+@router.get("/{analysis_id}/events")
+async def get_analysis_events(
+    analysis_id: int,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    Reattach to an analysis's progress stream after a dropped connection.
     
-    async def event_generator():
-        """Generate SSE events during analysis."""
-        # Queue to collect events from the analysis task
-        event_queue: asyncio.Queue[str] = asyncio.Queue()
-        
-        async def send_event(event: str):
-            """Callback to queue SSE events."""
-            await event_queue.put(event)
-        
-        # Start analysis task (with user_id for ownership)
-        analysis_task = asyncio.create_task(
-            run_streaming_analysis(db, audio_file, question_id, send_event, user_id=current_user.user_id)
+    Replays the events after `Last-Event-ID` (all events without it), then
+    follows the run until its completed or error event. The events and
+    their IDs are the same as on the POST /analysis stream, whose
+    "uploading completed" event carries the analysis_id.
+    """
+    try:
+        after = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid Last-Event-ID: {last_event_id}"
         )
-        
-        # Yield events as they come in
+    
+    heartbeat_seconds = settings.SSE_HEARTBEAT_SECONDS
+    run = analysis_event_bus.get(analysis_id)
+    if run is not None:
+        owner = run.user_id
+        events = run.subscribe(after=after, heartbeat_seconds=heartbeat_seconds)
+    else:
+        # Short-lived session: a request-scoped one would hold a connection for the whole stream
+        async with session_scope() as db:
+            state = await AnalysisEventRepository.get_owner_and_status(db, analysis_id)
+        owner = str(state[0]) if state else None
+        events = tail_persisted(
+            analysis_id,
+            after=after,
+            heartbeat_seconds=heartbeat_seconds,
+            stale_seconds=settings.ANALYSIS_EVENTS_STALE_SECONDS
+        )
+    
+    if owner != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analysis {analysis_id} not found"
+        )
+    return _event_stream_response(events)
+
+
+def _event_stream_response(events: AsyncIterator[tuple[int, SSEEvent] | None]) -> StreamingResponse:
+    """Stream (event ID, event) items as SSE, with a heartbeat comment for each None."""
+    
+    async def event_generator():
+        """Generate SSE events until the run closes."""
         try:
-            while True:
-                # Wait for next event or task completion
-                try:
-                    # Use wait_for to periodically check if task is done
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield event
-                    
-                    # Check if this was the final event (completed or error)
-                    if '"type": "completed"' in event or '"type": "error"' in event:
-                        break
-                        
-                except asyncio.TimeoutError:
-                    # Check if task failed
-                    if analysis_task.done():
-                        # Get exception if any
-                        try:
-                            analysis_task.result()
-                        except Exception:
-                            pass  # Error already sent via SSE
-                        break
+            async for item in events:
+                if item is None:
+                    yield SSE_HEARTBEAT
                     continue
-                    
+                event_id, event = item
+                yield event.to_sse(event_id)
         except Exception as e:
             # Send error event if generator fails
-            from app.schemas.sse import SSEErrorEvent
             yield SSEErrorEvent(message=str(e)).to_sse()
     
     return StreamingResponse(
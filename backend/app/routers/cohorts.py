@@ -0,0 +1,131 @@
+"""Cohort (teacher dashboard) API endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.models import Cohort, CohortRepository
+from app.schemas import (
+    CohortSummaryResponse,
+    CohortListResponse,
+    CohortQuestionStatsResponse,
+    CohortQuestionStatsListResponse,
+    ScoreHistogramResponse,
+    ScoreAverages,
+)
+from app.auth import get_current_user, AuthenticatedUser
+
+router = APIRouter(prefix="/cohorts")
+
+# Sub-scores compared to find a cohort's weakest area on a question
+SUB_SCORE_DIMENSIONS = ("delivery", "language_use", "topic_development")
+MAX_TOTAL_SCORE = 30
+
+
+def _average_scores(row) -> ScoreAverages:
+    """Build ScoreAverages from a view row's avg_* columns."""
+    return ScoreAverages(
+        total_score=row.avg_total_score,
+        delivery=row.avg_delivery,
+        language_use=row.avg_language_use,
+        topic_development=row.avg_topic_development
+    )
+
+
+async def _get_owned_cohort(db: AsyncSession, cohort_id: str, user: AuthenticatedUser) -> Cohort:
+    """Get a cohort, checking that the current user is its teacher."""
+    cohort = await CohortRepository.get_by_id(db, cohort_id)
+    if not cohort:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cohort {cohort_id} not found"
+        )
+    if str(cohort.teacher_id) != user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: you don't teach this cohort"
+        )
+    return cohort
+
+
+@router.get("", response_model=CohortListResponse)
+async def list_cohorts(
+    after: str | None = Query(None, description="Keyset cursor: next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the current teacher's cohorts with summary stats.
+
+    Stats come from materialized views refreshed in the background, so
+    they may lag recent attempts by up to COHORT_STATS_REFRESH_SECONDS.
+    """
+    rows = await CohortRepository.list_summaries(db, current_user.user_id, limit + 1, after)
+    page = rows[:limit]
+    return CohortListResponse(
+        cohorts=[
+            CohortSummaryResponse(
+                cohort_id=row.cohort_id,
+                name=row.name,
+                member_count=row.member_count or 0,
+                active_student_count=row.active_student_count or 0,
+                completed_count=row.completed_count or 0,
+                average_scores=_average_scores(row),
+                last_attempt_at=row.last_attempt_at
+            )
+            for row in page
+        ],
+        next_cursor=page[-1].cohort_id if len(rows) > limit else None
+    )
+
+
+@router.get("/{cohort_id}/questions", response_model=CohortQuestionStatsListResponse)
+async def list_cohort_question_stats(
+    cohort_id: str,
+    after: str | None = Query(None, description="Keyset cursor: next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get per-question attempt counts, average scores and weakest area for a cohort."""
+    await _get_owned_cohort(db, cohort_id, current_user)
+
+    rows = await CohortRepository.list_question_stats(db, cohort_id, limit + 1, after)
+    page = rows[:limit]
+    questions = []
+    for row in page:
+        averages = _average_scores(row)
+        scored = {d: getattr(averages, d) for d in SUB_SCORE_DIMENSIONS if getattr(averages, d) is not None}
+        questions.append(CohortQuestionStatsResponse(
+            question_id=row.question_id,
+            attempt_count=row.attempt_count,
+            student_count=row.student_count,
+            average_scores=averages,
+            weakest_dimension=min(scored, key=scored.get) if scored else None,
+            last_attempt_at=row.last_attempt_at
+        ))
+
+    return CohortQuestionStatsListResponse(
+        questions=questions,
+        next_cursor=page[-1].question_id if len(rows) > limit else None
+    )
+
+
+@router.get("/{cohort_id}/questions/{question_id}/histogram", response_model=ScoreHistogramResponse)
+async def get_cohort_score_histogram(
+    cohort_id: str,
+    question_id: str,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get the distribution of total scores (0-30) for a cohort on a question."""
+    await _get_owned_cohort(db, cohort_id, current_user)
+
+    histogram = await CohortRepository.get_score_histogram(db, cohort_id, question_id)
+    counts = [histogram.get(score, 0) for score in range(MAX_TOTAL_SCORE + 1)]
+    return ScoreHistogramResponse(
+        question_id=question_id,
+        counts=counts,
+        attempt_count=sum(counts)
+    )
@@ -0,0 +1,155 @@
+"""Endpoints scoped to the authenticated user."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.models import AnalysisResultRepository, UserProgressRepository, UserProgress, FeedbackSearchRepository
+from app.models.progress import SCORE_DIMENSIONS
+from app.schemas import (
+    RecordingHistoryResponse,
+    RecordingSummaryResponse,
+    ProgressResponse,
+    ScoreAverages,
+    FeedbackSearchHitResponse,
+    FeedbackSearchResponse,
+)
+from app.auth import get_current_user, AuthenticatedUser
+from app.utils.pagination import encode_cursor, decode_cursor
+
+router = APIRouter(prefix="/me")
+
+
+@router.get("/recordings", response_model=RecordingHistoryResponse)
+async def list_my_recordings(
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the current user's practice history, newest first.
+    
+    Each entry is a lightweight summary (question title, status, total
+    score, level); fetch /recordings/{id}/report for the full report.
+    """
+    before = None
+    if cursor is not None:
+        try:
+            created_at, recording_id = decode_cursor(cursor)
+            before = (datetime.fromisoformat(created_at), str(recording_id))
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
+    # Fetch one extra row to know whether another page exists
+    rows = await AnalysisResultRepository.get_user_history(
+        db, current_user.user_id, limit=limit + 1, before=before
+    )
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].recording_id)
+    
+    return RecordingHistoryResponse(
+        recordings=[
+            RecordingSummaryResponse(
+                recording_id=row.recording_id,
+                question_id=row.question_id,
+                question_title=row.question_title,
+                status=row.status or "pending",
+                total_score=row.total_score,
+                level=row.level,
+                created_at=row.created_at
+            )
+            for row in page
+        ],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/progress", response_model=ProgressResponse)
+async def get_my_progress(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the current user's progress dashboard.
+    
+    Reads only the user_progress rollup row, which is maintained as each
+    analysis completes, so the cost does not grow with the attempt count.
+    """
+    progress = await UserProgressRepository.get(db, current_user.user_id)
+    if progress is None:
+        progress = UserProgress(
+            attempt_count=0,
+            score_sums={},
+            score_counts={},
+            recent_attempts=[],
+            question_bests={}
+        )
+    
+    return ProgressResponse(
+        attempt_count=progress.attempt_count,
+        average_scores=ScoreAverages(**{d: progress.average(d) for d in SCORE_DIMENSIONS}),
+        recent_average_scores=ScoreAverages(**{d: progress.recent_average(d) for d in SCORE_DIMENSIONS}),
+        best_total_score=progress.best_total_score,
+        last_attempt_at=progress.last_attempt_at,
+        recent_attempts=progress.recent_attempts,
+        question_bests=progress.question_bests
+    )
+
+
+@router.get("/feedback/search", response_model=FeedbackSearchResponse)
+async def search_my_feedback(
+    q: str = Query(..., min_length=1, max_length=200, description='Search text; supports "phrases", OR and -exclusions'),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=50),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Search the current user's past feedback and transcripts, newest first.
+    
+    Matches chunk overviews, weaknesses, corrected text and transcripts
+    through a GIN-indexed tsvector maintained as analyses complete.
+    """
+    before = None
+    if cursor is not None:
+        try:
+            created_at, analysis_id, chunk_id = decode_cursor(cursor)
+            before = (datetime.fromisoformat(created_at), int(analysis_id), int(chunk_id))
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
+    # Fetch one extra hit to know whether another page exists
+    hits = await FeedbackSearchRepository.search(
+        db, current_user.user_id, q, limit=limit + 1, before=before
+    )
+    page = hits[:limit]
+    next_cursor = None
+    if len(hits) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(last.created_at, last.analysis_id, last.chunk_id)
+    
+    return FeedbackSearchResponse(
+        hits=[
+            FeedbackSearchHitResponse(
+                recording_id=hit.recording_id,
+                question_id=hit.question_id,
+                chunk_id=hit.chunk_id,
+                chunk_type=hit.chunk_type,
+                snippet=hit.snippet,
+                created_at=hit.created_at
+            )
+            for hit in page
+        ],
+        next_cursor=next_cursor
+    )
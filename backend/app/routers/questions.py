@@ -1,42 +1,70 @@
 """Question API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.database import get_db
-from app.models import Question
-from app.schemas import QuestionCreate, QuestionResponse, QuestionListResponse
+from app.database import get_db, get_read_db
+from app.models import Question, QuestionRepository, HISTOGRAM_SPECS
+from app.schemas import (
+    QuestionCreate,
+    QuestionResponse,
+    QuestionListResponse,
+    QuestionScoreHistogram,
+    QuestionStatsResponse,
+)
 from app.services.storage_service import storage_service
+from app.services.question_catalog import question_catalog
+from app.services.score_stats import question_stats_cache
+from app.config import settings
 
 router = APIRouter(prefix="/questions")
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
 @router.get("", response_model=QuestionListResponse)
 async def list_questions(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    after: str | None = Query(None, description="Keyset cursor: next_cursor from the previous page"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all questions."""
-    result = await db.execute(
-        select(Question).offset(skip).limit(limit)
-    )
-    questions = result.scalars().all()
+    """
+    Get all questions.
     
-    count_result = await db.execute(select(Question))
-    total = len(count_result.scalars().all())
+    Served from the in-process catalog cache. The ETag identifies the
+    catalog version, so clients can revalidate with If-None-Match.
+    """
+    catalog = await question_catalog.get(db)
+    headers = {"ETag": catalog.etag, "Cache-Control": settings.QUESTION_LIST_CACHE_CONTROL}
+    if _etag_matches(request, catalog.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
+    questions, next_cursor = catalog.page(after, skip, limit)
+    response.headers.update(headers)
     return QuestionListResponse(
-        questions=[QuestionResponse.model_validate(q) for q in questions],
-        total=total
+        questions=questions,
+        total=len(catalog.questions),
+        next_cursor=next_cursor
     )
 
 
 @router.get("/{question_id}", response_model=QuestionResponse)
 async def get_question(
     question_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific question by ID with all details.
@@ -47,10 +75,13 @@ async def get_question(
     - sos_keywords: Hint keywords for struggling users
     - sos_starter: Starter sentence hint
     """
-    result = await db.execute(
-        select(Question).where(Question.question_id == question_id)
-    )
-    question = result.scalar_one_or_none()
+    question = (await question_catalog.get(db)).by_id.get(question_id)
+    if question is None:
+        # Not in the cached catalog yet (e.g. created by another worker)
+        result = await db.execute(
+            select(Question).where(Question.question_id == question_id)
+        )
+        question = result.scalar_one_or_none()
     
     if not question:
         raise HTTPException(
@@ -81,6 +112,55 @@ async def get_question(
     )
 
 
+@router.get("/{question_id}/stats", response_model=QuestionStatsResponse)
+async def get_question_stats(
+    question_id: str,
+    response: Response,
+    total_score: int | None = Query(None, ge=0, le=30, description="Rank this total score"),
+    delivery: float | None = Query(None, ge=0, le=4, description="Rank this delivery score"),
+    language_use: float | None = Query(None, ge=0, le=4, description="Rank this language use score"),
+    topic_development: float | None = Query(None, ge=0, le=4, description="Rank this topic development score"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the score distribution of all completed attempts at a question.
+    
+    Pass any of the score query parameters to also get their percentile
+    ranks. Served from the per-worker histogram cache, so counts may lag
+    by up to QUESTION_STATS_CACHE_TTL_SECONDS.
+    """
+    if (await question_catalog.get(db)).by_id.get(question_id) is None:
+        if await QuestionRepository.get_by_id(db, question_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Question {question_id} not found"
+            )
+    
+    distribution = await question_stats_cache.get(db, question_id)
+    scores = {
+        "total_score": total_score,
+        "delivery": delivery,
+        "language_use": language_use,
+        "topic_development": topic_development,
+    }
+    requested = {dimension: value for dimension, value in scores.items() if value is not None}
+    
+    response.headers["Cache-Control"] = f"public, max-age={settings.QUESTION_STATS_CACHE_TTL_SECONDS}"
+    return QuestionStatsResponse(
+        question_id=question_id,
+        attempt_count=distribution.attempt_count,
+        histograms={
+            dimension: QuestionScoreHistogram(
+                min_score=spec.minimum,
+                bin_width=spec.width,
+                counts=list(distribution.histograms[dimension])
+            )
+            for dimension, spec in HISTOGRAM_SPECS.items()
+        },
+        percentiles=distribution.percentiles(requested) if requested else None
+    )
+
+
 @router.post("", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
 async def create_question(
     question_data: QuestionCreate,
@@ -105,7 +185,10 @@ async def create_question(
     )
     
     db.add(question)
-    await db.flush()
-    await db.refresh(question)
+    await db.commit()
+    # Invalidate after the commit so a concurrent reload cannot cache the old catalog,
+    # then reload from the primary (a replica may not have the new question yet)
+    question_catalog.invalidate()
+    await question_catalog.get(db)
     
     return QuestionResponse.model_validate(question)
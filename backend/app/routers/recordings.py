@@ -1,23 +1,86 @@
 """Recording API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.database import get_db
-from app.models import Recording, AnalysisResult
+from app.database import get_db, get_read_db
+from app.models import Recording, AnalysisResultRepository, RecordingReport, ReportPath
 from app.schemas import RecordingResponse, AudioUrlResponse, RecordingReportResponse
 from app.services.storage_service import storage_service
-from app.auth import get_current_user, AuthenticatedUser
+from app.services.tts_stream import tts_stream_registry
+from app.auth import get_current_user, get_optional_user, AuthenticatedUser
+from app.utils.url_signing import verify_signed_path
 
 router = APIRouter(prefix="/recordings")
 
+# Top-level report keys that may be requested with `fields=`
+REPORT_FIELDS = {"analysis_version", "global_evaluation", "full_transcript", "chunks", "viewpoint_extensions"}
+# Shorthands for common projections
+REPORT_FIELD_ALIASES: dict[str, list[ReportPath]] = {
+    "scores": [
+        ("global_evaluation", "total_score"),
+        ("global_evaluation", "score_breakdown"),
+        ("global_evaluation", "level"),
+    ],
+}
+_REPORT_FIELD_PATTERN = re.compile(r"[a-z_]+(\.(\d+|[a-z_]+))*")
+
+
+def _parse_report_fields(fields: str) -> list[ReportPath]:
+    """
+    Parse a `fields=` projection such as "scores,chunks.2,full_transcript.text".
+    
+    Raises:
+        HTTPException: 400 if a field is not a valid report path
+    """
+    paths: list[ReportPath] = []
+    for field in filter(None, (f.strip() for f in fields.split(","))):
+        if field in REPORT_FIELD_ALIASES:
+            paths.extend(REPORT_FIELD_ALIASES[field])
+            continue
+        parts = field.split(".")
+        if not _REPORT_FIELD_PATTERN.fullmatch(field) or parts[0] not in REPORT_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid report field: {field}"
+            )
+        paths.append(tuple(int(part) if part.isdigit() else part for part in parts))
+    return list(dict.fromkeys(paths))
+
+
+def _nest_report_paths(values: dict[ReportPath, object]) -> dict:
+    """Rebuild the report shape from projected paths (list indexes become string keys)."""
+    report: dict = {}
+    for path, value in values.items():
+        node = report
+        for part in path[:-1]:
+            node = node.setdefault(str(part), {})
+        node[str(path[-1])] = value
+    return report
+
+
+def _report_etag(report: RecordingReport, audio_url: str, fields: str | None) -> str:
+    """
+    Build a strong ETag for a report response.
+    
+    The analysis ID and status identify the report version (a report is
+    written once, on completion). The audio URL and projection are hashed
+    in, since they are part of the response body.
+    """
+    digest = hashlib.sha256(f"{audio_url}\n{fields or ''}\n{report.error_message or ''}".encode("utf-8"))
+    return f'"{report.analysis_id or 0}-{report.status or "pending"}-{digest.hexdigest()[:16]}"'
+
 
 @router.get("/{recording_id}", response_model=RecordingResponse)
 async def get_recording(
     recording_id: str,
     current_user: AuthenticatedUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific recording by ID (ULID format). Requires authentication and ownership."""
     result = await db.execute(
@@ -45,7 +108,7 @@ async def get_recording(
 async def get_recording_audio(
     recording_id: str,
     current_user: AuthenticatedUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get presigned URL for recording audio playback. Requires authentication and ownership."""
     result = await db.execute(
@@ -77,8 +140,14 @@ async def get_recording_audio(
 @router.get("/{recording_id}/report", response_model=RecordingReportResponse)
 async def get_recording_report(
     recording_id: str,
+    request: Request,
+    response: Response,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated report paths to return, e.g. scores,chunks.2,global_evaluation"
+    ),
     current_user: AuthenticatedUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get recording with its analysis report and audio URL.
@@ -87,21 +156,25 @@ async def get_recording_report(
     This endpoint returns:
     - Recording metadata (recording_id, question_id, created_at)
     - Presigned audio URL (MP3 format, supports seeking)
-    - Analysis report (if completed)
+    - Analysis report (if completed), or only the parts named in `fields`
     - Analysis status
+    
+    Responses carry an ETag; send it back in If-None-Match to get
+    304 Not Modified while the report is unchanged.
     """
-    # Get recording
-    result = await db.execute(
-        select(Recording).where(Recording.recording_id == recording_id)
-    )
-    recording = result.scalar_one_or_none()
+    report_paths = _parse_report_fields(fields) if fields is not None else None
     
-    if not recording:
+    # Get recording and analysis result in one query
+    report = await AnalysisResultRepository.get_recording_report(db, recording_id, report_paths)
+    
+    if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recording {recording_id} not found"
         )
     
+    recording = report.recording
+    
     # Check user ownership (if recording has user_id set)
     if recording.user_id and str(recording.user_id) != current_user.user_id:
         raise HTTPException(
@@ -109,24 +182,124 @@ async def get_recording_report(
             detail="Access denied: you don't own this recording"
         )
     
-    # Get analysis result
-    result = await db.execute(
-        select(AnalysisResult).where(AnalysisResult.recording_id == recording_id)
-    )
-    analysis = result.scalar_one_or_none()
-    
-    # Generate presigned URL for audio
+    # Generate presigned URL for audio (cached, so stable between polls)
     presigned_url = storage_service.get_presigned_url(
         bucket=storage_service.bucket_recordings,
         object_key=recording.audio_url
     )
     
+    etag = _report_etag(report, presigned_url, fields)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    
+    report_json = report.report
+    if report_json is not None and report_paths is not None:
+        report_json = _nest_report_paths(report_json)
+    
     return RecordingReportResponse(
         recording_id=recording.recording_id,
         question_id=recording.question_id,
         audio_url=presigned_url,
-        report=analysis.report_json if analysis else None,
-        status=analysis.status if analysis else "pending",
-        error_message=analysis.error_message if analysis else None,
+        report=report_json,
+        status=report.status or "pending",
+        error_message=report.error_message,
         created_at=recording.created_at
     )
+
+
+@router.get("/{recording_id}/chunks/{chunk_index}/tts")
+async def get_chunk_tts(
+    recording_id: str,
+    chunk_index: int,
+    expires: int | None = None,
+    signature: str | None = None,
+    current_user: AuthenticatedUser | None = Depends(get_optional_user),
+    # Primary, not the replica: requested as soon as the report completes
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Play the cloned-voice "golden version" of a chunk.
+    Requires authentication and ownership, or a signed URL from the report
+    (audio elements cannot send an Authorization header).
+    
+    - If the audio is already in storage: 307 redirect to a presigned URL
+    - Otherwise, while the cloned voice is alive: stream the audio as
+      ElevenLabs synthesizes it and persist it to storage in the background
+    """
+    signed = verify_signed_path(
+        f"/recordings/{recording_id}/chunks/{chunk_index}/tts", expires, signature
+    )
+    if not signed and current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required"
+        )
+    
+    if chunk_index < 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chunk {chunk_index} not found"
+        )
+    
+    # Only this chunk is extracted from report_json, in SQL
+    chunk_path = ("chunks", chunk_index)
+    report = await AnalysisResultRepository.get_recording_report(db, recording_id, [chunk_path])
+    
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recording {recording_id} not found"
+        )
+    recording = report.recording
+    
+    # Check user ownership (signed URLs were issued to the owner)
+    if not signed and recording.user_id and str(recording.user_id) != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: you don't own this recording"
+        )
+    
+    chunk = report.report.get(chunk_path) if report.report else None
+    if not chunk:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chunk {chunk_index} not found"
+        )
+    
+    object_key = chunk.get("cloned_audio_key")
+    if not object_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No cloned audio for chunk {chunk_index}"
+        )
+    
+    # Serve from storage once the audio has been persisted
+    if await storage_service.get_object_metadata(storage_service.bucket_recordings, object_key) is not None:
+        presigned_url = storage_service.get_presigned_url(
+            bucket=storage_service.bucket_recordings,
+            object_key=object_key
+        )
+        time_range = chunk.get("cloned_audio_range")
+        if time_range:
+            presigned_url += f"#t={time_range[0]},{time_range[1]}"
+        return RedirectResponse(presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    
+    # Counted against the voice until the stream ends, so it is not deleted mid-stream
+    session = tts_stream_registry.acquire(recording_id)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cloned audio for chunk {chunk_index} is not available"
+        )
+    
+    return StreamingResponse(
+        tts_stream_registry.stream_chunk(session, chunk_index),
+        media_type="audio/mpeg",
+        headers={
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
@@ -0,0 +1,120 @@
+"""Local storage API endpoints (STORAGE_BACKEND=local)."""
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import FileResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+from app.services.storage_service import storage_service, LocalStorageService
+from app.utils.url_signing import verify_signed_path
+
+router = APIRouter(prefix="/storage")
+
+
+@router.get("/{bucket}/{object_key:path}")
+async def get_object(
+    bucket: str,
+    object_key: str,
+    request: Request,
+    expires: int | None = None,
+    signature: str | None = None
+):
+    """
+    Serve an object from local storage via a presigned URL.
+
+    Supports HTTP Range requests (seeking in audio players) and conditional
+    GET via ETag / Last-Modified. The file body is sent by the server's
+    zero-copy path (ASGI pathsend / sendfile) when available.
+    """
+    if not isinstance(storage_service, LocalStorageService):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Local storage is not enabled"
+        )
+
+    if not verify_signed_path(f"/storage/{bucket}/{object_key}", expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature"
+        )
+
+    try:
+        local_object = await run_in_threadpool(storage_service.stat_object, bucket, object_key)
+    except ValueError:
+        local_object = None
+    if local_object is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Object {bucket}/{object_key} not found"
+        )
+
+    headers = {"Cache-Control": local_object.cache_control or "private, max-age=3600"}
+    response = FileResponse(
+        local_object.path,
+        media_type=local_object.content_type,
+        headers=headers,
+        stat_result=local_object.stat
+    )
+
+    # Conditional GET: FileResponse sets ETag / Last-Modified from the file stat
+    etag = response.headers["etag"]
+    if_none_match = request.headers.get("if-none-match")
+    not_modified = (
+        if_none_match is not None and etag in [tag.strip() for tag in if_none_match.split(",")]
+    ) or (
+        if_none_match is None
+        and request.headers.get("if-modified-since") == response.headers["last-modified"]
+    )
+    if not_modified:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                "ETag": etag,
+                "Last-Modified": response.headers["last-modified"],
+                **headers,
+            }
+        )
+
+    return response
+
+
+@router.put("/{bucket}/{object_key:path}")
+async def put_object(
+    bucket: str,
+    object_key: str,
+    request: Request,
+    expires: int | None = None,
+    signature: str | None = None
+):
+    """
+    Write an object to local storage via a presigned PUT URL.
+
+    This is the local counterpart of an S3 presigned PUT, used for
+    direct-from-browser recording uploads.
+    """
+    if not isinstance(storage_service, LocalStorageService):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Local storage is not enabled"
+        )
+
+    if not verify_signed_path(f"/storage/{bucket}/{object_key}", expires, signature, method="PUT"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature"
+        )
+
+    data = await request.body()
+    try:
+        await storage_service.upload_audio(
+            bucket=bucket,
+            object_key=object_key,
+            data=data,
+            content_type=request.headers.get("content-type", "application/octet-stream")
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return Response(status_code=status.HTTP_200_OK)
@@ -4,17 +4,41 @@ from app.schemas.question import (
     QuestionCreate,
     QuestionResponse,
     QuestionListResponse,
+    QuestionScoreHistogram,
+    QuestionStatsResponse,
 )
 from app.schemas.recording import (
     RecordingCreate,
     RecordingResponse,
     AudioUrlResponse,
     RecordingReportResponse,
+    RecordingSummaryResponse,
+    RecordingHistoryResponse,
 )
 from app.schemas.analysis import (
     AnalysisResponse,
+    UploadUrlRequest,
+    UploadUrlResponse,
+)
+from app.schemas.progress import (
+    ScoreAverages,
+    ProgressAttemptResponse,
+    QuestionBestResponse,
+    ProgressResponse,
+)
+from app.schemas.feedback import (
+    FeedbackSearchHitResponse,
+    FeedbackSearchResponse,
+)
+from app.schemas.cohort import (
+    CohortSummaryResponse,
+    CohortListResponse,
+    CohortQuestionStatsResponse,
+    CohortQuestionStatsListResponse,
+    ScoreHistogramResponse,
 )
 from app.schemas.sse import (
+    SSEEvent,
     SSEStepEvent,
     SSECompletedEvent,
     SSEErrorEvent,
@@ -24,11 +48,29 @@ __all__ = [
     "QuestionCreate",
     "QuestionResponse", 
     "QuestionListResponse",
+    "QuestionScoreHistogram",
+    "QuestionStatsResponse",
     "RecordingCreate",
     "RecordingResponse",
     "AudioUrlResponse",
     "RecordingReportResponse",
+    "RecordingSummaryResponse",
+    "RecordingHistoryResponse",
     "AnalysisResponse",
+    "UploadUrlRequest",
+    "UploadUrlResponse",
+    "ScoreAverages",
+    "ProgressAttemptResponse",
+    "QuestionBestResponse",
+    "ProgressResponse",
+    "FeedbackSearchHitResponse",
+    "FeedbackSearchResponse",
+    "CohortSummaryResponse",
+    "CohortListResponse",
+    "CohortQuestionStatsResponse",
+    "CohortQuestionStatsListResponse",
+    "ScoreHistogramResponse",
+    "SSEEvent",
     "SSEStepEvent",
     "SSECompletedEvent",
     "SSEErrorEvent",
@@ -15,3 +15,19 @@ class AnalysisResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class UploadUrlRequest(BaseModel):
+    """Schema for requesting a direct-to-storage upload URL."""
+    question_id: str
+    content_type: str = Field("audio/webm", description="MIME type the client will upload")
+
+
+class UploadUrlResponse(BaseModel):
+    """Schema for a presigned recording upload."""
+    recording_id: str
+    object_key: str = Field(..., description="Pass to POST /analysis once the upload finishes")
+    upload_url: str
+    method: str = "PUT"
+    headers: dict[str, str] = Field(default_factory=dict, description="Headers the upload must send")
+    expires_in: int = Field(..., description="Seconds until upload_url expires")
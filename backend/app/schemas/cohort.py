@@ -0,0 +1,48 @@
+"""Cohort dashboard schemas."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from app.schemas.progress import ScoreAverages
+
+
+class CohortSummaryResponse(BaseModel):
+    """Schema for a cohort with its summary stats."""
+    cohort_id: str
+    name: str
+    member_count: int = 0
+    active_student_count: int = Field(0, description="Members with at least one completed analysis")
+    completed_count: int = Field(0, description="Completed analyses across all members")
+    average_scores: ScoreAverages
+    last_attempt_at: datetime | None = None
+
+
+class CohortListResponse(BaseModel):
+    """Schema for a page of the teacher's cohorts."""
+    cohorts: list[CohortSummaryResponse]
+    next_cursor: str | None = Field(None, description="Pass as `after` to get the next page")
+
+
+class CohortQuestionStatsResponse(BaseModel):
+    """Schema for a cohort's aggregate results on one question."""
+    question_id: str
+    attempt_count: int
+    student_count: int
+    average_scores: ScoreAverages
+    weakest_dimension: str | None = Field(
+        None, description="Lowest-scoring of delivery, language_use, topic_development"
+    )
+    last_attempt_at: datetime | None = None
+
+
+class CohortQuestionStatsListResponse(BaseModel):
+    """Schema for a page of a cohort's per-question stats."""
+    questions: list[CohortQuestionStatsResponse]
+    next_cursor: str | None = Field(None, description="Pass as `after` to get the next page")
+
+
+class ScoreHistogramResponse(BaseModel):
+    """Schema for a distribution of total scores."""
+    question_id: str
+    counts: list[int] = Field(..., description="counts[s] = attempts with total_score s (0-30)")
+    attempt_count: int
@@ -0,0 +1,20 @@
+"""Feedback search schemas."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class FeedbackSearchHitResponse(BaseModel):
+    """A report chunk whose feedback or transcript matches the search."""
+    recording_id: str = Field(..., description="Recording ID (ULID format)")
+    question_id: str | None = None
+    chunk_id: int = Field(..., description="Index into the report's chunks")
+    chunk_type: str | None = None
+    snippet: str = Field(..., description="HTML-escaped excerpt with matches wrapped in <mark>")
+    created_at: datetime
+
+
+class FeedbackSearchResponse(BaseModel):
+    """A page of feedback search results, newest first."""
+    hits: list[FeedbackSearchHitResponse]
+    next_cursor: str | None = Field(None, description="Pass as `cursor` to get the next page")
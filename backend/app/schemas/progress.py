@@ -0,0 +1,40 @@
+"""Progress schemas."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class ScoreAverages(BaseModel):
+    """Average score per dimension (None until an attempt is scored)."""
+    total_score: float | None = Field(None, description="Average total score (0-30)")
+    delivery: float | None = None
+    language_use: float | None = None
+    topic_development: float | None = None
+
+
+class ProgressAttemptResponse(BaseModel):
+    """One recent attempt in the progress history."""
+    recording_id: str
+    question_id: str | None = None
+    total_score: int | None = None
+    delivery: float | None = None
+    language_use: float | None = None
+    topic_development: float | None = None
+    created_at: datetime
+
+
+class QuestionBestResponse(BaseModel):
+    """The user's best attempt at a question."""
+    total_score: int
+    recording_id: str
+
+
+class ProgressResponse(BaseModel):
+    """Schema for the user's progress dashboard."""
+    attempt_count: int
+    average_scores: ScoreAverages = Field(..., description="All-time averages")
+    recent_average_scores: ScoreAverages = Field(..., description="Averages over recent_attempts")
+    best_total_score: int | None = None
+    last_attempt_at: datetime | None = None
+    recent_attempts: list[ProgressAttemptResponse] = Field(..., description="Newest first")
+    question_bests: dict[str, QuestionBestResponse] = Field(..., description="Best attempt per question_id")
@@ -33,3 +33,23 @@ class QuestionListResponse(BaseModel):
     """Schema for list of questions."""
     questions: list[QuestionResponse]
     total: int
+    next_cursor: str | None = Field(None, description="Pass as `after` to get the next page")
+
+
+class QuestionScoreHistogram(BaseModel):
+    """Attempt counts in fixed-width score bins."""
+    min_score: float = Field(..., description="Score at the centre of the first bin")
+    bin_width: float
+    counts: list[int]
+
+
+class QuestionStatsResponse(BaseModel):
+    """Score distribution of all completed attempts at a question."""
+    question_id: str
+    attempt_count: int
+    histograms: dict[str, QuestionScoreHistogram] = Field(
+        ..., description="total_score, delivery, language_use, topic_development"
+    )
+    percentiles: dict[str, float] | None = Field(
+        None, description="Percentile rank (0-100) of the scores passed as query parameters"
+    )
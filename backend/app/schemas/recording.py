@@ -35,3 +35,20 @@ class RecordingReportResponse(BaseModel):
     status: str = Field(..., description="Analysis status: pending | processing | completed | failed")
     error_message: str | None = Field(None, description="Error message if analysis failed")
     created_at: datetime = Field(..., description="Recording creation time")
+
+
+class RecordingSummaryResponse(BaseModel):
+    """Schema for one entry of the user's practice history."""
+    recording_id: str = Field(..., description="Recording ID (ULID format)")
+    question_id: str
+    question_title: str | None = None
+    status: str = Field(..., description="Analysis status: pending | processing | completed | failed")
+    total_score: int | None = Field(None, description="Total score (0-30) once completed")
+    level: str | None = None
+    created_at: datetime
+
+
+class RecordingHistoryResponse(BaseModel):
+    """Schema for a page of the user's practice history."""
+    recordings: list[RecordingSummaryResponse]
+    next_cursor: str | None = Field(None, description="Pass as `cursor` to get the next page")
@@ -1,6 +1,6 @@
 """SSE (Server-Sent Events) schemas for streaming analysis progress."""
 
-from typing import Literal
+from typing import ClassVar, Literal
 from pydantic import BaseModel, Field
 
 
@@ -10,35 +10,56 @@ StepType = Literal["uploading", "transcribing", "analyzing", "generating"]
 # Status for each step
 StepStatus = Literal["start", "completed"]
 
+# Comment line sent on idle streams so proxies keep the connection open
+SSE_HEARTBEAT = ": keep-alive\n\n"
 
-class SSEStepEvent(BaseModel):
+
+class SSEEvent(BaseModel):
+    """Base class for analysis progress events."""
+
+    # True for the last event of a stream (completed or error)
+    terminal: ClassVar[bool] = False
+
+    def to_sse(self, event_id: int | None = None) -> str:
+        """Format as SSE data line, with an id line when event_id is given."""
+        id_line = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{id_line}data: {self.model_dump_json()}\n\n"
+
+
+class SSEStepEvent(SSEEvent):
     """SSE event for step progress updates."""
     type: StepType = Field(..., description="The current step type")
     status: StepStatus = Field(..., description="Step status: start or completed")
-    
-    def to_sse(self) -> str:
-        """Format as SSE data line."""
-        return f"data: {self.model_dump_json()}\n\n"
+    analysis_id: int | None = Field(
+        None,
+        description="Set once the analysis record exists; reconnect via GET /analysis/{analysis_id}/events"
+    )
 
 
-class SSECompletedEvent(BaseModel):
+class SSECompletedEvent(SSEEvent):
     """SSE event when analysis is completed."""
+    terminal: ClassVar[bool] = True
+
     type: Literal["completed"] = "completed"
     report: dict = Field(..., description="The complete analysis report JSON")
     recording_id: str = Field(..., description="The recording ID (ULID format) for fetching report later")
     audio_url: str = Field(..., description="Presigned URL for the MP3 audio file")
-    
-    def to_sse(self) -> str:
-        """Format as SSE data line."""
-        return f"data: {self.model_dump_json()}\n\n"
 
 
-class SSEErrorEvent(BaseModel):
+class SSEErrorEvent(SSEEvent):
     """SSE event when an error occurs."""
+    terminal: ClassVar[bool] = True
+
     type: Literal["error"] = "error"
     message: str = Field(..., description="Error message")
     step: StepType | None = Field(None, description="The step where error occurred")
-    
-    def to_sse(self) -> str:
-        """Format as SSE data line."""
-        return f"data: {self.model_dump_json()}\n\n"
+
+
+def parse_sse_event(payload: dict) -> SSEEvent:
+    """Rebuild an event from its model_dump() (e.g. a persisted event)."""
+    event_type = payload.get("type")
+    if event_type == "completed":
+        return SSECompletedEvent.model_validate(payload)
+    if event_type == "error":
+        return SSEErrorEvent.model_validate(payload)
+    return SSEStepEvent.model_validate(payload)
@@ -3,18 +3,19 @@
 import tempfile
 import os
 from io import BytesIO
+from typing import BinaryIO
 from pydub import AudioSegment
 from app.config import settings
 from app.clients import get_openai_client, get_http_client
 
 
-async def transcribe_audio_openai_from_bytes(audio_bytes: bytes, filename: str = "audio.mp3") -> dict:
+async def transcribe_audio_openai_from_bytes(audio: bytes | BinaryIO, filename: str = "audio.mp3") -> dict:
     """
-    Transcribe audio using OpenAI Whisper API directly from bytes.
+    Transcribe audio using OpenAI Whisper API directly from bytes or an open file.
     
     Args:
-        audio_bytes: MP3 audio bytes
-        filename: Filename hint for the API
+        audio: Audio bytes, or a binary file (e.g. the spooled upload), streamed as is
+        filename: Filename hint for the API (used for bytes; files keep their own name)
         
     Returns:
         dict: {
@@ -31,9 +32,12 @@ async def transcribe_audio_openai_from_bytes(audio_bytes: bytes, filename: str =
     # Use singleton OpenAI client
     client = get_openai_client()
     
-    # Create a file-like object from bytes
-    audio_file = BytesIO(audio_bytes)
-    audio_file.name = filename
+    # httpx streams the file in chunks (rewinding it on retries), so it is not read into memory
+    if isinstance(audio, bytes):
+        audio_file = BytesIO(audio)
+        audio_file.name = filename
+    else:
+        audio_file = audio
     
     # Call OpenAI Whisper
     transcription = await client.audio.transcriptions.create(
@@ -1,11 +1,22 @@
 """ElevenLabs voice cloning and text-to-speech service."""
 
+import base64
 import io
 import httpx
-from typing import BinaryIO
+from typing import AsyncIterator, BinaryIO
 from app.config import settings
 
 
+# Default TTS model and voice settings for natural speech
+DEFAULT_TTS_MODEL_ID = "eleven_multilingual_v2"
+DEFAULT_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True
+}
+
+
 class ElevenLabsService:
     """Service for ElevenLabs voice cloning and TTS."""
 
@@ -74,7 +85,7 @@ class ElevenLabsService:
         self,
         text: str,
         voice_id: str,
-        model_id: str = "eleven_multilingual_v2",
+        model_id: str = DEFAULT_TTS_MODEL_ID,
         voice_settings: dict | None = None
     ) -> bytes:
         """
@@ -91,14 +102,8 @@ class ElevenLabsService:
         """
         url = f"{self.BASE_URL}/text-to-speech/{voice_id}"
 
-        # Default voice settings for natural speech
         if voice_settings is None:
-            voice_settings = {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
+            voice_settings = DEFAULT_VOICE_SETTINGS
 
         payload = {
             "text": text,
@@ -120,6 +125,94 @@ class ElevenLabsService:
             response.raise_for_status()
             return response.content
 
+    async def text_to_speech_with_timestamps(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str = DEFAULT_TTS_MODEL_ID,
+        voice_settings: dict | None = None
+    ) -> tuple[bytes, dict]:
+        """
+        Convert text to speech and return character-level alignment.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ID of the voice to use
+            model_id: ElevenLabs model ID (default: eleven_multilingual_v2)
+            voice_settings: Optional voice settings (stability, similarity_boost, etc.)
+
+        Returns:
+            Tuple of (MP3 audio bytes, alignment dict) where alignment has
+            "characters", "character_start_times_seconds" and
+            "character_end_times_seconds" lists aligned with the input text
+        """
+        url = f"{self.BASE_URL}/text-to-speech/{voice_id}/with-timestamps"
+
+        if voice_settings is None:
+            voice_settings = DEFAULT_VOICE_SETTINGS
+
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": voice_settings
+        }
+
+        headers = {
+            **self.headers,
+            "Content-Type": "application/json"
+        }
+
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            response = await client.post(
+                url,
+                headers=headers,
+                json=payload
+            )
+            response.raise_for_status()
+            result = response.json()
+            return base64.b64decode(result["audio_base64"]), result["alignment"]
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str = DEFAULT_TTS_MODEL_ID,
+        voice_settings: dict | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Convert text to speech, yielding MP3 bytes as ElevenLabs produces them.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ID of the voice to use
+            model_id: ElevenLabs model ID (default: eleven_multilingual_v2)
+            voice_settings: Optional voice settings (stability, similarity_boost, etc.)
+
+        Yields:
+            Chunks of audio data (MP3 format)
+        """
+        url = f"{self.BASE_URL}/text-to-speech/{voice_id}/stream"
+
+        if voice_settings is None:
+            voice_settings = DEFAULT_VOICE_SETTINGS
+
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": voice_settings
+        }
+
+        headers = {
+            **self.headers,
+            "Content-Type": "application/json"
+        }
+
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            async with client.stream("POST", url, headers=headers, json=payload) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+
     async def delete_voice(self, voice_id: str) -> None:
         """
         Delete a cloned voice.
@@ -93,6 +93,8 @@ class ChunkInfo(BaseModel):
     text: str = Field(..., description="Text from Whisper for display")
     feedback_structured: ChunkFeedbackStructured = Field(..., description="Structured feedback with pronunciation, grammar, and expression analysis")
     cloned_audio_url: str | None = Field(None, description="Presigned URL to cloned voice audio (corrected version)")
+    cloned_audio_range: list[float] | None = Field(None, description="[start, end] in seconds within cloned_audio_url when it is shared by all chunks")
+    cloned_audio_key: str | None = Field(None, description="Storage object key of the cloned voice audio")
 
 
 class ToeflReportV2(BaseModel):
@@ -102,6 +104,10 @@ class ToeflReportV2(BaseModel):
     full_transcript: FullTranscript
     chunks: list[ChunkInfo]
     viewpoint_extensions: ViewpointExtensions | None = Field(None, description="Extended viewpoints for thought expansion")
+    score_percentiles: dict[str, float] | None = Field(
+        None,
+        description="Percentile rank (0-100) of each score among earlier attempts at the question"
+    )
 
 
 # --- V2 Functions for Content-Aware Chunking ---
@@ -0,0 +1,320 @@
+"""In-process event bus and event log for analysis pipeline runs.
+
+POST /analysis starts the pipeline as a task publishing its progress events
+to an AnalysisRun. Subscribers sleep on an asyncio.Event that is set on each
+publish, so an idle stream costs nothing until the next event or heartbeat.
+A run is closed by its terminal event (completed or error), or by the task's
+done-callback if the pipeline ended without sending one.
+
+Once the pipeline reports its analysis ID (the "uploading completed" event),
+the run is indexed by it and its events are also written to analysis_events.
+Writes happen in a background flush that batches whatever was published
+meanwhile, so publishing never waits on the database. The completed event
+is logged as a bare marker: its report already lives in analysis_results,
+where replay reads it from. GET /analysis/{id}/events replays from memory while the run is held here,
+and from the table otherwise, e.g. when the reconnect lands on another
+worker. ANALYSIS_EVENTS_RETENTION_SECONDS after a run closes, it is dropped
+from memory and its logged events are deleted; later reconnects get the
+terminal event rebuilt from the analysis result. A run that stops logging
+events while still processing (its worker died) is ended with an error
+event after ANALYSIS_EVENTS_STALE_SECONDS.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable
+
+from app.config import settings
+from app.database import session_scope
+from app.models import AnalysisEventRepository
+from app.schemas.sse import SSEEvent, SSEStepEvent, SSECompletedEvent, SSEErrorEvent, parse_sse_event
+from app.services.storage_service import storage_service
+
+logger = logging.getLogger(__name__)
+
+# Callback the pipeline publishes its events through
+EventPublisher = Callable[[SSEEvent], Awaitable[None]]
+
+# Seconds between event log reads when tailing a run held by another worker
+PERSISTED_TAIL_POLL_SECONDS = 1.0
+
+
+def _log_payload(event: SSEEvent) -> dict:
+    """Payload stored for an event; completed events are rebuilt from their analysis result on replay."""
+    if isinstance(event, SSECompletedEvent):
+        return {"type": event.type}
+    return event.model_dump()
+
+
+class AnalysisRun:
+    """Events of one pipeline run, numbered from 1 (the SSE event ID)."""
+
+    def __init__(self, user_id: str | None = None, on_bind: Callable[["AnalysisRun"], None] | None = None):
+        self.user_id = user_id
+        self.analysis_id: int | None = None
+        self.events: list[SSEEvent] = []
+        self.closed = False
+        self._on_bind = on_bind
+        # Number of events written to the event log, and the write in progress
+        self._logged = 0
+        self._flush_task: asyncio.Task | None = None
+        # Replaced after every notification, so each waiter sees the next change
+        self._changed = asyncio.Event()
+
+    async def publish(self, event: SSEEvent) -> None:
+        """Append an event; once the analysis ID is known, it is logged in the background."""
+        if not self._append(event):
+            return
+        if self.analysis_id is None:
+            if not (isinstance(event, SSEStepEvent) and event.analysis_id is not None):
+                return
+            # Bound: index the run; the flush writes the events published so far
+            self.analysis_id = event.analysis_id
+            if self._on_bind is not None:
+                self._on_bind(self)
+        self.schedule_flush()
+
+    def schedule_flush(self) -> None:
+        """Start writing unlogged events to the event log, unless a flush is already running."""
+        if self.analysis_id is None or self._flush_task is not None or self._logged == len(self.events):
+            return
+        self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        # Events published during a write go out together in the next one
+        while self._logged < len(self.events):
+            end = len(self.events)
+            try:
+                async with session_scope() as db:
+                    await AnalysisEventRepository.append(
+                        db,
+                        self.analysis_id,
+                        [(i, _log_payload(self.events[i - 1])) for i in range(self._logged + 1, end + 1)]
+                    )
+            except Exception as e:
+                # Live subscribers are unaffected; only cross-worker replay misses the events
+                logger.error(f"Failed to persist events of analysis {self.analysis_id}: {e}")
+            self._logged = end
+        self._flush_task = None
+
+    async def flushed(self) -> None:
+        """Wait until every event published so far has been written (or failed to be)."""
+        while self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    def _append(self, event: SSEEvent) -> bool:
+        if self.closed:
+            logger.warning(f"Dropping {type(event).__name__} published after the run closed")
+            return False
+        self.events.append(event)
+        if event.terminal:
+            self.closed = True
+        self._notify()
+        return True
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(
+        self,
+        after: int = 0,
+        heartbeat_seconds: float | None = None
+    ) -> AsyncIterator[tuple[int, SSEEvent] | None]:
+        """
+        Iterate over the run's events until it closes.
+
+        Args:
+            after: ID of the last event already seen (0 for all events)
+            heartbeat_seconds: Yield None after this long without an event
+
+        Yields:
+            (event ID, event), or None as a heartbeat
+        """
+        next_id = after + 1
+        while True:
+            changed = self._changed
+            while next_id <= len(self.events):
+                yield next_id, self.events[next_id - 1]
+                next_id += 1
+            if self.closed:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield None
+
+
+async def tail_persisted(
+    analysis_id: int,
+    after: int = 0,
+    heartbeat_seconds: float | None = None,
+    stale_seconds: float | None = None
+) -> AsyncIterator[tuple[int, SSEEvent] | None]:
+    """
+    Iterate over an analysis's logged events, following a run held by another worker.
+
+    Always ends with a terminal event: the logged one, one rebuilt from the
+    analysis result once it is no longer processing (e.g. after the logged
+    events expired), or an error once no event was logged for stale_seconds.
+
+    Yields:
+        (event ID, event), or None as a heartbeat
+    """
+    async with session_scope() as db:
+        last_logged = await AnalysisEventRepository.get_last_event_time(db, analysis_id)
+    # Measured from the last logged event, so reconnecting does not restart the clock
+    last_event_at = time.monotonic()
+    if last_logged is not None:
+        last_event_at -= max((datetime.utcnow() - last_logged).total_seconds(), 0)
+    last_heartbeat_at = time.monotonic()
+    # The first poll replays the backlog, already accounted for by last_logged
+    replaying = True
+    # The pipeline updates the analysis status before sending its last events,
+    # so a finished analysis is given one more poll for them to land
+    finishing = False
+    while True:
+        async with session_scope() as db:
+            events = await AnalysisEventRepository.list_after(db, analysis_id, after)
+            state = None if events else await AnalysisEventRepository.get_owner_and_status(db, analysis_id)
+        for event_id, payload in events:
+            if payload.get("type") == "completed":
+                # Logged without the report, which is read from its row instead
+                event = await _rebuild_terminal_event(analysis_id)
+            else:
+                event = parse_sse_event(payload)
+            yield event_id, event
+            after = event_id
+            if event.terminal:
+                return
+        now = time.monotonic()
+        if events:
+            if not replaying:
+                last_event_at = now
+            last_heartbeat_at = now
+        elif state is None or state[1] != "processing":
+            if finishing:
+                yield after + 1, await _rebuild_terminal_event(analysis_id)
+                return
+            finishing = True
+        elif stale_seconds is not None and now - last_event_at >= stale_seconds:
+            logger.warning(f"Analysis {analysis_id} logged no event for {stale_seconds:g}s; ending its stream")
+            yield after + 1, SSEErrorEvent(message="Analysis stopped responding")
+            return
+        elif heartbeat_seconds is not None and now - last_heartbeat_at >= heartbeat_seconds:
+            last_heartbeat_at = now
+            yield None
+        replaying = False
+        await asyncio.sleep(PERSISTED_TAIL_POLL_SECONDS)
+
+
+async def _rebuild_terminal_event(analysis_id: int) -> SSEEvent:
+    """Build the terminal event of a finished analysis from its stored result."""
+    async with session_scope() as db:
+        outcome = await AnalysisEventRepository.get_outcome(db, analysis_id)
+    if outcome is None:
+        return SSEErrorEvent(message=f"Analysis {analysis_id} not found")
+    if outcome.status == "completed" and outcome.report is not None:
+        return SSECompletedEvent(
+            report=outcome.report,
+            recording_id=outcome.recording_id,
+            audio_url=storage_service.get_presigned_url(
+                bucket=storage_service.bucket_recordings,
+                object_key=outcome.audio_key
+            )
+        )
+    return SSEErrorEvent(message=outcome.error_message or "Analysis failed")
+
+
+class AnalysisEventBus:
+    """Process-wide owner of running pipeline tasks and their event runs."""
+
+    def __init__(self, retention_seconds: float):
+        self.retention_seconds = retention_seconds
+        # Strong references to running pipelines (a client disconnect must not orphan them)
+        self._tasks: dict[asyncio.Task, AnalysisRun] = {}
+        # analysis_id -> run, while running and for retention_seconds after
+        self._runs: dict[int, AnalysisRun] = {}
+        # Strong references to event log deletions scheduled from callbacks
+        self._background: set[asyncio.Task] = set()
+
+    def start(
+        self,
+        pipeline: Callable[[EventPublisher], Awaitable[None]],
+        user_id: str | None = None
+    ) -> AnalysisRun:
+        """
+        Start a pipeline task publishing to a new run.
+
+        Args:
+            pipeline: Called with the run's publish callback; returns the pipeline coroutine
+            user_id: Owner of the analysis (checked on reconnect)
+
+        Returns:
+            The run to subscribe to
+        """
+        run = AnalysisRun(user_id=user_id, on_bind=self._on_bind)
+        task = asyncio.create_task(pipeline(run.publish))
+        self._tasks[task] = run
+        task.add_done_callback(self._on_done)
+        return run
+
+    def get(self, analysis_id: int) -> AnalysisRun | None:
+        """Get the in-memory run of an analysis, if this worker still holds it."""
+        return self._runs.get(analysis_id)
+
+    def _on_bind(self, run: AnalysisRun) -> None:
+        self._runs[run.analysis_id] = run
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Close a finished pipeline's run if it did not send a terminal event, then expire it."""
+        run = self._tasks.pop(task)
+        if not run.closed:
+            if task.cancelled():
+                message = "Analysis was cancelled"
+            elif task.exception() is not None:
+                message = str(task.exception())
+                logger.error(f"Analysis pipeline failed: {message}")
+            else:
+                message = "Analysis ended without a result"
+            run._append(SSEErrorEvent(message=message))
+            run.schedule_flush()
+        if run.analysis_id is not None:
+            asyncio.get_running_loop().call_later(self.retention_seconds, self._expire, run)
+
+    def _expire(self, run: AnalysisRun) -> None:
+        """Forget a finished run and drop its logged events."""
+        if self._runs.get(run.analysis_id) is run:
+            del self._runs[run.analysis_id]
+        self._in_background(self._delete_logged(run.analysis_id))
+
+    @staticmethod
+    async def _delete_logged(analysis_id: int) -> None:
+        try:
+            async with session_scope() as db:
+                await AnalysisEventRepository.delete_for_analysis(db, analysis_id)
+        except Exception as e:
+            logger.error(f"Failed to delete events of analysis {analysis_id}: {e}")
+
+    def _in_background(self, coro: Awaitable[None]) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def close(self) -> None:
+        """Cancel running pipelines and wait for pending event log writes (app shutdown)."""
+        runs = [*self._tasks.values(), *self._runs.values()]
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*(run.flushed() for run in runs))
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        self._runs.clear()
+
+
+# Global instance
+analysis_event_bus = AnalysisEventBus(retention_seconds=settings.ANALYSIS_EVENTS_RETENTION_SECONDS)
@@ -3,15 +3,18 @@
 import asyncio
 import tempfile
 import os
+import shutil
+import time
 from dataclasses import dataclass
-from typing import Callable, Awaitable
-from datetime import datetime, timezone
+from typing import BinaryIO, Callable, Awaitable
 from ulid import ULID
 from pydub import AudioSegment
+from sqlalchemy.exc import IntegrityError
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.models import QuestionRepository, RecordingRepository, AnalysisResultRepository
+from app.config import settings
+from app.database import session_scope
+from app.models import QuestionRepository, AnalysisResultRepository
+from app.models.analysis import score_columns
 from app.services.storage_service import storage_service
 from app.services.ai.asr import transcribe_audio_openai_from_bytes, segment_audio_by_chunks_from_bytes
 from app.services.ai.llm import (
@@ -23,18 +26,30 @@ from app.services.ai.llm import (
     FullTranscript,
     ChunkInfo
 )
-from app.services.ai.elevenlabs import get_elevenlabs_service
-from app.schemas.sse import SSEStepEvent, SSECompletedEvent, SSEErrorEvent
+from app.services.ai.elevenlabs import (
+    get_elevenlabs_service,
+    DEFAULT_TTS_MODEL_ID,
+    DEFAULT_VOICE_SETTINGS,
+)
+from app.services.tts_cache import tts_cache, tts_cache_key
+from app.services.score_stats import question_stats_cache
+from app.services.tts_stream import tts_stream_registry
+from app.utils.audio_upload import file_path
+from app.utils.url_signing import sign_api_url
+from app.schemas.sse import SSEEvent, SSEStepEvent, SSECompletedEvent, SSEErrorEvent
 
 
 # Type alias for SSE event callback
-SSECallback = Callable[[str], Awaitable[None]]
+SSECallback = Callable[[SSEEvent], Awaitable[None]]
+
+# Joins chunk texts for combined TTS; a paragraph break gives a natural pause between chunks
+COMBINED_TTS_SEPARATOR = "\n\n"
 
 
 @dataclass
 class AudioFile:
     """Audio file data from upload."""
-    data: bytes
+    file: BinaryIO  # the spooled upload itself for large files; closed when the pipeline ends
     filename: str
     content_type: str
     
@@ -54,9 +69,29 @@ class AudioFile:
         return type_map.get(self.content_type, 'webm')
 
 
+@dataclass
+class StoredAudio:
+    """Audio the client already uploaded to storage via a presigned PUT URL."""
+    object_key: str
+    recording_id: str
+    content_type: str
+    
+    @property
+    def filename(self) -> str:
+        """Get the object's file name (keeps the extension for format detection)."""
+        return self.object_key.rsplit('/', 1)[-1]
+
+
+@dataclass
+class ChunkAudio:
+    """Cloned-voice audio generated for one chunk."""
+    url: str
+    object_key: str
+    time_range: list[float] | None = None  # [start, end] when object_key is shared by all chunks
+
+
 async def run_streaming_analysis(
-    db: AsyncSession,
-    audio_file: AudioFile,
+    audio_file: AudioFile | StoredAudio,
     question_id: str,
     send_event: SSECallback,
     user_id: str | None = None
@@ -70,32 +105,54 @@ async def run_streaming_analysis(
     3. AI analysis (chunking + parallel analysis)
     4. Generate and save report
     
+    Database sessions are opened only around the writes at the start and
+    end, so no pooled connection is held during the provider calls.
+    
     Args:
-        db: Database session
-        audio_file: Audio file with data, filename and content_type
+        audio_file: Uploaded audio, or a reference to audio the client uploaded to storage
         question_id: The question ID being answered
-        send_event: Async callback to send SSE events to client
+        send_event: Async callback publishing each progress event
         user_id: The authenticated user's ID (from Supabase auth)
     """
-    recording = None
-    analysis = None
+    analysis_id = None
     mp3_data = None
     
     try:
         # ========== STEP 1: UPLOADING ==========
         
         # Verify question exists
-        question = await QuestionRepository.get_by_id(db, question_id)
+        async with session_scope() as db:
+            question = await QuestionRepository.get_by_id(db, question_id)
         if not question:
             raise ValueError(f"Question {question_id} not found")
         
-        await send_event(SSEStepEvent(type="uploading", status="start").to_sse())
-        
-        # Convert audio to MP3 for storage (in background while we proceed)
-        mp3_data = await convert_audio_to_mp3(audio_file.data)
+        await send_event(SSEStepEvent(type="uploading", status="start"))
+        
+        uploaded_key = None
+        if isinstance(audio_file, StoredAudio):
+            # Direct upload: the recording ID was issued with the upload URL
+            recording_id = audio_file.recording_id
+            uploaded_key = audio_file.object_key
+            # Streamed to a temp file (never held in memory), stopping at the size limit
+            # in case the object was replaced after POST /analysis checked it
+            audio_file = AudioFile(
+                file=await storage_service.download_to_file(
+                    storage_service.bucket_recordings,
+                    audio_file.object_key,
+                    max_bytes=settings.MAX_UPLOAD_BYTES
+                ),
+                filename=audio_file.filename,
+                content_type=audio_file.content_type
+            )
+        else:
+            # Generate recording_id using ULID format
+            recording_id = f"recording_{ULID()}"
         
-        # Generate recording_id using ULID format
-        recording_id = f"recording_{ULID()}"
+        # Convert audio to MP3 for storage; also enforces the duration limit
+        # before any paid provider call
+        mp3_data = await convert_audio_to_mp3(
+            audio_file.file, max_duration_seconds=settings.MAX_AUDIO_DURATION_SECONDS
+        )
         
         # Generate object key: recordings/{user_id}/{question_id}/{recording_id}.mp3
         user_folder = user_id if user_id else "anonymous"
@@ -109,30 +166,32 @@ async def run_streaming_analysis(
             content_type="audio/mpeg"
         )
         
-        # Create recording record using repository (with user ownership and explicit recording_id)
-        recording = await RecordingRepository.create(
-            db, 
-            question_id=question_id, 
-            audio_url=object_key, 
-            user_id=user_id,
-            recording_id=recording_id
-        )
-        
-        # Create analysis record using repository (with user and question references)
-        analysis = await AnalysisResultRepository.create(
-            db, 
-            recording_id=recording.recording_id, 
-            user_id=user_id,
-            question_id=question_id,
-            status="processing"
-        )
-        
-        await db.commit()
+        if uploaded_key is not None:
+            # The converted MP3 replaces the raw upload
+            try:
+                await storage_service.delete_object(storage_service.bucket_recordings, uploaded_key)
+            except Exception as e:
+                print(f"[Upload] Cleanup warning for {uploaded_key}: {e}")
+        
+        # Create the recording and analysis records in one statement (with user ownership)
+        try:
+            async with session_scope() as db:
+                analysis_id = await AnalysisResultRepository.create_with_recording(
+                    db,
+                    recording_id=recording_id,
+                    question_id=question_id,
+                    audio_url=object_key,
+                    user_id=user_id,
+                    status="processing"
+                )
+        except IntegrityError:
+            # Concurrent resubmission of the same direct upload (POST /analysis checks up front)
+            raise ValueError(f"Recording {recording_id} was already submitted")
         
-        await send_event(SSEStepEvent(type="uploading", status="completed").to_sse())
+        await send_event(SSEStepEvent(type="uploading", status="completed", analysis_id=analysis_id))
         
         # ========== STEP 2: PARALLEL ASR + FULL AUDIO ANALYSIS ==========
-        await send_event(SSEStepEvent(type="transcribing", status="start").to_sse())
+        await send_event(SSEStepEvent(type="transcribing", status="start"))
         
         question_instruction = question.instruction if question else ""
         
@@ -147,7 +206,7 @@ async def run_streaming_analysis(
         # Voice cloning can happen early since we have mp3_data ready
         asr_task = asyncio.create_task(
             transcribe_audio_openai_from_bytes(
-                audio_file.data, 
+                audio_file.file, 
                 filename=audio_file.filename
             )
         )
@@ -155,17 +214,17 @@ async def run_streaming_analysis(
             analyze_full_audio_unified(full_audio_url, question_instruction)
         )
         voice_clone_task = asyncio.create_task(
-            clone_user_voice(mp3_data, recording.recording_id)
+            clone_user_voice(mp3_data, recording_id)
         )
         
         # Wait for ASR to complete (chunking and extensions depend on it)
         # Note: full_audio_task and voice_clone_task continue running in the background
         transcript_data = await asr_task
         
-        await send_event(SSEStepEvent(type="transcribing", status="completed").to_sse())
+        await send_event(SSEStepEvent(type="transcribing", status="completed"))
         
         # ========== STEP 3: PARALLEL CHUNKING + VIEWPOINT EXTENSIONS ==========
-        await send_event(SSEStepEvent(type="analyzing", status="start").to_sse())
+        await send_event(SSEStepEvent(type="analyzing", status="start"))
         
         # Start both chunking and extensions in parallel (both need transcript)
         chunking_task = asyncio.create_task(
@@ -217,27 +276,27 @@ async def run_streaming_analysis(
         # It may already be complete, or we wait for the remaining time
         global_evaluation = await full_audio_task
         
-        await send_event(SSEStepEvent(type="analyzing", status="completed").to_sse())
+        await send_event(SSEStepEvent(type="analyzing", status="completed"))
         
         # ========== STEP 5: GENERATING REPORT ==========
-        await send_event(SSEStepEvent(type="generating", status="start").to_sse())
+        await send_event(SSEStepEvent(type="generating", status="start"))
 
         # Wait for voice cloning to complete (started in Step 2)
         voice_id = await voice_clone_task
         
-        # Generate TTS audio for all chunks in parallel
+        # Generate TTS audio for all chunks (per TTS_MODE)
         if voice_id:
-            cloned_audio_urls = await generate_chunk_tts_parallel(
+            cloned_audio = await generate_chunk_tts(
                 voice_id=voice_id,
                 chunks=chunk_structure["chunks"],
                 chunk_feedbacks=chunk_feedbacks,
-                recording_id=recording.recording_id,
+                recording_id=recording_id,
                 question_id=question_id
             )
         else:
             # Voice cloning failed or not configured - skip TTS
             print(f"[TTS] Skipping TTS generation (no voice_id)")
-            cloned_audio_urls = [None] * len(chunk_structure["chunks"])
+            cloned_audio = [None] * len(chunk_structure["chunks"])
 
         # Build chunks with time_range (frontend uses this to play from original audio)
         chunks = []
@@ -249,7 +308,9 @@ async def run_streaming_analysis(
                     time_range=[chunk_info["start"], chunk_info["end"]],
                     text=chunk_info["text"],
                     feedback_structured=chunk_feedbacks[i],
-                    cloned_audio_url=cloned_audio_urls[i]
+                    cloned_audio_url=cloned_audio[i].url if cloned_audio[i] else None,
+                    cloned_audio_range=cloned_audio[i].time_range if cloned_audio[i] else None,
+                    cloned_audio_key=cloned_audio[i].object_key if cloned_audio[i] else None
                 )
             )
         
@@ -267,82 +328,105 @@ async def run_streaming_analysis(
             viewpoint_extensions=viewpoint_extensions
         )
         
-        report_dict = final_report.model_dump()
+        # Save to database using repository, ranking the scores against
+        # earlier attempts at this question before this one is counted
+        async with session_scope() as db:
+            scores = score_columns(final_report.model_dump(include={"global_evaluation"}))
+            final_report.score_percentiles = await question_stats_cache.percentiles(db, question_id, scores)
+            report_dict = final_report.model_dump()
+            completed = await AnalysisResultRepository.mark_completed(db, analysis_id, report_dict)
+            commit_started = time.monotonic()
+        if completed:
+            question_stats_cache.record(question_id, scores, commit_started)
         
-        # Save to database using repository
-        await AnalysisResultRepository.update_completed(db, analysis, report_dict)
-        await db.commit()
-        
-        await send_event(SSEStepEvent(type="generating", status="completed").to_sse())
+        await send_event(SSEStepEvent(type="generating", status="completed"))
         
         # ========== COMPLETED ==========
         # Reuse the presigned URL from step 3 (full_audio_url) for frontend playback
         await send_event(SSECompletedEvent(
             report=report_dict,
-            recording_id=recording.recording_id,
+            recording_id=recording_id,
             audio_url=full_audio_url
-        ).to_sse())
+        ))
         
+    except asyncio.CancelledError:
+        # App shutdown: without this the analysis would stay "processing" forever
+        await _report_failure(send_event, analysis_id, "Analysis was interrupted by a server restart")
+        raise
+    
     except Exception as e:
-        # Rollback any failed transaction first
-        await db.rollback()
-        
-        # Determine which step failed based on current state
-        error_step = None
-        if recording is None:
-            error_step = "uploading"
-        elif analysis is None:
-            error_step = "uploading"
-        else:
-            error_step = "analyzing"
-        
-        # Update analysis status if it exists
-        if analysis:
-            try:
-                # Re-fetch the analysis object after rollback
-                analysis_obj = await AnalysisResultRepository.get_by_id(db, analysis.id)
-                if analysis_obj:
-                    await AnalysisResultRepository.update_failed(db, analysis_obj, str(e))
-                    await db.commit()
-            except Exception:
-                # If updating status fails, just log and continue
-                pass
-        
-        # Send error event
-        await send_event(SSEErrorEvent(
-            message=str(e),
-            step=error_step
-        ).to_sse())
-
-
-async def convert_audio_to_mp3(audio_data: bytes) -> bytes:
+        await _report_failure(send_event, analysis_id, str(e))
+    
+    finally:
+        if isinstance(audio_file, AudioFile):
+            audio_file.file.close()
+
+
+async def _report_failure(send_event: SSECallback, analysis_id: int | None, message: str) -> None:
+    """Mark the analysis failed (if it was created) and send the error event."""
+    # Determine which step failed based on current state
+    error_step = "uploading" if analysis_id is None else "analyzing"
+    
+    # Update analysis status if it exists
+    if analysis_id is not None:
+        try:
+            async with session_scope() as db:
+                await AnalysisResultRepository.mark_failed(db, analysis_id, message)
+        except Exception:
+            # If updating status fails, just log and continue
+            pass
+    
+    # Send error event
+    await send_event(SSEErrorEvent(
+        message=message,
+        step=error_step
+    ))
+
+
+async def convert_audio_to_mp3(
+    audio: BinaryIO,
+    max_duration_seconds: float | None = None
+) -> bytes:
     """
     Convert audio data (WebM/MP4/OGG) to MP3 format.
     
     Args:
-        audio_data: Raw audio bytes from browser
+        audio: Raw audio file from browser (read by ffmpeg in place when on disk)
+        max_duration_seconds: Reject audio longer than this (ValueError)
         
     Returns:
         MP3 audio bytes
     """
     # Run in thread pool to avoid blocking
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _convert_audio_sync, audio_data)
+    return await loop.run_in_executor(None, _convert_audio_sync, audio, max_duration_seconds)
 
 
-def _convert_audio_sync(audio_data: bytes) -> bytes:
+def _convert_audio_sync(audio: BinaryIO, max_duration_seconds: float | None = None) -> bytes:
     """Synchronous audio conversion helper."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as temp_input:
-        temp_input.write(audio_data)
-        temp_input_path = temp_input.name
+    # Spooled uploads are read by ffmpeg where they are; in-memory audio is written out
+    source_path = file_path(audio)
+    temp_input_path = None
+    if source_path is None:
+        audio.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as temp_input:
+            shutil.copyfileobj(audio, temp_input)
+            temp_input_path = source_path = temp_input.name
 
     temp_output_path = None
     try:
-        # Load audio with pydub (auto-detects format)
-        audio_segment = AudioSegment.from_file(temp_input_path)
+        # Load audio with pydub (auto-detects format). Browser WebM often has no
+        # duration header, so decode at most one second past the limit and measure.
+        if max_duration_seconds is None:
+            audio_segment = AudioSegment.from_file(source_path)
+        else:
+            audio_segment = AudioSegment.from_file(source_path, duration=max_duration_seconds + 1)
+            if len(audio_segment) > max_duration_seconds * 1000:
+                raise ValueError(f"Recording is longer than {max_duration_seconds:g} seconds")
 
         # Export as MP3
-        temp_output_path = temp_input_path.replace('.tmp', '.mp3')
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_output:
+            temp_output_path = temp_output.name
         audio_segment.export(temp_output_path, format="mp3")
 
         # Read MP3 data
@@ -350,7 +434,7 @@ def _convert_audio_sync(audio_data: bytes) -> bytes:
             return mp3_file.read()
     finally:
         # Clean up temp files
-        if os.path.exists(temp_input_path):
+        if temp_input_path and os.path.exists(temp_input_path):
             os.remove(temp_input_path)
         if temp_output_path and os.path.exists(temp_output_path):
             os.remove(temp_output_path)
@@ -370,8 +454,6 @@ async def clone_user_voice(
     Returns:
         voice_id if successful, None if failed or not configured
     """
-    from app.config import settings
-    
     if not settings.ELEVENLABS_API_KEY:
         print("[Voice Clone] ⚠️  ElevenLabs API key not configured - skipping")
         return None
@@ -402,7 +484,7 @@ async def _generate_single_chunk_tts(
     chunk_index: int,
     recording_id: str,
     question_id: str
-) -> str | None:
+) -> ChunkAudio | None:
     """
     Generate TTS for a single chunk (for parallel execution).
     
@@ -411,11 +493,14 @@ async def _generate_single_chunk_tts(
         chunk_info: Chunk metadata (text, time_range, etc.)
         chunk_feedback: ChunkFeedbackStructured with corrected_text
         chunk_index: Index of this chunk
-        recording_id: Recording ID for file naming
-        question_id: Question ID for file naming
+        recording_id: Recording ID this chunk belongs to
+        question_id: Question ID this chunk belongs to
         
     Returns:
-        Presigned URL for the TTS audio, or None if failed
+        ChunkAudio with presigned URL for the TTS audio, or None if failed
+        
+    Audio is stored under its content-addressed key (see app.services.tts_cache)
+    without a lookup first: the recording is new, so the key cannot exist yet.
     """
     try:
         elevenlabs = get_elevenlabs_service()
@@ -427,29 +512,25 @@ async def _generate_single_chunk_tts(
         # Generate speech with cloned voice
         audio_data = await elevenlabs.text_to_speech(
             text=corrected_text,
-            voice_id=voice_id
+            voice_id=voice_id,
+            model_id=DEFAULT_TTS_MODEL_ID,
+            voice_settings=DEFAULT_VOICE_SETTINGS
         )
         print(f"[TTS] Chunk {chunk_index}: Generated {len(audio_data)} bytes")
         
-        # Upload to storage
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        object_key = f"cloned/{question_id}/{recording_id}/chunk_{chunk_index}_{timestamp}.mp3"
-        
-        await storage_service.upload_audio(
-            bucket=storage_service.bucket_recordings,
-            object_key=object_key,
-            data=audio_data,
-            content_type="audio/mpeg"
+        cache_key = tts_cache_key(
+            recording_id, DEFAULT_TTS_MODEL_ID, DEFAULT_VOICE_SETTINGS, corrected_text
         )
+        tts_object = await tts_cache.store(cache_key, audio_data)
         
         # Get presigned URL
         url = storage_service.get_presigned_url(
             bucket=storage_service.bucket_recordings,
-            object_key=object_key
+            object_key=tts_object.object_key
         )
         
         print(f"[TTS] Chunk {chunk_index}: ✓ Complete!")
-        return url
+        return ChunkAudio(url=url, object_key=tts_object.object_key)
         
     except Exception as e:
         print(f"[TTS] Chunk {chunk_index}: ✗ Failed - {e}")
@@ -462,7 +543,7 @@ async def generate_chunk_tts_parallel(
     chunk_feedbacks: list,
     recording_id: str,
     question_id: str
-) -> list[str | None]:
+) -> list[ChunkAudio | None]:
     """
     Generate TTS for all chunks in parallel using cloned voice.
     
@@ -474,7 +555,7 @@ async def generate_chunk_tts_parallel(
         question_id: Question ID for file naming
         
     Returns:
-        List of presigned URLs for TTS audio (one per chunk)
+        List of ChunkAudio for TTS audio (one per chunk, None if failed)
     """
     print(f"[TTS] Generating audio for {len(chunks)} chunks in parallel...")
     
@@ -494,15 +575,203 @@ async def generate_chunk_tts_parallel(
     # Execute all in parallel
     results = await asyncio.gather(*tasks)
     
-    # Cleanup voice after all chunks complete
-    try:
-        elevenlabs = get_elevenlabs_service()
-        await elevenlabs.delete_voice(voice_id)
-        print(f"[TTS] ✓ Cleaned up voice {voice_id}")
-    except Exception as e:
-        print(f"[TTS] Cleanup warning: {e}")
-    
-    successful_count = sum(1 for url in results if url)
+    successful_count = sum(1 for audio in results if audio)
     print(f"[TTS] ✓ Complete! Generated {successful_count}/{len(chunks)} audio files")
     
     return results
+
+
+def split_alignment_by_chunks(
+    texts: list[str],
+    alignment: dict,
+    separator: str = COMBINED_TTS_SEPARATOR
+) -> list[list[float] | None]:
+    """
+    Split a combined TTS alignment into per-chunk time ranges.
+    
+    Chunk texts are joined with `separator` before synthesis, so each chunk
+    maps to a known character span of the alignment. Adjacent chunks are
+    split at the midpoint of the pause between them (chunks end on sentence
+    boundaries), so no clip cuts into a neighbouring word.
+    
+    Args:
+        texts: Text of each chunk, in synthesis order
+        alignment: ElevenLabs alignment with character start/end times
+        separator: String used to join the chunk texts
+        
+    Returns:
+        [start, end] in seconds for each chunk, or None for empty chunks
+        
+    Raises:
+        ValueError: If the alignment does not match the combined text
+    """
+    start_times = alignment["character_start_times_seconds"]
+    end_times = alignment["character_end_times_seconds"]
+    combined_text = separator.join(texts)
+    if len(start_times) != len(combined_text) or len(end_times) != len(combined_text):
+        raise ValueError(
+            f"Alignment length {len(start_times)} does not match text length {len(combined_text)}"
+        )
+    
+    # Raw spoken span of each chunk from its first and last character
+    raw_ranges: list[list[float] | None] = []
+    offset = 0
+    for text in texts:
+        if text:
+            raw_ranges.append([start_times[offset], end_times[offset + len(text) - 1]])
+        else:
+            raw_ranges.append(None)
+        offset += len(text) + len(separator)
+    
+    # Move each boundary between neighbouring chunks to the middle of the pause
+    ranges = [list(r) if r else None for r in raw_ranges]
+    spoken = [i for i, r in enumerate(raw_ranges) if r]
+    for prev, nxt in zip(spoken, spoken[1:]):
+        boundary = (raw_ranges[prev][1] + raw_ranges[nxt][0]) / 2
+        ranges[prev][1] = boundary
+        ranges[nxt][0] = boundary
+    
+    return [[round(r[0], 3), round(r[1], 3)] if r else None for r in ranges]
+
+
+async def generate_chunk_tts_combined(
+    voice_id: str,
+    chunks: list[dict],
+    chunk_feedbacks: list,
+    recording_id: str,
+    question_id: str
+) -> list[ChunkAudio | None]:
+    """
+    Generate TTS for all chunks with a single ElevenLabs call.
+    
+    All corrected texts are synthesized in one with-timestamps request and
+    uploaded as one combined file; the alignment is split locally into
+    per-chunk time ranges for the frontend to play from that file.
+    
+    Args:
+        voice_id: ElevenLabs voice ID (already cloned)
+        chunks: Chunk structure from chunking
+        chunk_feedbacks: Feedback for each chunk (with corrected_text)
+        recording_id: Recording ID this audio belongs to
+        question_id: Question ID this audio belongs to
+        
+    Returns:
+        ChunkAudio per chunk sharing the combined file, None for empty chunks
+    """
+    texts = [feedback.corrected_text.strip() for feedback in chunk_feedbacks]
+    combined_text = COMBINED_TTS_SEPARATOR.join(texts)
+    print(f"[TTS] Generating combined audio for {len(chunks)} chunks ({len(combined_text)} chars)...")
+    
+    elevenlabs = get_elevenlabs_service()
+    audio_data, alignment = await elevenlabs.text_to_speech_with_timestamps(
+        text=combined_text,
+        voice_id=voice_id,
+        model_id=DEFAULT_TTS_MODEL_ID,
+        voice_settings=DEFAULT_VOICE_SETTINGS
+    )
+    print(f"[TTS] Combined: Generated {len(audio_data)} bytes")
+    ranges = split_alignment_by_chunks(texts, alignment)
+    
+    # Stored without a lookup (the recording is new); mode is part of the key,
+    # so a combined file never collides with a single-chunk file
+    cache_key = tts_cache_key(
+        recording_id, DEFAULT_TTS_MODEL_ID, DEFAULT_VOICE_SETTINGS, f"combined:{combined_text}"
+    )
+    tts_object = await tts_cache.store(cache_key, audio_data)
+    
+    url = storage_service.get_presigned_url(
+        bucket=storage_service.bucket_recordings,
+        object_key=tts_object.object_key
+    )
+    results = [
+        ChunkAudio(url=url, object_key=tts_object.object_key, time_range=time_range)
+        if time_range else None
+        for time_range in ranges
+    ]
+    
+    print(f"[TTS] ✓ Complete! Combined audio covers {sum(1 for r in results if r)}/{len(chunks)} chunks")
+    return results
+
+
+def register_chunk_tts_stream(
+    voice_id: str,
+    chunk_feedbacks: list,
+    recording_id: str
+) -> list[ChunkAudio | None]:
+    """
+    Defer TTS to on-demand streaming (TTS_MODE=stream).
+    
+    The cloned voice is kept alive in the stream registry, and each chunk
+    gets a signed URL to GET /recordings/{id}/chunks/{i}/tts, which streams
+    audio on first play and serves it from storage afterwards.
+    
+    Args:
+        voice_id: ElevenLabs voice ID (already cloned)
+        chunk_feedbacks: Feedback for each chunk (with corrected_text)
+        recording_id: Recording ID the chunks belong to
+        
+    Returns:
+        ChunkAudio per chunk pointing at the streaming endpoint, None for empty chunks
+    """
+    texts = [feedback.corrected_text.strip() for feedback in chunk_feedbacks]
+    object_keys = tts_stream_registry.register(
+        recording_id, voice_id, texts, settings.TTS_STREAM_VOICE_TTL_SECONDS
+    )
+    print(f"[TTS] Registered voice {voice_id} for streaming {len(texts)} chunks")
+    return [
+        ChunkAudio(
+            url=sign_api_url(f"/recordings/{recording_id}/chunks/{i}/tts"),
+            object_key=object_keys[i]
+        ) if text else None
+        for i, text in enumerate(texts)
+    ]
+
+
+async def generate_chunk_tts(
+    voice_id: str,
+    chunks: list[dict],
+    chunk_feedbacks: list,
+    recording_id: str,
+    question_id: str
+) -> list[ChunkAudio | None]:
+    """
+    Generate TTS for all chunks using the configured TTS_MODE, then delete the voice.
+    
+    "combined" makes one ElevenLabs call for the whole recording and falls back
+    to "per_chunk" (one call per chunk, in parallel) if it fails. "stream"
+    hands the voice to the stream registry, which deletes it after its TTL.
+    
+    Args:
+        voice_id: ElevenLabs voice ID (already cloned)
+        chunks: Chunk structure from chunking
+        chunk_feedbacks: Feedback for each chunk (with corrected_text)
+        recording_id: Recording ID for file naming
+        question_id: Question ID for file naming
+        
+    Returns:
+        ChunkAudio per chunk (None where TTS failed)
+    """
+    if settings.TTS_MODE == "stream":
+        return register_chunk_tts_stream(voice_id, chunk_feedbacks, recording_id)
+    
+    try:
+        if settings.TTS_MODE == "combined":
+            try:
+                return await generate_chunk_tts_combined(
+                    voice_id, chunks, chunk_feedbacks, recording_id, question_id
+                )
+            except Exception as e:
+                print(f"[TTS] Combined mode failed, falling back to per-chunk: {e}")
+        
+        return await generate_chunk_tts_parallel(
+            voice_id, chunks, chunk_feedbacks, recording_id, question_id
+        )
+    
+    finally:
+        # Cleanup voice after all chunks complete
+        try:
+            elevenlabs = get_elevenlabs_service()
+            await elevenlabs.delete_voice(voice_id)
+            print(f"[TTS] ✓ Cleaned up voice {voice_id}")
+        except Exception as e:
+            print(f"[TTS] Cleanup warning: {e}")
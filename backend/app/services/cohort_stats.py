@@ -0,0 +1,55 @@
+"""Background refresh of the cohort dashboard materialized views."""
+
+import asyncio
+import logging
+
+from app.config import settings
+from app.database import session_scope
+from app.models import CohortRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CohortStatsRefresher:
+    """Periodically refreshes the cohort views from a background task."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the refresh loop (no-op if the interval is 0)."""
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep the loop alive; the views are just staler until the next run
+                logger.error(f"Cohort stats refresh failed: {e}")
+
+    async def refresh(self) -> None:
+        """Refresh all cohort views now."""
+        async with session_scope() as db:
+            refreshed = await CohortRepository.refresh_views(db)
+        if refreshed:
+            logger.info("Refreshed cohort stats views")
+        else:
+            logger.debug("Cohort stats refresh already running in another worker")
+
+    async def close(self) -> None:
+        """Stop the refresh loop (app shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global instance
+cohort_stats_refresher = CohortStatsRefresher(interval_seconds=settings.COHORT_STATS_REFRESH_SECONDS)
@@ -0,0 +1,112 @@
+"""In-process cache of the question catalog.
+
+The catalog is small and changes rarely, but GET /questions is the most
+requested endpoint. Each worker keeps a sorted snapshot of all questions
+for QUESTION_CATALOG_TTL_SECONDS and serves pages from memory. Writes in
+this process invalidate it immediately; writes elsewhere (seeding, other
+workers) show up once the TTL expires.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import QuestionRepository
+from app.schemas import QuestionResponse
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """An immutable view of all questions, sorted by question_id."""
+    questions: list[QuestionResponse]
+    etag: str
+    loaded_at: float
+    ids: list[str] = field(repr=False)
+    by_id: dict[str, QuestionResponse] = field(repr=False)
+
+    @classmethod
+    def build(cls, questions: list[QuestionResponse]) -> "CatalogSnapshot":
+        """Sort questions and derive the content hash used as the ETag."""
+        questions = sorted(questions, key=lambda q: q.question_id)
+        digest = hashlib.sha256()
+        for question in questions:
+            digest.update(question.model_dump_json().encode("utf-8"))
+            digest.update(b"\n")
+        return cls(
+            questions=questions,
+            etag=f'W/"{digest.hexdigest()[:32]}"',
+            loaded_at=time.monotonic(),
+            ids=[q.question_id for q in questions],
+            by_id={q.question_id: q for q in questions},
+        )
+
+    def page(self, after: str | None, skip: int, limit: int) -> tuple[list[QuestionResponse], str | None]:
+        """
+        Get a page of questions.
+
+        Args:
+            after: Keyset cursor; return questions with question_id > after
+            skip: Offset applied after the cursor (legacy offset pagination)
+            limit: Maximum number of questions
+
+        Returns:
+            Tuple of (questions, cursor for the next page or None)
+        """
+        start = bisect.bisect_right(self.ids, after) if after is not None else 0
+        start += skip
+        page = self.questions[start:start + limit]
+        has_more = start + limit < len(self.questions)
+        return page, page[-1].question_id if page and has_more else None
+
+
+class QuestionCatalog:
+    """Process-wide TTL cache of the question catalog."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._lock = asyncio.Lock()
+        # Bumped by invalidate() so a reload that raced a write is not cached
+        self._generation = 0
+
+    def _fresh(self) -> CatalogSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl_seconds:
+            return snapshot
+        return None
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """
+        Get the current catalog, loading it from the database if stale.
+
+        Concurrent callers during a reload wait for the same query.
+
+        Args:
+            db: Database session used on a cache miss
+        """
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._fresh()
+            if snapshot is None:
+                generation = self._generation
+                rows = await QuestionRepository.get_all(db)
+                snapshot = CatalogSnapshot.build([QuestionResponse.model_validate(q) for q in rows])
+                if generation == self._generation:
+                    self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached catalog (call after committing a question write)."""
+        self._generation += 1
+        self._snapshot = None
+
+
+# Global instance
+question_catalog = QuestionCatalog(ttl_seconds=settings.QUESTION_CATALOG_TTL_SECONDS)
@@ -0,0 +1,82 @@
+"""In-process cache of per-question score distributions.
+
+Percentile ranks are computed on every completed analysis and every
+GET /questions/{id}/stats, so each worker keeps the histograms it has read
+for QUESTION_STATS_CACHE_TTL_SECONDS. Completions in this process are
+folded into the cached copy immediately, unless that copy was loaded while
+the completion was committing (it may already count it) in which case it is
+dropped; completions in other workers show up once the TTL expires.
+"""
+
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import QuestionScoreStatsRepository, ScoreDistribution
+
+
+class QuestionStatsCache:
+    """Process-wide TTL cache of question score distributions."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # question_id -> (distribution, loaded_at)
+        self._entries: dict[str, tuple[ScoreDistribution, float]] = {}
+
+    async def get(self, db: AsyncSession, question_id: str) -> ScoreDistribution:
+        """
+        Get a question's score distribution, loading it if stale.
+
+        Args:
+            db: Database session used on a cache miss
+            question_id: Question ID
+
+        Returns:
+            The distribution (empty if no attempt has been recorded)
+        """
+        entry = self._entries.get(question_id)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            return entry[0]
+        distribution = await QuestionScoreStatsRepository.get(db, question_id)
+        if distribution is None:
+            distribution = ScoreDistribution.empty(question_id)
+        self._entries[question_id] = (distribution, time.monotonic())
+        return distribution
+
+    def record(self, question_id: str, scores: dict, commit_started: float) -> None:
+        """
+        Fold a committed completion into the cached copy (keeps its load time).
+
+        Args:
+            question_id: Question ID
+            scores: Score columns of the completed analysis
+            commit_started: time.monotonic() taken just before the completion's commit
+        """
+        entry = self._entries.get(question_id)
+        if entry is None:
+            return
+        distribution, loaded_at = entry
+        if loaded_at < commit_started:
+            # Loaded before the commit, so it cannot include this completion
+            self._entries[question_id] = (distribution.with_attempt(scores), loaded_at)
+        else:
+            # Reloaded around the commit: it may already count this completion
+            del self._entries[question_id]
+
+    async def percentiles(self, db: AsyncSession, question_id: str, scores: dict) -> dict[str, float] | None:
+        """
+        Rank scores against the earlier attempts at a question.
+
+        Returns:
+            Percentile rank per score dimension, or None while the question
+            has fewer than QUESTION_STATS_MIN_ATTEMPTS attempts
+        """
+        distribution = await self.get(db, question_id)
+        if distribution.attempt_count < settings.QUESTION_STATS_MIN_ATTEMPTS:
+            return None
+        return distribution.percentiles(scores)
+
+
+# Global instance
+question_stats_cache = QuestionStatsCache(ttl_seconds=settings.QUESTION_STATS_CACHE_TTL_SECONDS)
@@ -1,64 +1,260 @@
-"""Supabase Storage service for audio files using S3 compatible API."""
+"""Storage service for audio files.
 
+Two backends share one interface, selected by STORAGE_BACKEND:
+- "s3": Supabase Storage (or any S3 compatible endpoint) via boto3
+- "local": a directory on local disk, served by the /storage endpoint
+"""
+
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import partial
 from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
 
 import boto3
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from app.config import settings
+from app.utils.url_signing import sign_api_url
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streamed downloads
+STREAM_CHUNK_BYTES = 1024 * 1024
+
 
-class StorageService:
-    """Service for interacting with Supabase Storage via S3 compatible API."""
+class PresignedUrlCache:
+    """Bounded LRU cache of presigned URLs that honours their expiry.
+    
+    A cached URL is handed out until `min_remaining` seconds (at most half
+    its lifetime) before it expires, so repeated calls return the same URL,
+    which browsers and CDNs can cache, and every URL returned still has at
+    least that long to live.
+    """
+    
+    def __init__(self, max_entries: int, min_remaining: int):
+        self.max_entries = max_entries
+        self.min_remaining = min_remaining
+        # (bucket, object_key, expires_in) -> (url, expires_at), in LRU order
+        self._entries: OrderedDict[tuple[str, str, int], tuple[str, float]] = OrderedDict()
+    
+    def get(self, bucket: str, object_key: str, expires_in: int) -> str | None:
+        """Get a cached URL that is still valid for at least min_remaining seconds."""
+        key = (bucket, object_key, expires_in)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        url, expires_at = entry
+        # Short-lived URLs are still reused for the first half of their lifetime
+        margin = min(self.min_remaining, expires_in // 2)
+        if time.time() >= expires_at - margin:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return url
+    
+    def put(self, bucket: str, object_key: str, expires_in: int, url: str, signed_at: float) -> None:
+        """Cache a URL signed at `signed_at`, evicting the least recently used entry if full."""
+        key = (bucket, object_key, expires_in)
+        self._entries[key] = (url, signed_at + expires_in)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached URLs."""
+        self._entries.clear()
+
+
+class StorageService(ABC):
+    """Base class for audio storage backends.
+    
+    Backends implement the blocking primitives; the async methods run them on
+    a bounded, dedicated thread pool instead of blocking the event loop.
+    """
+    
+    # Buckets known to exist, shared process-wide so the existence check runs once per bucket
+    _verified_buckets: set[str] = set()
+    _verified_lock = threading.Lock()
     
     def __init__(self):
-        self._client = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._presigned_urls = PresignedUrlCache(
+            max_entries=settings.PRESIGNED_URL_CACHE_SIZE,
+            min_remaining=settings.PRESIGNED_URL_MIN_REMAINING_SECONDS
+        )
         self.bucket_questions = settings.STORAGE_BUCKET_QUESTIONS
         self.bucket_recordings = settings.STORAGE_BUCKET_RECORDINGS
     
     @property
-    def client(self):
-        """Lazy initialization of S3 client for Supabase Storage."""
-        if self._client is None:
-            if not settings.STORAGE_ACCESS_KEY or not settings.STORAGE_SECRET_KEY:
-                raise ValueError(
-                    "STORAGE_ACCESS_KEY and STORAGE_SECRET_KEY must be set. "
-                    "Run `supabase status` and copy keys from Storage (S3) section"
-                )
-            
-            self._client = boto3.client(
-                's3',
-                endpoint_url=settings.STORAGE_ENDPOINT,
-                aws_access_key_id=settings.STORAGE_ACCESS_KEY,
-                aws_secret_access_key=settings.STORAGE_SECRET_KEY,
-                region_name=settings.STORAGE_REGION,
-                config=BotoConfig(signature_version='s3v4')
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazy initialization of the thread pool used for storage I/O."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.STORAGE_MAX_WORKERS,
+                thread_name_prefix="storage"
             )
-        return self._client
+        return self._executor
+    
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking storage call on the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+    
+    def close(self) -> None:
+        """Shut down the storage thread pool (app shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    # ----- Backend primitives (blocking) -----
     
+    @abstractmethod
     def ensure_bucket(self, bucket: str) -> bool:
         """Ensure a specific bucket exists, create if not."""
-        try:
-            self.client.head_bucket(Bucket=bucket)
+    
+    @abstractmethod
+    def _put_object(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: str | None,
+        metadata: dict[str, str] | None
+    ) -> None:
+        """Write an object."""
+    
+    @abstractmethod
+    def _head_object(self, bucket: str, object_key: str) -> dict[str, str] | None:
+        """Get an object's user metadata, or None if it does not exist."""
+    
+    @abstractmethod
+    def _object_size(self, bucket: str, object_key: str) -> int | None:
+        """Get an object's size in bytes, or None if it does not exist."""
+    
+    @abstractmethod
+    def _iter_object(self, bucket: str, object_key: str) -> Iterator[bytes]:
+        """Read an object in chunks."""
+    
+    @abstractmethod
+    def _delete_object(self, bucket: str, object_key: str) -> None:
+        """Delete an object (no-op if it does not exist)."""
+    
+    @abstractmethod
+    def _sign_url(self, bucket: str, object_key: str, expires_in: int) -> str:
+        """Sign a fresh URL granting read access to an object."""
+    
+    @abstractmethod
+    def _sign_upload_url(self, bucket: str, object_key: str, content_type: str, expires_in: int) -> str:
+        """Sign a URL allowing a client to PUT an object directly."""
+    
+    @abstractmethod
+    def get_public_url(self, bucket: str, object_key: str) -> str:
+        """
+        Get public URL for a file in a public bucket.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+            
+        Returns:
+            Public URL for direct access
+        """
+    
+    @abstractmethod
+    def download_audio_sync(self, bucket: str, object_key: str) -> bytes:
+        """
+        Synchronous download of an audio file from Storage.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+            
+        Returns:
+            Audio file bytes
+        """
+    
+    @abstractmethod
+    def upload_audio_sync(
+        self,
+        bucket: str,
+        object_key: str,
+        file_path: str | None = None,
+        data: bytes | None = None,
+        content_type: str = "audio/mpeg"
+    ) -> str:
+        """
+        Synchronous upload from file path or bytes.
+        
+        Args:
+            bucket: Target bucket
+            object_key: Object path in bucket
+            file_path: Local file path (optional if data is provided)
+            data: Audio bytes (optional if file_path is provided)
+            content_type: MIME type
+        
+        Returns:
+            Object key
+        """
+    
+    # ----- Shared behaviour -----
+    
+    def upload_file_if_changed_sync(
+        self,
+        bucket: str,
+        object_key: str,
+        file_path: str | Path,
+        content_type: str = "audio/mpeg"
+    ) -> bool:
+        """
+        Upload a local file unless the stored object already has its content.
+        
+        The file's SHA-256 is stored as object metadata and compared on later
+        calls, so re-running a bulk import only transfers changed files.
+        Thread-safe; the caller must ensure the bucket exists.
+        
+        Args:
+            bucket: Target bucket
+            object_key: Object path in bucket
+            file_path: Local file to upload
+            content_type: MIME type
+            
+        Returns:
+            True if the file was uploaded, False if the object was already current
+        """
+        data = Path(file_path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        metadata = self._head_object(bucket, object_key)
+        if metadata is not None and metadata.get("sha256") == digest:
+            return False
+        self._put_object(bucket, object_key, data, content_type, None, {"sha256": digest})
+        return True
+    
+    @classmethod
+    def _mark_bucket_verified(cls, bucket: str) -> None:
+        """Remember that a bucket exists for the rest of the process."""
+        with cls._verified_lock:
+            cls._verified_buckets.add(bucket)
+    
+    async def ensure_bucket_async(self, bucket: str) -> bool:
+        """Async ensure_bucket(); free once the bucket has been verified."""
+        if bucket in self._verified_buckets:
             return True
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', '')
-            if error_code in ('404', 'NoSuchBucket'):
-                try:
-                    self.client.create_bucket(Bucket=bucket)
-                    logger.info(f"Created bucket: {bucket}")
-                    return True
-                except Exception as create_err:
-                    logger.error(f"Failed to create bucket {bucket}: {create_err}")
-                    return False
-            else:
-                logger.error(f"Error checking bucket {bucket}: {e}")
-                return False
+        return await self._run(self.ensure_bucket, bucket)
     
     def ensure_buckets(self):
         """Ensure all required buckets exist."""
@@ -70,7 +266,9 @@ class StorageService:
         bucket: str,
         object_key: str,
         data: bytes,
-        content_type: str = "audio/webm"
+        content_type: str = "audio/webm",
+        cache_control: str | None = None,
+        metadata: dict[str, str] | None = None
     ) -> str:
         """
         Upload audio file to Storage.
@@ -80,25 +278,95 @@ class StorageService:
             object_key: Object key (path) in the bucket
             data: Audio file bytes
             content_type: MIME type of the audio
+            cache_control: Optional Cache-Control header stored with the object
+            metadata: Optional user metadata stored with the object
             
         Returns:
             The object key for reference
         """
         try:
-            # Ensure bucket exists before upload
-            self.ensure_bucket(bucket)
+            # Ensure bucket exists before upload (memoized after the first check)
+            await self.ensure_bucket_async(bucket)
             
-            self.client.put_object(
-                Bucket=bucket,
-                Key=object_key,
-                Body=BytesIO(data),
-                ContentType=content_type
+            await self._run(
+                self._put_object, bucket, object_key, data, content_type, cache_control, metadata
             )
             return object_key
         except Exception as e:
             logger.error(f"Failed to upload audio to {bucket}/{object_key}: {e}")
             raise Exception(f"Failed to upload audio: {e}")
     
+    async def get_object_metadata(self, bucket: str, object_key: str) -> dict[str, str] | None:
+        """
+        Get the user metadata of an object, or None if it does not exist.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+            
+        Returns:
+            User metadata dict (empty if none was stored), None if the object is missing
+        """
+        return await self._run(self._head_object, bucket, object_key)
+    
+    async def get_object_size(self, bucket: str, object_key: str) -> int | None:
+        """
+        Get an object's size in bytes, or None if it does not exist.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+        """
+        return await self._run(self._object_size, bucket, object_key)
+    
+    async def download_to_file(self, bucket: str, object_key: str, max_bytes: int | None = None) -> BinaryIO:
+        """
+        Download an object into an anonymous temporary file, streaming it in chunks.
+        
+        The file is named after the object (its `name` is the last key
+        segment), positioned at the start, and must be closed by the caller.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+            max_bytes: Stop and raise ValueError once the object exceeds this size
+            
+        Returns:
+            Binary file with the object's contents
+        """
+        return await self._run(self._download_to_file_sync, bucket, object_key, max_bytes)
+    
+    def _download_to_file_sync(self, bucket: str, object_key: str, max_bytes: int | None) -> BinaryIO:
+        file = tempfile.TemporaryFile()
+        try:
+            size = 0
+            for chunk in self._iter_object(bucket, object_key):
+                size += len(chunk)
+                # Checked while streaming: the object may have been replaced since its size was checked
+                if max_bytes is not None and size > max_bytes:
+                    raise ValueError(f"Object {object_key} exceeds {max_bytes} bytes")
+                file.write(chunk)
+            file.seek(0)
+            file.raw.name = object_key.rsplit('/', 1)[-1]
+            return file
+        except BaseException:
+            file.close()
+            raise
+    
+    async def delete_object(self, bucket: str, object_key: str) -> None:
+        """
+        Delete an object (no-op if it does not exist).
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+        """
+        try:
+            await self._run(self._delete_object, bucket, object_key)
+        except Exception as e:
+            logger.error(f"Failed to delete {bucket}/{object_key}: {e}")
+            raise Exception(f"Failed to delete object: {e}")
+    
     def get_presigned_url(
         self,
         bucket: str,
@@ -108,6 +376,9 @@ class StorageService:
         """
         Generate a presigned URL for audio access.
         
+        URLs are cached per (bucket, key, expiry) and reused until shortly
+        before they expire, so repeated calls return a stable URL.
+        
         Args:
             bucket: Bucket name
             object_key: Object key in the bucket
@@ -116,34 +387,50 @@ class StorageService:
         Returns:
             Presigned URL for direct access
         """
+        expires_in = int(expires.total_seconds())
+        cached_url = self._presigned_urls.get(bucket, object_key, expires_in)
+        if cached_url is not None:
+            return cached_url
+        
         try:
-            expires_in = int(expires.total_seconds())
-            url = self.client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': bucket, 'Key': object_key},
-                ExpiresIn=expires_in
-            )
+            signed_at = time.time()
+            url = self._sign_url(bucket, object_key, expires_in)
+            self._presigned_urls.put(bucket, object_key, expires_in, url, signed_at)
             return url
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {bucket}/{object_key}: {e}")
             raise Exception(f"Failed to generate presigned URL: {e}")
     
-    def get_public_url(self, bucket: str, object_key: str) -> str:
+    async def get_presigned_upload_url(
+        self,
+        bucket: str,
+        object_key: str,
+        content_type: str,
+        expires: timedelta = timedelta(minutes=15)
+    ) -> str:
         """
-        Get public URL for a file in a public bucket.
+        Generate a presigned URL for uploading an object directly from the browser.
+        
+        The client must PUT the file body with the same Content-Type header.
         
         Args:
-            bucket: Bucket name
-            object_key: Object key in the bucket
+            bucket: Target bucket name
+            object_key: Object key the client may write
+            content_type: MIME type the client will send
+            expires: URL expiration time
             
         Returns:
-            Public URL for direct access
+            Presigned PUT URL
         """
-        # Construct public URL for Supabase Storage
-        base_url = settings.SUPABASE_URL.rstrip('/')
-        return f"{base_url}/storage/v1/object/public/{bucket}/{object_key}"
+        try:
+            # The bucket must exist before the client writes to it
+            await self.ensure_bucket_async(bucket)
+            return self._sign_upload_url(bucket, object_key, content_type, int(expires.total_seconds()))
+        except Exception as e:
+            logger.error(f"Failed to generate upload URL for {bucket}/{object_key}: {e}")
+            raise Exception(f"Failed to generate upload URL: {e}")
     
-    def download_audio(self, bucket: str, object_key: str) -> bytes:
+    async def download_audio(self, bucket: str, object_key: str) -> bytes:
         """
         Download audio file from Storage.
         
@@ -154,6 +441,143 @@ class StorageService:
         Returns:
             Audio file bytes
         """
+        return await self._run(self.download_audio_sync, bucket, object_key)
+
+
+class S3StorageService(StorageService):
+    """Storage backend for Supabase Storage via S3 compatible API."""
+    
+    def __init__(self):
+        super().__init__()
+        self._client = None
+    
+    @property
+    def client(self):
+        """Lazy initialization of S3 client for Supabase Storage."""
+        if self._client is None:
+            if not settings.STORAGE_ACCESS_KEY or not settings.STORAGE_SECRET_KEY:
+                raise ValueError(
+                    "STORAGE_ACCESS_KEY and STORAGE_SECRET_KEY must be set. "
+                    "Run `supabase status` and copy keys from Storage (S3) section"
+                )
+            
+            self._client = boto3.client(
+                's3',
+                endpoint_url=settings.STORAGE_ENDPOINT,
+                aws_access_key_id=settings.STORAGE_ACCESS_KEY,
+                aws_secret_access_key=settings.STORAGE_SECRET_KEY,
+                region_name=settings.STORAGE_REGION,
+                config=BotoConfig(
+                    signature_version='s3v4',
+                    # One pooled connection per worker thread
+                    max_pool_connections=settings.STORAGE_MAX_WORKERS
+                )
+            )
+        return self._client
+    
+    def ensure_bucket(self, bucket: str) -> bool:
+        """Ensure a specific bucket exists, create if not."""
+        if bucket in self._verified_buckets:
+            return True
+        try:
+            self.client.head_bucket(Bucket=bucket)
+            self._mark_bucket_verified(bucket)
+            return True
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('404', 'NoSuchBucket'):
+                try:
+                    self.client.create_bucket(Bucket=bucket)
+                    logger.info(f"Created bucket: {bucket}")
+                    self._mark_bucket_verified(bucket)
+                    return True
+                except Exception as create_err:
+                    logger.error(f"Failed to create bucket {bucket}: {create_err}")
+                    return False
+            else:
+                logger.error(f"Error checking bucket {bucket}: {e}")
+                return False
+    
+    def _put_object(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: str | None,
+        metadata: dict[str, str] | None
+    ) -> None:
+        """Write an object with put_object."""
+        extra_args = {}
+        if cache_control:
+            extra_args["CacheControl"] = cache_control
+        if metadata:
+            extra_args["Metadata"] = metadata
+        self.client.put_object(
+            Bucket=bucket,
+            Key=object_key,
+            Body=BytesIO(data),
+            ContentType=content_type,
+            **extra_args
+        )
+    
+    def _head_object(self, bucket: str, object_key: str) -> dict[str, str] | None:
+        """Get an object's user metadata with head_object."""
+        try:
+            response = self.client.head_object(Bucket=bucket, Key=object_key)
+            return response.get('Metadata', {})
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            logger.error(f"Failed to check object {bucket}/{object_key}: {e}")
+            raise Exception(f"Failed to check object: {e}")
+    
+    def _object_size(self, bucket: str, object_key: str) -> int | None:
+        """Get an object's ContentLength with head_object."""
+        try:
+            return self.client.head_object(Bucket=bucket, Key=object_key)['ContentLength']
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            logger.error(f"Failed to check object {bucket}/{object_key}: {e}")
+            raise Exception(f"Failed to check object: {e}")
+    
+    def _iter_object(self, bucket: str, object_key: str) -> Iterator[bytes]:
+        """Stream an object's body from get_object."""
+        response = self.client.get_object(Bucket=bucket, Key=object_key)
+        with response['Body'] as body:
+            yield from body.iter_chunks(chunk_size=STREAM_CHUNK_BYTES)
+    
+    def _delete_object(self, bucket: str, object_key: str) -> None:
+        """Delete an object with delete_object (S3 treats missing keys as deleted)."""
+        self.client.delete_object(Bucket=bucket, Key=object_key)
+    
+    def _sign_url(self, bucket: str, object_key: str, expires_in: int) -> str:
+        """Sign an S3 presigned GET URL."""
+        return self.client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket, 'Key': object_key},
+            ExpiresIn=expires_in
+        )
+    
+    def _sign_upload_url(self, bucket: str, object_key: str, content_type: str, expires_in: int) -> str:
+        """Sign an S3 presigned PUT URL bound to the content type."""
+        return self.client.generate_presigned_url(
+            'put_object',
+            Params={'Bucket': bucket, 'Key': object_key, 'ContentType': content_type},
+            ExpiresIn=expires_in
+        )
+    
+    def get_public_url(self, bucket: str, object_key: str) -> str:
+        """Get public URL for a file in a public Supabase Storage bucket."""
+        # Construct public URL for Supabase Storage
+        base_url = settings.SUPABASE_URL.rstrip('/')
+        return f"{base_url}/storage/v1/object/public/{bucket}/{object_key}"
+    
+    def download_audio_sync(self, bucket: str, object_key: str) -> bytes:
+        """Synchronous download of an audio file with get_object."""
         try:
             response = self.client.get_object(Bucket=bucket, Key=object_key)
             return response['Body'].read()
@@ -169,19 +593,7 @@ class StorageService:
         data: bytes | None = None,
         content_type: str = "audio/mpeg"
     ) -> str:
-        """
-        Synchronous upload from file path or bytes.
-        
-        Args:
-            bucket: Target bucket
-            object_key: Object path in bucket
-            file_path: Local file path (optional if data is provided)
-            data: Audio bytes (optional if file_path is provided)
-            content_type: MIME type
-        
-        Returns:
-            Object key
-        """
+        """Synchronous upload from file path or bytes with put_object."""
         try:
             if data is not None:
                 self.client.put_object(
@@ -206,5 +618,180 @@ class StorageService:
             raise Exception(f"Failed to upload audio: {e}")
 
 
+@dataclass
+class LocalObject:
+    """An object stored by LocalStorageService."""
+    path: Path
+    stat: os.stat_result
+    content_type: str
+    cache_control: str | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+class LocalStorageService(StorageService):
+    """Storage backend on local disk, for dev, CI and single-node deployments.
+    
+    Objects live at {root}/{bucket}/{key}; content type, Cache-Control and
+    user metadata live in a JSON sidecar under {root}/.meta/. Presigned URLs
+    point at the signed GET /storage/{bucket}/{key} endpoint.
+    """
+    
+    META_DIR = ".meta"
+    
+    def __init__(self, root_dir: str):
+        super().__init__()
+        self.root = Path(root_dir).resolve()
+    
+    def _object_path(self, bucket: str, object_key: str, meta: bool = False) -> Path:
+        """Resolve an object (or its metadata sidecar) path, refusing keys that escape the root."""
+        base = self.root / self.META_DIR / bucket if meta else self.root / bucket
+        path = (base / (f"{object_key}.json" if meta else object_key)).resolve()
+        if bucket in ("", ".", "..", self.META_DIR) or not path.is_relative_to(base.resolve()):
+            raise ValueError(f"Invalid object path: {bucket}/{object_key}")
+        return path
+    
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file via a temp file + rename so readers never see partial data."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def ensure_bucket(self, bucket: str) -> bool:
+        """Ensure a bucket directory exists, create if not."""
+        if bucket in self._verified_buckets:
+            return True
+        try:
+            (self.root / bucket).mkdir(parents=True, exist_ok=True)
+            self._mark_bucket_verified(bucket)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to create bucket directory {bucket}: {e}")
+            return False
+    
+    def _put_object(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: str | None,
+        metadata: dict[str, str] | None
+    ) -> None:
+        """Write an object and its metadata sidecar."""
+        sidecar = {
+            "content_type": content_type,
+            "cache_control": cache_control,
+            "metadata": metadata or {},
+        }
+        self._write_atomic(self._object_path(bucket, object_key, meta=True), json.dumps(sidecar).encode("utf-8"))
+        self._write_atomic(self._object_path(bucket, object_key), data)
+    
+    def stat_object(self, bucket: str, object_key: str) -> LocalObject | None:
+        """
+        Look up an object on disk.
+        
+        Args:
+            bucket: Bucket name
+            object_key: Object key in the bucket
+            
+        Returns:
+            LocalObject with path, stat and stored headers, or None if missing
+        """
+        path = self._object_path(bucket, object_key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        
+        try:
+            sidecar = json.loads(self._object_path(bucket, object_key, meta=True).read_bytes())
+        except FileNotFoundError:
+            sidecar = {}
+        return LocalObject(
+            path=path,
+            stat=stat,
+            content_type=sidecar.get("content_type") or "application/octet-stream",
+            cache_control=sidecar.get("cache_control"),
+            metadata=sidecar.get("metadata") or {}
+        )
+    
+    def _head_object(self, bucket: str, object_key: str) -> dict[str, str] | None:
+        """Get an object's user metadata from its sidecar."""
+        local_object = self.stat_object(bucket, object_key)
+        return local_object.metadata if local_object else None
+    
+    def _object_size(self, bucket: str, object_key: str) -> int | None:
+        """Get an object's size from the file system."""
+        local_object = self.stat_object(bucket, object_key)
+        return local_object.stat.st_size if local_object else None
+    
+    def _iter_object(self, bucket: str, object_key: str) -> Iterator[bytes]:
+        """Read an object's file in chunks."""
+        with open(self._object_path(bucket, object_key), 'rb') as f:
+            while chunk := f.read(STREAM_CHUNK_BYTES):
+                yield chunk
+    
+    def _delete_object(self, bucket: str, object_key: str) -> None:
+        """Remove an object and its metadata sidecar."""
+        self._object_path(bucket, object_key).unlink(missing_ok=True)
+        self._object_path(bucket, object_key, meta=True).unlink(missing_ok=True)
+    
+    def _sign_url(self, bucket: str, object_key: str, expires_in: int) -> str:
+        """Sign a URL for the local storage endpoint."""
+        return sign_api_url(f"/storage/{bucket}/{object_key}", expires_in)
+    
+    def _sign_upload_url(self, bucket: str, object_key: str, content_type: str, expires_in: int) -> str:
+        """Sign a PUT URL for the local storage endpoint."""
+        return sign_api_url(f"/storage/{bucket}/{object_key}", expires_in, method="PUT")
+    
+    def get_public_url(self, bucket: str, object_key: str) -> str:
+        """Local storage has no public buckets; return a long-lived signed URL."""
+        return self.get_presigned_url(bucket, object_key, expires=timedelta(days=7))
+    
+    def download_audio_sync(self, bucket: str, object_key: str) -> bytes:
+        """Synchronous read of an audio file from disk."""
+        try:
+            return self._object_path(bucket, object_key).read_bytes()
+        except Exception as e:
+            logger.error(f"Failed to download audio from {bucket}/{object_key}: {e}")
+            raise Exception(f"Failed to download audio: {e}")
+    
+    def upload_audio_sync(
+        self,
+        bucket: str,
+        object_key: str,
+        file_path: str | None = None,
+        data: bytes | None = None,
+        content_type: str = "audio/mpeg"
+    ) -> str:
+        """Synchronous write from file path or bytes."""
+        try:
+            if data is None and file_path is not None:
+                data = Path(file_path).read_bytes()
+            elif data is None:
+                raise ValueError("Either file_path or data must be provided")
+            self.ensure_bucket(bucket)
+            self._put_object(bucket, object_key, data, content_type, None, None)
+            return object_key
+        except Exception as e:
+            logger.error(f"Failed to upload audio: {e}")
+            raise Exception(f"Failed to upload audio: {e}")
+
+
+def create_storage_service() -> StorageService:
+    """Create the storage backend selected by STORAGE_BACKEND."""
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorageService(settings.STORAGE_LOCAL_DIR)
+    return S3StorageService()
+
+
 # Global instance
-storage_service = StorageService()
+storage_service = create_storage_service()
@@ -0,0 +1,201 @@
+"""Content-addressed cache for synthesized TTS audio.
+
+TTS output is determined by (speaker, model_id, voice_settings, text), so each
+result is stored under an immutable object key derived from a hash of those
+inputs. The speaker is the recording the voice was cloned from, not the
+ElevenLabs voice ID: voices are cloned afresh for every run and deleted
+afterwards, so their IDs never repeat.
+
+Lookups only pay off where a key can be requested twice: in stream mode
+(TTS_MODE=stream), a chunk streamed to a listener is stored, and the
+release of the voice renders only the chunks not stored yet; concurrent
+requests for one chunk also share a single synthesis. The eager modes
+(combined, per_chunk) always write keys no earlier run used, since every
+analysis has a new recording ID, so they call store() directly and skip
+the lookup.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from app.config import settings
+from app.services.storage_service import storage_service
+
+logger = logging.getLogger(__name__)
+
+# Object key prefix for cached TTS audio in the recordings bucket
+TTS_OBJECT_PREFIX = "cloned/tts"
+
+# Objects are immutable (key is derived from content inputs), so clients may cache forever
+TTS_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def tts_cache_key(
+    speaker_id: str,
+    model_id: str,
+    voice_settings: dict,
+    text: str
+) -> str:
+    """
+    Build the cache key for a TTS request.
+
+    Args:
+        speaker_id: Stable identity of the cloned speaker (the source recording ID)
+        model_id: ElevenLabs model ID
+        voice_settings: Voice settings sent with the request
+        text: Text to synthesize
+
+    Returns:
+        Hex SHA-256 digest identifying the synthesized audio
+    """
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    payload = json.dumps(
+        {
+            "speaker_id": speaker_id,
+            "model_id": model_id,
+            "voice_settings": voice_settings,
+            "text_sha256": text_hash,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def tts_object_key(cache_key: str) -> str:
+    """Get the immutable storage object key for a TTS cache key."""
+    return f"{TTS_OBJECT_PREFIX}/{cache_key[:2]}/{cache_key}.mp3"
+
+
+@dataclass
+class TTSObject:
+    """A synthesized TTS result stored in the recordings bucket."""
+    object_key: str
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+# Async callable producing (MP3 bytes, object metadata) on a cache miss
+TTSSynthesizer = Callable[[], Awaitable[tuple[bytes, dict[str, str]]]]
+
+
+class TTSCache:
+    """Process-wide cache of TTS objects already present in storage."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        # cache_key -> stored object, in LRU order
+        self._known: OrderedDict[str, TTSObject] = OrderedDict()
+        # cache_key -> in-flight synthesis, so concurrent identical requests share one call
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _remember(self, cache_key: str, tts_object: TTSObject) -> None:
+        """Record an object as present in storage, evicting the oldest entry if full."""
+        self._known[cache_key] = tts_object
+        self._known.move_to_end(cache_key)
+        while len(self._known) > self.max_entries:
+            self._known.popitem(last=False)
+
+    async def lookup(self, cache_key: str) -> TTSObject | None:
+        """
+        Find the stored object for a cache key.
+
+        Args:
+            cache_key: Key from tts_cache_key()
+
+        Returns:
+            TTSObject if the audio is already stored, None otherwise
+        """
+        tts_object = self._known.get(cache_key)
+        if tts_object is not None:
+            self._known.move_to_end(cache_key)
+            return tts_object
+
+        object_key = tts_object_key(cache_key)
+        metadata = await storage_service.get_object_metadata(
+            storage_service.bucket_recordings, object_key
+        )
+        if metadata is None:
+            return None
+        tts_object = TTSObject(object_key=object_key, metadata=metadata)
+        self._remember(cache_key, tts_object)
+        return tts_object
+
+    async def store(
+        self,
+        cache_key: str,
+        audio_data: bytes,
+        metadata: dict[str, str] | None = None
+    ) -> TTSObject:
+        """
+        Upload synthesized audio under its content-addressed key.
+
+        Args:
+            cache_key: Key from tts_cache_key()
+            audio_data: MP3 audio bytes
+            metadata: Optional object metadata (returned again on later hits)
+
+        Returns:
+            TTSObject for the stored audio
+        """
+        object_key = tts_object_key(cache_key)
+        await storage_service.upload_audio(
+            bucket=storage_service.bucket_recordings,
+            object_key=object_key,
+            data=audio_data,
+            content_type="audio/mpeg",
+            cache_control=TTS_CACHE_CONTROL,
+            metadata=metadata
+        )
+        tts_object = TTSObject(object_key=object_key, metadata=metadata or {})
+        self._remember(cache_key, tts_object)
+        return tts_object
+
+    async def get_or_create(
+        self,
+        cache_key: str,
+        synthesize: TTSSynthesizer
+    ) -> TTSObject:
+        """
+        Return the stored object for a cache key, synthesizing it on a miss.
+
+        Args:
+            cache_key: Key from tts_cache_key()
+            synthesize: Async callable producing (MP3 bytes, metadata), only called on a miss
+
+        Returns:
+            TTSObject for the stored audio
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            tts_object = await self.lookup(cache_key)
+            if tts_object is None:
+                audio_data, metadata = await synthesize()
+                tts_object = await self.store(cache_key, audio_data, metadata)
+            else:
+                logger.info(f"TTS cache hit: {tts_object.object_key}")
+            future.set_result(tts_object)
+            return tts_object
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged by asyncio
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+
+# Global instance
+tts_cache = TTSCache(max_entries=settings.TTS_CACHE_MAX_ENTRIES)
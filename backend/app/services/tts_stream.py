@@ -0,0 +1,215 @@
+"""On-demand streaming TTS for cloned voices.
+
+In TTS_MODE=stream the analysis pipeline does not synthesize the "golden
+version" audio up front. It registers the cloned voice here instead, and
+GET /recordings/{id}/chunks/{i}/tts streams ElevenLabs output straight to the
+client while the same bytes are uploaded to storage in the background.
+Once a voice's TTL expires, any chunks nobody played are rendered to storage
+and the voice is deleted, so later requests are always served from storage.
+
+Sessions live in the memory of the worker that ran the analysis, so stream
+mode needs a single API worker (or sticky routing by recording): another
+worker answers 404 until the owner has rendered the chunks at the end of the
+TTL. Live sessions are rendered and their voices deleted on shutdown; a
+worker killed without a graceful shutdown leaves its voices in ElevenLabs.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from app.services.ai.elevenlabs import (
+    get_elevenlabs_service,
+    DEFAULT_TTS_MODEL_ID,
+    DEFAULT_VOICE_SETTINGS,
+)
+from app.services.tts_cache import tts_cache, tts_cache_key, tts_object_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds release() waits for streams in progress before deleting the voice
+# (a stream acquired but never started by its response does not block it forever)
+STREAM_DRAIN_TIMEOUT_SECONDS = 120
+
+
+@dataclass
+class VoiceSession:
+    """A cloned voice kept alive for on-demand chunk synthesis."""
+    voice_id: str
+    texts: list[str]
+    cache_keys: list[str]
+    release_task: asyncio.Task | None = field(default=None, repr=False)
+    # Streams using the voice; release() waits for them before deleting it
+    active_streams: int = 0
+    idle: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    # Background uploads of streamed chunks
+    uploads: set[asyncio.Task] = field(default_factory=set, repr=False)
+
+    def __post_init__(self):
+        self.idle.set()
+
+
+class TTSStreamRegistry:
+    """Process-wide registry of cloned voices available for streaming TTS."""
+
+    def __init__(self):
+        # recording_id -> live voice session
+        self._sessions: dict[str, VoiceSession] = {}
+        # Strong references to background uploads so they are not garbage collected
+        self._background: set[asyncio.Task] = set()
+
+    def register(
+        self,
+        recording_id: str,
+        voice_id: str,
+        texts: list[str],
+        ttl_seconds: int
+    ) -> list[str]:
+        """
+        Keep a cloned voice available for streaming a recording's chunks.
+
+        Args:
+            recording_id: Recording the chunks belong to
+            voice_id: ElevenLabs voice ID (already cloned)
+            texts: Corrected text of each chunk
+            ttl_seconds: Seconds before remaining chunks are rendered and the voice deleted
+
+        Returns:
+            Storage object key each chunk's audio will be persisted under
+        """
+        cache_keys = [
+            tts_cache_key(recording_id, DEFAULT_TTS_MODEL_ID, DEFAULT_VOICE_SETTINGS, text)
+            for text in texts
+        ]
+        session = VoiceSession(voice_id=voice_id, texts=texts, cache_keys=cache_keys)
+        session.release_task = asyncio.create_task(self._release_later(recording_id, ttl_seconds))
+        self._sessions[recording_id] = session
+        return [tts_object_key(cache_key) for cache_key in cache_keys]
+
+    def get(self, recording_id: str) -> VoiceSession | None:
+        """Get the live voice session for a recording, if any."""
+        return self._sessions.get(recording_id)
+
+    def acquire(self, recording_id: str) -> VoiceSession | None:
+        """
+        Get the live voice session for a recording and count a stream against it.
+
+        Must be followed by stream_chunk(), which gives the stream back when it
+        ends. Counting happens here, synchronously, so release() cannot delete
+        the voice between the lookup and the start of the stream.
+        """
+        session = self._sessions.get(recording_id)
+        if session is not None:
+            session.active_streams += 1
+            session.idle.clear()
+        return session
+
+    @staticmethod
+    def _end_stream(session: VoiceSession) -> None:
+        session.active_streams -= 1
+        if session.active_streams == 0:
+            session.idle.set()
+
+    async def stream_chunk(self, session: VoiceSession, chunk_index: int) -> AsyncIterator[bytes]:
+        """
+        Stream a chunk's audio from ElevenLabs, persisting it once complete.
+
+        Args:
+            session: Live voice session from acquire()
+            chunk_index: Index of the chunk to synthesize
+
+        Yields:
+            MP3 audio bytes as they arrive
+        """
+        try:
+            cache_key = session.cache_keys[chunk_index]
+            elevenlabs = get_elevenlabs_service()
+            buffer = bytearray()
+            async for piece in elevenlabs.stream_text_to_speech(
+                text=session.texts[chunk_index],
+                voice_id=session.voice_id,
+                model_id=DEFAULT_TTS_MODEL_ID,
+                voice_settings=DEFAULT_VOICE_SETTINGS
+            ):
+                buffer.extend(piece)
+                yield piece
+
+            # Only reached when the whole stream was delivered; a disconnect leaves nothing half-written
+            task = asyncio.create_task(tts_cache.store(cache_key, bytes(buffer)))
+            self._background.add(task)
+            session.uploads.add(task)
+            task.add_done_callback(self._on_background_done)
+            task.add_done_callback(session.uploads.discard)
+        finally:
+            self._end_stream(session)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background upload and log its failure, if any."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background TTS upload failed: {task.exception()}")
+
+    async def _release_later(self, recording_id: str, delay: float) -> None:
+        """Release a voice session after its TTL."""
+        await asyncio.sleep(delay)
+        await self.release(recording_id)
+
+    async def release(self, recording_id: str) -> None:
+        """
+        Render any chunks not yet in storage, then delete the cloned voice.
+
+        Args:
+            recording_id: Recording whose voice session to release
+        """
+        session = self._sessions.pop(recording_id, None)
+        if session is None:
+            return
+        if session.release_task is not None and session.release_task is not asyncio.current_task():
+            session.release_task.cancel()
+
+        # Let streams in progress finish and persist, so no chunk is synthesized
+        # twice and no stream loses its voice halfway
+        try:
+            await asyncio.wait_for(session.idle.wait(), timeout=STREAM_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{session.active_streams} stream(s) of {recording_id} still open; releasing the voice anyway"
+            )
+        if session.uploads:
+            await asyncio.gather(*session.uploads, return_exceptions=True)
+
+        elevenlabs = get_elevenlabs_service()
+
+        async def render(chunk_index: int) -> None:
+            async def synthesize() -> tuple[bytes, dict[str, str]]:
+                audio_data = await elevenlabs.text_to_speech(
+                    text=session.texts[chunk_index],
+                    voice_id=session.voice_id,
+                    model_id=DEFAULT_TTS_MODEL_ID,
+                    voice_settings=DEFAULT_VOICE_SETTINGS
+                )
+                return audio_data, {}
+            try:
+                await tts_cache.get_or_create(session.cache_keys[chunk_index], synthesize)
+            except Exception as e:
+                logger.error(f"Failed to render chunk {chunk_index} of {recording_id}: {e}")
+
+        # Empty chunks have no audio (same as the eager TTS modes)
+        await asyncio.gather(*(render(i) for i, text in enumerate(session.texts) if text))
+
+        try:
+            await elevenlabs.delete_voice(session.voice_id)
+            logger.info(f"Released voice {session.voice_id} for {recording_id}")
+        except Exception as e:
+            logger.warning(f"Failed to delete voice {session.voice_id}: {e}")
+
+    async def close(self) -> None:
+        """Release all live sessions and wait for background uploads (app shutdown)."""
+        await asyncio.gather(*(self.release(recording_id) for recording_id in list(self._sessions)))
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+
+# Global instance
+tts_stream_registry = TTSStreamRegistry()
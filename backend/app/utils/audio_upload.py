@@ -0,0 +1,141 @@
+"""Bounded, low-copy handling of uploaded recordings.
+
+Starlette's multipart parser already spools each uploaded file to a
+temporary file once it grows past `MultiPartParser.spool_max_size`
+(1 MiB). These helpers cap request bodies while they are received and
+hand the pipeline the spooled file itself instead of copying it into a
+new bytes object; ffmpeg reads it through its file descriptor.
+"""
+
+import io
+import json
+import os
+from typing import BinaryIO
+
+from fastapi import UploadFile
+from starlette.formparsers import MultiPartParser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Allowance for multipart boundaries and form fields around the audio part
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """Reject request bodies larger than a limit with 413.
+
+    Requests declaring a larger Content-Length are rejected before the body
+    is read. Bodies without one (chunked transfer encoding) are counted as
+    they arrive: past the limit the app sees a client disconnect, so nothing
+    more is read or spooled, and its response is replaced by the 413.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() \
+                and int(content_length) > self.max_body_bytes:
+            await self._reject(send)
+            return
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes and not response_started:
+                    rejected = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                # Whatever the app answers to the cut-off body is replaced by the 413
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    await self._reject(send)
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+            if not response_started:
+                response_started = True
+                await self._reject(send)
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({
+            "detail": f"Request body exceeds {self.max_body_bytes} bytes"
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def upload_file(upload: UploadFile, filename: str) -> BinaryIO:
+    """
+    Get an uploaded file as a file object that outlives the request.
+
+    Small uploads still held in memory are returned as BytesIO. Uploads that
+    were spooled to disk get a new handle on the spooled temporary file
+    (a duplicated descriptor), which stays valid after the UploadFile is
+    closed; nothing is copied. The caller closes the returned file.
+
+    Args:
+        upload: File from a multipart form
+        filename: Name reported as the file's `name` (format hint for providers)
+
+    Returns:
+        Binary file positioned at the start of the upload
+    """
+    upload.file.seek(0)
+    if upload.size is not None and upload.size <= MultiPartParser.spool_max_size:
+        file = io.BytesIO(upload.file.read())
+        file.name = filename
+        return file
+    file = os.fdopen(os.dup(upload.file.fileno()), "rb")
+    file.raw.name = filename
+    return file
+
+
+def file_path(file: BinaryIO) -> str | None:
+    """
+    Get a path another process (e.g. ffmpeg) can open to read a file, if any.
+
+    Works for unlinked temporary files too, through /proc on Linux.
+
+    Returns:
+        Path of the file's descriptor, or None for in-memory files and
+        platforms without /proc
+    """
+    try:
+        fd = file.fileno()
+    except (OSError, io.UnsupportedOperation):
+        return None
+    path = f"/proc/{os.getpid()}/fd/{fd}"
+    return path if os.path.exists(path) else None
@@ -0,0 +1,216 @@
+"""Connection pool and query instrumentation.
+
+Records, per engine:
+- how long callers wait to check a connection out of the pool,
+- how long each route (or background task) holds a connection,
+- per-statement latency, keyed by normalized SQL,
+and logs statements slower than DB_SLOW_QUERY_MS. Pool sizes are read at
+scrape time. Everything is exported through GET /metrics.
+"""
+
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.utils.metrics import metrics, Histogram, Counter, GaugeCallback
+
+logger = logging.getLogger(__name__)
+
+# ASGI scope of the request being served; FastAPI adds the matched route to it
+_request_scope: ContextVar[Scope | None] = ContextVar("db_metrics_request_scope", default=None)
+
+# Label for connections used outside a request (startup, refreshers, pipelines after the response)
+BACKGROUND_ROUTE = "background"
+
+# Normalized SQL labels are cut to this length to keep series names readable
+MAX_STATEMENT_LABEL_LENGTH = 200
+
+# Distinct statement labels per process; later new statements share OTHER_STATEMENT
+MAX_STATEMENT_LABELS = 500
+OTHER_STATEMENT = "other"
+
+checkout_wait_seconds = metrics.register(Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ("engine",),
+))
+connection_hold_seconds = metrics.register(Histogram(
+    "db_connection_hold_seconds",
+    "Time a connection stayed checked out, by route",
+    ("engine", "route"),
+))
+statement_seconds = metrics.register(Histogram(
+    "db_statement_seconds",
+    "Statement execution latency, by normalized SQL",
+    ("engine", "statement"),
+))
+slow_statements_total = metrics.register(Counter(
+    "db_slow_statements_total",
+    "Statements slower than DB_SLOW_QUERY_MS",
+    ("engine",),
+))
+
+_pools: dict[str, AsyncAdaptedQueuePool] = {}
+
+
+def _pool_stats() -> dict[tuple[str, ...], float]:
+    stats = {}
+    for name, pool in _pools.items():
+        stats[(name, "size")] = pool.size()
+        stats[(name, "checked_in")] = pool.checkedin()
+        stats[(name, "checked_out")] = pool.checkedout()
+        stats[(name, "overflow")] = pool.overflow()
+    return stats
+
+
+metrics.register(GaugeCallback(
+    "db_pool_connections",
+    "Pool connections by state (overflow is negative while the pool is below pool_size)",
+    ("engine", "state"),
+    _pool_stats,
+))
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+    metrics_label = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            checkout_wait_seconds.observe(time.perf_counter() - start, self.metrics_label)
+
+    def recreate(self):
+        # dispose() replaces the pool; keep the label on the new instance
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        _pools[self.metrics_label] = pool
+        return pool
+
+
+class RouteContextMiddleware:
+    """Expose the current request to the pool hooks, for per-route hold times."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+
+
+def current_route() -> str:
+    """Method and route template of the request being served (e.g. GET .../questions/{question_id})."""
+    scope = _request_scope.get()
+    if scope is None:
+        return BACKGROUND_ROUTE
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return "unmatched"
+    return f"{scope.get('method', '')} {path}"
+
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+# A parenthesized row, allowing one level of nested parentheses (e.g. casts, function calls)
+_ROW = r"\((?:[^()]|\([^()]*\))*\)"
+_VALUES_ROWS_RE = re.compile(rf"(\bVALUES\s*{_ROW})(?:\s*,\s*{_ROW})+", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_statement_labels: set[str] = set()
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """Collapse parameters, literals, IN-lists and multi-row VALUES so equal queries share a label."""
+    normalized = _WHITESPACE_RE.sub(" ", statement).strip()
+    normalized = _LITERAL_RE.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST_RE.sub("?", normalized)
+    normalized = _VALUES_ROWS_RE.sub(r"\1", normalized)
+    if len(normalized) > MAX_STATEMENT_LABEL_LENGTH:
+        normalized = normalized[:MAX_STATEMENT_LABEL_LENGTH - 1] + "…"
+    return normalized
+
+
+def statement_label(normalized: str) -> str:
+    """Label for a normalized statement, capping the number of distinct labels."""
+    if normalized in _statement_labels:
+        return normalized
+    if len(_statement_labels) >= MAX_STATEMENT_LABELS:
+        return OTHER_STATEMENT
+    _statement_labels.add(normalized)
+    return normalized
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    Attach the metrics hooks to an engine.
+
+    Args:
+        engine: Engine created with poolclass=TimedQueuePool
+        name: Value of the "engine" label (e.g. "primary", "read")
+    """
+    sync_engine: Engine = engine.sync_engine
+    pool = sync_engine.pool
+    if isinstance(pool, TimedQueuePool):
+        pool.metrics_label = name
+        _pools[name] = pool
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        connection_record.info["route"] = current_route()
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            connection_hold_seconds.observe(
+                time.perf_counter() - checked_out_at,
+                name,
+                connection_record.info.pop("route", BACKGROUND_ROUTE),
+            )
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("statement_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("statement_started_at")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        normalized = normalize_statement(statement)
+        statement_seconds.observe(elapsed, name, statement_label(normalized))
+        if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+            slow_statements_total.inc(name)
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.0f} ms, {name}, {current_route()}): {normalized}"
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def on_error(exception_context):
+        # Drop the pending start time so the next statement is not mismeasured
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("statement_started_at"):
+            conn.info["statement_started_at"].pop()
@@ -0,0 +1,89 @@
+"""HMAC-signed URLs for API endpoints consumed by media elements.
+
+Browser <audio> elements cannot send an Authorization header, so endpoints
+that serve audio accept a short-lived signature over the request path
+instead, the same way storage presigned URLs work.
+
+The HMAC key is derived from the configured secret with HKDF under a
+URL-signing label, so it never equals a key used elsewhere (in particular
+the JWT secret, which is the fallback when URL_SIGNING_SECRET is unset).
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+from urllib.parse import urlencode
+
+from app.config import settings
+
+
+# HKDF info label; changing it invalidates every outstanding signed URL
+SIGNING_KEY_LABEL = b"url-signing/v1"
+
+
+def _hkdf_sha256(secret: bytes, info: bytes) -> bytes:
+    """Derive a 32-byte key from a secret (RFC 5869 with an empty salt, one output block)."""
+    prk = hmac.new(b"\x00" * hashlib.sha256().digest_size, secret, hashlib.sha256).digest()
+    return hmac.new(prk, info + b"\x01", hashlib.sha256).digest()
+
+
+def _signing_key() -> bytes:
+    """Get the key used to sign URLs."""
+    secret = settings.URL_SIGNING_SECRET or settings.SUPABASE_JWT_SECRET
+    if not secret:
+        raise ValueError("URL_SIGNING_SECRET or SUPABASE_JWT_SECRET must be set to sign URLs")
+    return _hkdf_sha256(secret.encode("utf-8"), SIGNING_KEY_LABEL)
+
+
+def _signature(method: str, path: str, expires: int) -> str:
+    """Compute the URL-safe signature for a method, path and expiry timestamp."""
+    message = f"{method.upper()} {path}:{expires}".encode("utf-8")
+    digest = hmac.new(_signing_key(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def sign_api_url(path: str, expires_in: int = 3600, method: str = "GET") -> str:
+    """
+    Build an absolute, signed URL for an API path.
+
+    Args:
+        path: Path relative to the API prefix (e.g. "/recordings/{id}/audio")
+        expires_in: Seconds until the URL stops working
+        method: HTTP method the URL is valid for
+
+    Returns:
+        Absolute URL with `expires` and `signature` query parameters
+    """
+    expires = int(time.time()) + expires_in
+    query = urlencode({"expires": expires, "signature": _signature(method, path, expires)})
+    return f"{settings.PUBLIC_API_URL.rstrip('/')}{path}?{query}"
+
+
+def verify_signed_path(
+    path: str,
+    expires: int | None,
+    signature: str | None,
+    method: str = "GET"
+) -> bool:
+    """
+    Check a signature produced by sign_api_url().
+
+    Args:
+        path: Path relative to the API prefix, as passed to sign_api_url()
+        expires: `expires` query parameter
+        signature: `signature` query parameter
+        method: HTTP method of the request being authorized
+
+    Returns:
+        True if the signature matches and has not expired
+    """
+    if expires is None or not signature:
+        return False
+    if expires < time.time():
+        return False
+    try:
+        expected = _signature(method, path, expires)
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, signature)
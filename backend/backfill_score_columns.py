@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Backfill analysis_results score columns from report_json.
+
+Run once after applying migration 20251229000001_add_analysis_score_columns.
+Each batch is its own transaction, so the table is never locked for long
+and the script can be interrupted and re-run safely. Afterwards the
+per-question score histograms (migration 20260101000001) are rebuilt from
+the populated columns.
+
+Usage:
+    uv run python backfill_score_columns.py [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+async def backfill(batch_size: int) -> None:
+    from app.database import engine, session_scope
+    from app.models import AnalysisResultRepository
+
+    total = 0
+    while True:
+        async with session_scope() as db:
+            updated = await AnalysisResultRepository.backfill_score_columns(db, batch_size)
+        if updated == 0:
+            break
+        total += updated
+        print(f"Backfilled {total} analyses...")
+
+    print(f"Done: {total} analyses backfilled")
+
+    async with session_scope() as db:
+        questions = await AnalysisResultRepository.rebuild_question_score_stats(db)
+    print(f"Rebuilt score histograms for {questions} questions")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Count database round trips made by the analysis pipeline's write path.
+
+Replays the DB operations of one analysis (question lookup, recording +
+analysis insert, completion update) against DATABASE_URL and reports how
+many round trips each phase costs. Everything runs inside one outer
+transaction that is rolled back at the end, so the rows it writes
+(recordings, analyses, question score histograms) never persist. Each unit
+of work opens a SAVEPOINT where the pipeline would BEGIN and releases it
+where the pipeline would COMMIT, so the counts match.
+
+Usage:
+    uv run python benchmark_db_round_trips.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event, select
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+class RoundTripCounter:
+    """Counts statements and transaction control on an engine."""
+
+    def __init__(self, sync_engine):
+        self.counts: Counter[str] = Counter()
+        event.listen(sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(sync_engine, "begin", self._on_begin)
+        event.listen(sync_engine, "commit", self._on_commit)
+        event.listen(sync_engine, "rollback", self._on_rollback)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Savepoints stand in for the pipeline's BEGIN/COMMIT/ROLLBACK
+        if statement.startswith("SAVEPOINT"):
+            self.counts["begin"] += 1
+        elif statement.startswith("RELEASE SAVEPOINT"):
+            self.counts["commit"] += 1
+        elif statement.startswith("ROLLBACK TO SAVEPOINT"):
+            self.counts["rollback"] += 1
+        else:
+            self.counts["statements"] += 1
+
+    def _on_begin(self, conn):
+        self.counts["begin"] += 1
+
+    def _on_commit(self, conn):
+        self.counts["commit"] += 1
+
+    def _on_rollback(self, conn):
+        self.counts["rollback"] += 1
+
+    def take(self) -> Counter[str]:
+        """Return counts since the last call and reset them."""
+        counts, self.counts = self.counts, Counter()
+        return counts
+
+
+async def run_benchmark(iterations: int) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from app.database import engine
+
+    conn = await engine.connect()
+    outer = await conn.begin()
+    counter = RoundTripCounter(engine.sync_engine)
+    benchmark_session = async_sessionmaker(
+        bind=conn,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    @asynccontextmanager
+    async def session_scope():
+        # Same shape as app.database.session_scope, nested in the outer transaction
+        async with benchmark_session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    try:
+        await run_iterations(counter, session_scope, iterations)
+    finally:
+        await outer.rollback()
+        await conn.close()
+        await engine.dispose()
+
+
+async def run_iterations(counter: RoundTripCounter, session_scope, iterations: int) -> None:
+    from ulid import ULID
+    from app.models import Question, QuestionRepository, AnalysisResultRepository
+
+    async with session_scope() as db:
+        question_id = (await db.execute(select(Question.question_id).limit(1))).scalar_one_or_none()
+    if question_id is None:
+        print("No questions in the database; run the seed first.")
+        return
+    counter.take()
+
+    report = {"chunks": [], "global_evaluation": {}}
+    totals: Counter[str] = Counter()
+    phase_counts: dict[str, Counter[str]] = {}
+    started = time.perf_counter()
+
+    for _ in range(iterations):
+        recording_id = f"recording_{ULID()}"
+
+        async with session_scope() as db:
+            await QuestionRepository.get_by_id(db, question_id)
+        phase_counts["question lookup"] = counter.take()
+
+        async with session_scope() as db:
+            analysis_id = await AnalysisResultRepository.create_with_recording(
+                db,
+                recording_id=recording_id,
+                question_id=question_id,
+                audio_url=f"recordings/benchmark/{question_id}/{recording_id}.mp3",
+            )
+        phase_counts["create rows"] = counter.take()
+
+        async with session_scope() as db:
+            await AnalysisResultRepository.mark_completed(db, analysis_id, report)
+        phase_counts["mark completed"] = counter.take()
+
+        for counts in phase_counts.values():
+            totals.update(counts)
+
+    elapsed = time.perf_counter() - started
+
+    print("=" * 60)
+    print("DB round trips per analysis")
+    print("=" * 60)
+    for phase, counts in phase_counts.items():
+        print(f"  {phase:<16} {sum(counts.values()):>3}  {dict(counts)}")
+    per_analysis = sum(totals.values()) / iterations
+    print("-" * 60)
+    print(f"  {'total':<16} {per_analysis:>5.1f}")
+    print(f"\n{iterations} iterations in {elapsed:.2f}s ({elapsed / iterations * 1000:.1f} ms per analysis)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Bulk import a question bank from JSONL or CSV.
+
+Each row needs question_id and instruction. Optional fields are title,
+difficulty (EASY/MEDIUM/HARD), tags, sos_keywords, sos_starter,
+reading_content, listening_transcript and audio_file. audio_file is a
+path relative to --audio-dir. In CSV files, list fields are JSON arrays
+or "|"-separated values.
+
+Audio files are uploaded concurrently and skipped when the stored object
+already has the same SHA-256. Rows are then COPYed into a temporary staging
+table and merged into questions with a single INSERT ... ON CONFLICT, so
+existing questions are updated in place. A row whose audio is missing or
+failed to upload keeps its current audio_url. API workers pick up the
+changes when their question catalog cache expires
+(QUESTION_CATALOG_TTL_SECONDS).
+
+Usage:
+    uv run python import_questions.py bank.jsonl [--audio-dir DIR] [--workers N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import mimetypes
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+# Columns written by the import, in COPY order
+COLUMNS = [
+    "question_id", "title", "difficulty", "tags", "instruction", "sos_keywords",
+    "sos_starter", "reading_content", "listening_transcript", "audio_url",
+]
+LIST_FIELDS = ("tags", "sos_keywords")
+DIFFICULTIES = ("EASY", "MEDIUM", "HARD")
+
+MERGE_SQL = f"""
+WITH merged AS (
+    INSERT INTO questions ({", ".join(COLUMNS)})
+    SELECT {", ".join(COLUMNS)} FROM questions_import
+    ON CONFLICT (question_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in COLUMNS if c not in ("question_id", "audio_url"))},
+        audio_url = COALESCE(EXCLUDED.audio_url, questions.audio_url)
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted) AS inserted, count(*) FILTER (WHERE NOT inserted) AS updated
+FROM merged
+"""
+
+
+def _read_rows(path: Path) -> list[tuple[int, dict]]:
+    """Read (line number, raw row) pairs from a .jsonl or .csv file."""
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            return [(i, row) for i, row in enumerate(csv.DictReader(f), 2)]
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                rows.append((i, json.loads(line)))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"line {i}: invalid JSON: {e}")
+    return rows
+
+
+def _parse_list(value) -> list[str] | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    value = str(value).strip()
+    if value.startswith("["):
+        return [str(v) for v in json.loads(value)]
+    return [v.strip() for v in value.split("|") if v.strip()]
+
+
+def _optional(row: dict, field: str) -> str | None:
+    value = row.get(field)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def parse_question(row: dict) -> dict:
+    """
+    Validate and normalize one raw row.
+
+    Raises:
+        ValueError: If a required field is missing or a value is invalid
+    """
+    question_id = _optional(row, "question_id")
+    instruction = _optional(row, "instruction")
+    if not question_id or len(question_id) > 50:
+        raise ValueError("question_id is required (max 50 characters)")
+    if not instruction:
+        raise ValueError("instruction is required")
+
+    title = _optional(row, "title")
+    if title and len(title) > 100:
+        raise ValueError("title is longer than 100 characters")
+    difficulty = _optional(row, "difficulty")
+    if difficulty:
+        difficulty = difficulty.upper()
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"difficulty must be one of {', '.join(DIFFICULTIES)}")
+
+    question = {
+        "question_id": question_id,
+        "title": title,
+        "difficulty": difficulty,
+        "instruction": instruction,
+        "sos_starter": _optional(row, "sos_starter"),
+        "reading_content": _optional(row, "reading_content"),
+        "listening_transcript": _optional(row, "listening_transcript"),
+        "audio_file": _optional(row, "audio_file"),
+        "audio_url": None,
+    }
+    for field in LIST_FIELDS:
+        try:
+            question[field] = _parse_list(row.get(field))
+        except (json.JSONDecodeError, TypeError):
+            raise ValueError(f"{field} must be a JSON array or |-separated list")
+    return question
+
+
+def upload_audio(questions: list[dict], audio_dir: Path, workers: int) -> None:
+    """Upload referenced audio files concurrently, setting audio_url on success."""
+    from app.services.storage_service import storage_service
+
+    jobs = []
+    for question in questions:
+        if not question["audio_file"]:
+            continue
+        local_path = audio_dir / question["audio_file"]
+        if not local_path.is_file():
+            print(f"⚠️  {question['question_id']}: audio file not found: {local_path}")
+            continue
+        object_key = f"{question['question_id']}/audio{local_path.suffix.lower()}"
+        jobs.append((question, local_path, object_key))
+    if not jobs:
+        return
+
+    bucket = storage_service.bucket_questions
+    storage_service.ensure_bucket(bucket)
+    uploaded = skipped = failed = uploaded_bytes = 0
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import") as executor:
+        futures = {
+            executor.submit(
+                storage_service.upload_file_if_changed_sync,
+                bucket,
+                object_key,
+                local_path,
+                mimetypes.guess_type(local_path.name)[0] or "audio/mpeg",
+            ): (question, local_path, object_key)
+            for question, local_path, object_key in jobs
+        }
+        for future in as_completed(futures):
+            question, local_path, object_key = futures[future]
+            try:
+                if future.result():
+                    uploaded += 1
+                    uploaded_bytes += local_path.stat().st_size
+                else:
+                    skipped += 1
+                question["audio_url"] = object_key
+            except Exception as e:
+                failed += 1
+                print(f"❌ {question['question_id']}: upload failed: {e}")
+
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    print(
+        f"Audio: {uploaded} uploaded, {skipped} unchanged, {failed} failed in {elapsed:.1f}s "
+        f"({len(jobs) / elapsed:.0f} files/s, {uploaded_bytes / elapsed / 1e6:.1f} MB/s uploaded)"
+    )
+
+
+async def merge_questions(questions: list[dict]) -> None:
+    """COPY questions into a staging table and merge them into questions in one transaction."""
+    from app.database import engine
+
+    records = [
+        tuple(
+            json.dumps(q[c], ensure_ascii=False) if c in LIST_FIELDS and q[c] is not None else q[c]
+            for c in COLUMNS
+        )
+        for q in questions
+    ]
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection
+        async with pg.transaction():
+            await pg.execute(
+                "CREATE TEMP TABLE questions_import (LIKE questions INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await pg.copy_records_to_table("questions_import", records=records, columns=COLUMNS)
+            result = await pg.fetchrow(MERGE_SQL)
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    print(
+        f"Questions: {result['inserted']} inserted, {result['updated']} updated in {elapsed:.2f}s "
+        f"({len(records) / elapsed:.0f} rows/s)"
+    )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("bank", type=Path, help="Question bank (.jsonl or .csv)")
+    parser.add_argument("--audio-dir", type=Path, help="Base directory for audio_file paths (default: the bank's directory)")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent audio uploads")
+    parser.add_argument("--skip-audio", action="store_true", help="Import rows without uploading audio")
+    parser.add_argument("--dry-run", action="store_true", help="Only validate the bank")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    questions: dict[str, dict] = {}
+    errors = []
+    try:
+        rows = _read_rows(args.bank)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    for line, row in rows:
+        try:
+            question = parse_question(row)
+        except ValueError as e:
+            errors.append(f"line {line}: {e}")
+            continue
+        if question["question_id"] in questions:
+            print(f"⚠️  line {line}: duplicate {question['question_id']}, keeping the later row")
+        questions[question["question_id"]] = question
+
+    if errors:
+        print(f"❌ {len(errors)} invalid rows, nothing imported:")
+        for error in errors:
+            print(f"  {error}")
+        sys.exit(1)
+    print(f"Validated {len(questions)} questions from {args.bank}")
+    if args.dry_run:
+        return
+
+    if not args.skip_audio:
+        upload_audio(list(questions.values()), args.audio_dir or args.bank.parent, args.workers)
+    asyncio.run(merge_questions(list(questions.values())))
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
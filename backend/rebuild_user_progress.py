@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Rebuild user_progress rollups from completed analyses.
+
+Run after applying migration 20251230000001_add_user_progress (and
+backfill_score_columns.py), or any time a rollup is suspected to be off.
+Each user is rebuilt in its own transaction under the same row lock the
+pipeline uses, so it is safe to run while analyses are completing.
+
+Usage:
+    uv run python rebuild_user_progress.py [--user-id UUID ...]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from uuid import UUID
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+async def rebuild(user_ids: list[UUID] | None) -> None:
+    from app.database import engine, session_scope
+    from app.models import AnalysisResultRepository
+
+    if not user_ids:
+        async with session_scope() as db:
+            user_ids = await AnalysisResultRepository.get_user_ids_with_completed(db)
+
+    for i, user_id in enumerate(user_ids, 1):
+        async with session_scope() as db:
+            progress = await AnalysisResultRepository.rebuild_user_progress(db, user_id)
+        print(f"[{i}/{len(user_ids)}] {user_id}: {progress.attempt_count} attempts")
+
+    print(f"Done: {len(user_ids)} users rebuilt")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=UUID, action="append", dest="user_ids",
+                        help="Only rebuild these users (repeatable)")
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.user_ids))
+
+
+if __name__ == "__main__":
+    main()
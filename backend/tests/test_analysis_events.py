@@ -0,0 +1,186 @@
+"""Live fan-out, Last-Event-ID replay and cross-worker tailing of analysis events."""
+
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+import pytest  # noqa: E402
+
+from app.models import AnalysisOutcome  # noqa: E402
+from app.schemas.sse import SSECompletedEvent, SSEErrorEvent, SSEStepEvent  # noqa: E402
+from app.services import analysis_events  # noqa: E402
+from app.services.analysis_events import AnalysisRun, tail_persisted  # noqa: E402
+
+ANALYSIS_ID = 42
+REPORT = {"global_evaluation": {"total_score": 24}}
+
+
+class FakeEventLog:
+    """In-memory stand-in for analysis_events and the analysis row."""
+
+    def __init__(self):
+        self.events: dict[int, dict] = {}
+        self.status = "processing"
+
+    async def append(self, db, analysis_id, events):
+        self.events.update(events)
+
+    async def list_after(self, db, analysis_id, after):
+        return sorted((event_id, payload) for event_id, payload in self.events.items() if event_id > after)
+
+    async def get_last_event_time(self, db, analysis_id):
+        return None
+
+    async def get_owner_and_status(self, db, analysis_id):
+        return None, self.status
+
+    async def get_outcome(self, db, analysis_id):
+        return AnalysisOutcome(
+            status=self.status,
+            error_message=None,
+            recording_id="recording_01TESTRECORDING0000000004",
+            audio_key="recordings/recording_01TESTRECORDING0000000004.mp3",
+            report=REPORT if self.status == "completed" else None,
+        )
+
+
+@pytest.fixture
+def event_log(monkeypatch):
+    log = FakeEventLog()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield None
+
+    monkeypatch.setattr(analysis_events, "session_scope", session_scope)
+    for name in ("append", "list_after", "get_last_event_time", "get_owner_and_status", "get_outcome"):
+        monkeypatch.setattr(analysis_events.AnalysisEventRepository, name, getattr(log, name))
+    monkeypatch.setattr(analysis_events, "PERSISTED_TAIL_POLL_SECONDS", 0)
+    return log
+
+
+def steps():
+    return [
+        SSEStepEvent(type="uploading", status="start"),
+        SSEStepEvent(type="uploading", status="completed", analysis_id=ANALYSIS_ID),
+        SSEStepEvent(type="analyzing", status="start"),
+    ]
+
+
+def completed():
+    return SSECompletedEvent(report=REPORT, recording_id="recording_01TESTRECORDING0000000004", audio_url="u")
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_every_subscriber_gets_every_event(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        subscribers = [asyncio.create_task(collect(run.subscribe())) for _ in range(3)]
+        await asyncio.sleep(0)
+        for event in [*steps(), completed()]:
+            await run.publish(event)
+            await asyncio.sleep(0)
+        return await asyncio.gather(*subscribers)
+
+    for received in asyncio.run(scenario()):
+        assert [event_id for event_id, _ in received] == [1, 2, 3, 4]
+        assert isinstance(received[-1][1], SSECompletedEvent)
+
+
+def test_reconnect_resumes_after_last_event_id(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        for event in steps():
+            await run.publish(event)
+        resumed = asyncio.create_task(collect(run.subscribe(after=2)))
+        await asyncio.sleep(0)
+        await run.publish(SSEErrorEvent(message="boom"))
+        return await resumed
+
+    received = asyncio.run(scenario())
+
+    assert [event_id for event_id, _ in received] == [3, 4]
+    assert received[-1][1].message == "boom"
+
+
+def test_subscriber_attaching_after_close_gets_the_rest_and_ends(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        for event in [*steps(), completed()]:
+            await run.publish(event)
+        # Published after the terminal event: dropped
+        await run.publish(SSEErrorEvent(message="late"))
+        return await asyncio.wait_for(collect(run.subscribe(after=3)), timeout=1)
+
+    received = asyncio.run(scenario())
+
+    assert [event_id for event_id, _ in received] == [4]
+
+
+def test_idle_subscriber_gets_heartbeats(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        await run.publish(steps()[0])
+        stream = run.subscribe(heartbeat_seconds=0.01)
+        return [await anext(stream), await anext(stream)]
+
+    assert asyncio.run(scenario())[1] is None
+
+
+def test_logged_events_replay_with_completed_rebuilt_from_result(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        for event in [*steps(), completed()]:
+            await run.publish(event)
+        await run.flushed()
+        event_log.status = "completed"
+        return await collect(tail_persisted(ANALYSIS_ID, after=1))
+
+    received = asyncio.run(scenario())
+
+    # The completed event was logged as a bare marker
+    assert event_log.events[4] == {"type": "completed"}
+    assert [event_id for event_id, _ in received] == [2, 3, 4]
+    assert received[-1][1].report == REPORT
+
+
+def test_tail_follows_events_logged_by_another_worker(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        for event in steps()[:2]:
+            await run.publish(event)
+        await run.flushed()
+        tail = tail_persisted(ANALYSIS_ID)
+        received = [await anext(tail), await anext(tail)]
+        await run.publish(steps()[2])
+        await run.publish(SSEErrorEvent(message="boom"))
+        event_log.status = "failed"
+        received += await collect(tail)
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert [event_id for event_id, _ in received] == [1, 2, 3, 4]
+    assert received[-1][1].message == "boom"
+
+
+def test_tail_ends_a_run_that_stopped_logging(event_log):
+    async def scenario():
+        run = AnalysisRun()
+        for event in steps()[:2]:
+            await run.publish(event)
+        await run.flushed()
+        return await asyncio.wait_for(collect(tail_persisted(ANALYSIS_ID, after=2, stale_seconds=0.05)), timeout=2)
+
+    received = asyncio.run(scenario())
+
+    assert received[-1][0] == 3
+    assert received[-1][1].message == "Analysis stopped responding"
@@ -0,0 +1,126 @@
+"""Request body cap and zero-copy handoff of uploaded files."""
+
+import asyncio
+import io
+import json
+import os
+import tempfile
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from fastapi import UploadFile  # noqa: E402
+from starlette.formparsers import MultiPartParser  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.utils.audio_upload import RequestSizeLimitMiddleware, file_path, upload_file  # noqa: E402
+
+LIMIT = 100
+
+
+class EchoApp:
+    """Reads the whole body and answers with its length."""
+
+    def __init__(self):
+        self.called = False
+
+    async def __call__(self, scope, receive, send):
+        self.called = True
+        body = await Request(scope, receive).body()
+        await JSONResponse({"length": len(body)})(scope, receive, send)
+
+
+def call(app, chunks, content_length=None):
+    """Send a POST with the given body chunks; return (status, json body, chunks read)."""
+    headers = [(b"content-type", b"application/octet-stream")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers, "query_string": b""}
+    pending = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    read = 0
+    sent = []
+
+    async def receive():
+        nonlocal read
+        if not pending:
+            return {"type": "http.disconnect"}
+        read += 1
+        return pending.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(RequestSizeLimitMiddleware(app, max_body_bytes=LIMIT)(scope, receive, send))
+    status = sent[0]["status"]
+    body = b"".join(message.get("body", b"") for message in sent[1:])
+    return status, json.loads(body), read
+
+
+def test_declared_content_length_over_limit_is_rejected_unread():
+    app = EchoApp()
+
+    status, body, read = call(app, [b"x" * (LIMIT + 1)], content_length=LIMIT + 1)
+
+    assert status == 413
+    assert "exceeds" in body["detail"]
+    assert not app.called
+    assert read == 0
+
+
+def test_chunked_body_is_cut_off_past_limit():
+    app = EchoApp()
+    chunks = [b"x" * 40] * 5
+
+    status, body, read = call(app, chunks)
+
+    assert status == 413
+    assert "exceeds" in body["detail"]
+    # The third chunk crosses the limit; nothing after it is read
+    assert read == 3
+
+
+def test_body_within_limit_passes_through():
+    status, body, _ = call(EchoApp(), [b"x" * 40, b"x" * 40])
+
+    assert status == 200
+    assert body == {"length": 80}
+
+
+def spooled_upload(data):
+    spool = tempfile.SpooledTemporaryFile(max_size=MultiPartParser.spool_max_size)
+    spool.write(data)
+    return UploadFile(file=spool, size=len(data), filename="upload.webm")
+
+
+def test_small_upload_is_returned_in_memory():
+    upload = spooled_upload(b"small audio")
+
+    file = upload_file(upload, "recording.webm")
+
+    assert isinstance(file, io.BytesIO)
+    assert file.name == "recording.webm"
+    assert file.read() == b"small audio"
+    assert file_path(file) is None
+
+
+def test_spooled_upload_is_shared_not_copied():
+    data = os.urandom(MultiPartParser.spool_max_size + 1)
+    upload = spooled_upload(data)
+    upload.file.seek(123)
+
+    file = upload_file(upload, "recording.webm")
+    # The duplicated descriptor outlives the request's UploadFile
+    asyncio.run(upload.close())
+
+    with file:
+        assert file.name == "recording.webm"
+        assert file.read() == data
+        path = file_path(file)
+        if path is not None:
+            with open(path, "rb") as reopened:
+                assert reopened.read(16) == data[:16]
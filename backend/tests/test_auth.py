@@ -0,0 +1,110 @@
+"""Verified-token cache validity and eviction, and JWKS refresh on an unknown key ID."""
+
+import asyncio
+import base64
+import os
+import tempfile
+import time
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from app import auth  # noqa: E402
+from app.auth import AuthenticatedUser, JwksCache, VerifiedTokenCache  # noqa: E402
+
+USER = AuthenticatedUser(user_id="user-1")
+
+
+def oct_jwk(kid):
+    secret = base64.urlsafe_b64encode(f"secret-{kid}".encode()).rstrip(b"=").decode()
+    return {"kty": "oct", "kid": kid, "k": secret, "alg": "HS256"}
+
+
+class FakeJwksClient:
+    """Serves a key set that can be rotated, counting fetches."""
+
+    def __init__(self, *kids):
+        self.kids = list(kids)
+        self.fetches = 0
+
+    async def get(self, url, timeout):
+        self.fetches += 1
+        keys = [oct_jwk(kid) for kid in self.kids]
+        return FakeResponse({"keys": keys})
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+def test_cached_token_expires():
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.put("live", USER, expires_at=time.time() + 60)
+    cache.put("expired", USER, expires_at=time.time() - 1)
+
+    assert cache.get("live") == USER
+    assert cache.get("expired") is None
+    assert len(cache._entries) == 1
+
+
+def test_cached_token_not_returned_before_nbf():
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.put("early", USER, expires_at=time.time() + 60, not_before=time.time() + 30)
+
+    assert cache.get("early") is None
+    # Still cached: it becomes valid once nbf passes
+    assert len(cache._entries) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_entries=2)
+    expires_at = time.time() + 60
+    cache.put("a", USER, expires_at)
+    cache.put("b", USER, expires_at)
+    cache.get("a")
+    cache.put("c", USER, expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == USER
+    assert cache.get("c") == USER
+
+
+def test_unknown_kid_fetches_rotated_keys(monkeypatch):
+    client = FakeJwksClient("old")
+    monkeypatch.setattr(auth, "get_http_client", lambda: client)
+    cache = JwksCache(url="https://example.test/jwks.json", refresh_seconds=0)
+
+    async def scenario():
+        assert await cache.get_key("old") is not None
+        client.kids = ["old", "new"]
+        # Fetched within the minimum interval: unknown IDs don't refetch
+        assert await cache.get_key("new") is None
+        cache._fetched_at -= auth.JWKS_MIN_FETCH_INTERVAL_SECONDS
+        return await cache.get_key("new")
+
+    assert asyncio.run(scenario()) is not None
+    assert client.fetches == 2
+
+
+def test_revoked_key_clears_verified_tokens(monkeypatch):
+    client = FakeJwksClient("old", "new")
+    monkeypatch.setattr(auth, "get_http_client", lambda: client)
+    cache = JwksCache(url="https://example.test/jwks.json", refresh_seconds=0)
+    auth.verified_tokens.put("token", USER, expires_at=time.time() + 60)
+
+    async def scenario():
+        await cache.refresh()
+        client.kids = ["new"]
+        await cache.refresh()
+
+    asyncio.run(scenario())
+
+    assert auth.verified_tokens.get("token") is None
@@ -0,0 +1,74 @@
+"""Presigned URLs are reused until shortly before they expire."""
+
+import os
+import tempfile
+import time
+from datetime import timedelta
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from app.services.storage_service import PresignedUrlCache, storage_service  # noqa: E402
+
+
+def test_url_is_dropped_within_min_remaining_of_expiry():
+    cache = PresignedUrlCache(max_entries=10, min_remaining=300)
+    now = time.time()
+    cache.put("b", "fresh", 3600, "url-fresh", signed_at=now - 3200)
+    cache.put("b", "stale", 3600, "url-stale", signed_at=now - 3400)
+
+    assert cache.get("b", "fresh", 3600) == "url-fresh"
+    assert cache.get("b", "stale", 3600) is None
+    assert ("b", "stale", 3600) not in cache._entries
+
+
+def test_short_lived_url_is_reused_for_half_its_lifetime():
+    cache = PresignedUrlCache(max_entries=10, min_remaining=300)
+    now = time.time()
+    cache.put("b", "early", 60, "url-early", signed_at=now - 20)
+    cache.put("b", "late", 60, "url-late", signed_at=now - 40)
+
+    assert cache.get("b", "early", 60) == "url-early"
+    assert cache.get("b", "late", 60) is None
+
+
+def test_expiry_is_part_of_the_key():
+    cache = PresignedUrlCache(max_entries=10, min_remaining=300)
+    cache.put("b", "key", 3600, "url-hour", signed_at=time.time())
+
+    assert cache.get("b", "key", 900) is None
+    assert cache.get("b", "key", 3600) == "url-hour"
+
+
+def test_least_recently_used_url_is_evicted():
+    cache = PresignedUrlCache(max_entries=2, min_remaining=300)
+    now = time.time()
+    cache.put("b", "one", 3600, "url-one", signed_at=now)
+    cache.put("b", "two", 3600, "url-two", signed_at=now)
+    cache.get("b", "one", 3600)
+    cache.put("b", "three", 3600, "url-three", signed_at=now)
+
+    assert cache.get("b", "two", 3600) is None
+    assert cache.get("b", "one", 3600) == "url-one"
+    assert cache.get("b", "three", 3600) == "url-three"
+
+
+def test_get_presigned_url_signs_once_per_expiry(monkeypatch):
+    signed = []
+
+    def sign_url(bucket, object_key, expires_in):
+        signed.append(expires_in)
+        return f"https://storage.test/{bucket}/{object_key}?n={len(signed)}"
+
+    monkeypatch.setattr(storage_service, "_sign_url", sign_url)
+    storage_service._presigned_urls.clear()
+    bucket = storage_service.bucket_recordings
+
+    first = storage_service.get_presigned_url(bucket, "a.mp3")
+    again = storage_service.get_presigned_url(bucket, "a.mp3")
+    short = storage_service.get_presigned_url(bucket, "a.mp3", expires=timedelta(minutes=5))
+
+    assert first == again
+    assert short != first
+    assert signed == [3600, 300]
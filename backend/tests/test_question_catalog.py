@@ -0,0 +1,121 @@
+"""Keyset pagination over the cached question catalog and ETag revalidation."""
+
+import os
+import tempfile
+from datetime import datetime, timezone
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import get_read_db  # noqa: E402
+from app.routers import questions  # noqa: E402
+from app.schemas import QuestionResponse  # noqa: E402
+from app.services.question_catalog import CatalogSnapshot  # noqa: E402
+
+QUESTION_IDS = ["ind_003", "ind_001", "ind_005", "ind_002", "ind_004"]
+
+
+def question(question_id, instruction="Describe a place you like."):
+    return QuestionResponse(
+        question_id=question_id,
+        instruction=instruction,
+        created_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+    )
+
+
+def snapshot(instruction="Describe a place you like."):
+    return CatalogSnapshot.build([question(qid, instruction) for qid in QUESTION_IDS])
+
+
+def ids(page):
+    return [q.question_id for q in page]
+
+
+def test_pages_follow_the_cursor_in_id_order():
+    catalog = snapshot()
+
+    first, cursor = catalog.page(None, 0, 2)
+    second, cursor = catalog.page(cursor, 0, 2)
+    last, end = catalog.page(cursor, 0, 2)
+
+    assert ids(first) == ["ind_001", "ind_002"]
+    assert ids(second) == ["ind_003", "ind_004"]
+    assert ids(last) == ["ind_005"]
+    assert end is None
+
+
+def test_page_ending_exactly_at_the_last_question_has_no_cursor():
+    page, cursor = snapshot().page("ind_002", 0, 3)
+
+    assert ids(page) == ["ind_003", "ind_004", "ind_005"]
+    assert cursor is None
+
+
+def test_cursor_not_in_the_catalog_starts_after_its_position():
+    catalog = snapshot()
+
+    # e.g. the question was deleted since the previous page
+    page, _ = catalog.page("ind_0025", 0, 2)
+    past_end, cursor = catalog.page("zzz", 0, 2)
+
+    assert ids(page) == ["ind_003", "ind_004"]
+    assert past_end == []
+    assert cursor is None
+
+
+def test_skip_applies_after_the_cursor():
+    page, cursor = snapshot().page("ind_001", 1, 2)
+
+    assert ids(page) == ["ind_003", "ind_004"]
+    assert cursor == "ind_004"
+
+
+def test_etag_follows_content_not_load_order():
+    assert snapshot().etag == CatalogSnapshot.build([question(qid) for qid in reversed(QUESTION_IDS)]).etag
+    assert snapshot().etag != snapshot("Describe a person you admire.").etag
+
+
+@pytest.fixture
+def client(monkeypatch):
+    catalog = snapshot()
+
+    async def get(db):
+        return catalog
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(questions.question_catalog, "get", get)
+    app = FastAPI()
+    app.include_router(questions.router)
+    app.dependency_overrides[get_read_db] = no_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_list_questions_pages_with_next_cursor(client):
+    first = client.get("/questions", params={"limit": 3}).json()
+    rest = client.get("/questions", params={"limit": 3, "after": first["next_cursor"]}).json()
+
+    assert [q["question_id"] for q in first["questions"]] == ["ind_001", "ind_002", "ind_003"]
+    assert first["total"] == 5
+    assert [q["question_id"] for q in rest["questions"]] == ["ind_004", "ind_005"]
+    assert rest["next_cursor"] is None
+
+
+def test_list_questions_revalidates_with_etag(client):
+    response = client.get("/questions")
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/questions", headers={"If-None-Match": etag.removeprefix("W/")})
+    changed = client.get("/questions", headers={"If-None-Match": 'W/"stale", W/"older"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert changed.status_code == 200
@@ -0,0 +1,137 @@
+"""`fields=` projections and ETag revalidation of GET /recordings/{id}/report."""
+
+import os
+import tempfile
+from datetime import datetime, timezone
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+import pytest  # noqa: E402
+from fastapi import FastAPI, HTTPException  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.auth import AuthenticatedUser, get_current_user  # noqa: E402
+from app.database import get_read_db  # noqa: E402
+from app.models import Recording, RecordingReport  # noqa: E402
+from app.routers import recordings  # noqa: E402
+from app.routers.recordings import _nest_report_paths, _parse_report_fields, _report_etag  # noqa: E402
+
+RECORDING_ID = "recording_01TESTRECORDING0000000003"
+REPORT = {
+    "analysis_version": "2",
+    "global_evaluation": {"total_score": 24, "score_breakdown": {"delivery": 3.5}, "level": "Good"},
+    "full_transcript": {"text": "I like the park."},
+    "chunks": [{"text": "first"}, {"text": "second"}, {"text": "third"}],
+}
+
+
+def test_alias_expands_to_its_paths():
+    assert _parse_report_fields("scores") == [
+        ("global_evaluation", "total_score"),
+        ("global_evaluation", "score_breakdown"),
+        ("global_evaluation", "level"),
+    ]
+
+
+def test_indexes_become_ints_and_duplicates_are_dropped():
+    paths = _parse_report_fields(" chunks.2 ,full_transcript.text,,chunks.2")
+
+    assert paths == [("chunks", 2), ("full_transcript", "text")]
+
+
+@pytest.mark.parametrize("field", ["report_json", "chunks.-1", "chunks..2", "Chunks", "chunks.2;drop", "chunks."])
+def test_invalid_field_is_rejected(field):
+    with pytest.raises(HTTPException) as exc_info:
+        _parse_report_fields(field)
+
+    assert exc_info.value.status_code == 400
+    assert field in exc_info.value.detail
+
+
+def test_paths_are_nested_back_into_the_report_shape():
+    nested = _nest_report_paths({
+        ("chunks", 2): {"text": "third"},
+        ("global_evaluation", "total_score"): 24,
+        ("global_evaluation", "level"): "Good",
+    })
+
+    assert nested == {
+        "chunks": {"2": {"text": "third"}},
+        "global_evaluation": {"total_score": 24, "level": "Good"},
+    }
+
+
+def recording_report(status="completed", analysis_id=7, report=REPORT):
+    recording = Recording(
+        recording_id=RECORDING_ID,
+        question_id="ind_001",
+        audio_url=f"recordings/{RECORDING_ID}.mp3",
+        user_id=None,
+        created_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+    )
+    return RecordingReport(recording=recording, analysis_id=analysis_id, status=status, error_message=None, report=report)
+
+
+def test_etag_changes_with_status_url_and_projection():
+    etag = _report_etag(recording_report(), "https://audio/1", None)
+
+    assert etag == _report_etag(recording_report(), "https://audio/1", None)
+    assert etag != _report_etag(recording_report(status="processing", report=None), "https://audio/1", None)
+    assert etag != _report_etag(recording_report(), "https://audio/2", None)
+    assert etag != _report_etag(recording_report(), "https://audio/1", "scores")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def get_recording_report(db, recording_id, report_paths):
+        if report_paths is None:
+            return recording_report()
+        values = {}
+        for path in report_paths:
+            value = REPORT
+            for part in path:
+                value = value[part]
+            values[path] = value
+        return recording_report(report=values)
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(recordings.AnalysisResultRepository, "get_recording_report", get_recording_report)
+    monkeypatch.setattr(recordings.storage_service, "get_presigned_url", lambda bucket, object_key: "https://audio/1")
+    app = FastAPI()
+    app.include_router(recordings.router)
+    app.dependency_overrides[get_read_db] = no_db
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(user_id="user-1")
+    with TestClient(app) as client:
+        yield client
+
+
+def test_report_fields_are_projected(client):
+    body = client.get(f"/recordings/{RECORDING_ID}/report", params={"fields": "scores,chunks.1"}).json()
+
+    assert body["report"] == {
+        "global_evaluation": {"total_score": 24, "score_breakdown": {"delivery": 3.5}, "level": "Good"},
+        "chunks": {"1": {"text": "second"}},
+    }
+
+
+def test_invalid_report_field_is_a_400(client):
+    response = client.get(f"/recordings/{RECORDING_ID}/report", params={"fields": "password"})
+
+    assert response.status_code == 400
+
+
+def test_unchanged_report_is_a_304(client):
+    url = f"/recordings/{RECORDING_ID}/report"
+    etag = client.get(url).headers["etag"]
+
+    not_modified = client.get(url, headers={"If-None-Match": f'"other", {etag}'})
+    other_projection = client.get(url, params={"fields": "scores"}, headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert other_projection.status_code == 200
@@ -0,0 +1,52 @@
+"""A completion is counted once in the cached histogram, even across a reload."""
+
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from app.models import ScoreDistribution  # noqa: E402
+from app.services import score_stats  # noqa: E402
+from app.services.score_stats import QuestionStatsCache  # noqa: E402
+
+QUESTION_ID = "q1"
+SCORES = {"total_score": 20, "delivery": 3.0, "language_use": 3.0, "topic_development": 3.0}
+
+
+def stored_distribution(monkeypatch, attempts):
+    """Serve a distribution with the given number of attempts from the "database"."""
+    distribution = ScoreDistribution.empty(QUESTION_ID)
+    for _ in range(attempts):
+        distribution = distribution.with_attempt(SCORES)
+
+    async def get(db, question_id):
+        return distribution
+
+    monkeypatch.setattr(score_stats.QuestionScoreStatsRepository, "get", get)
+
+
+def test_record_folds_into_copy_loaded_before_commit(monkeypatch):
+    cache = QuestionStatsCache(ttl_seconds=60)
+    stored_distribution(monkeypatch, attempts=1)
+    asyncio.run(cache.get(None, QUESTION_ID))
+
+    cache.record(QUESTION_ID, SCORES, commit_started=time.monotonic())
+
+    assert cache._entries[QUESTION_ID][0].attempt_count == 2
+
+
+def test_record_drops_copy_reloaded_during_commit(monkeypatch):
+    cache = QuestionStatsCache(ttl_seconds=60)
+    commit_started = time.monotonic()
+    # A reload racing the commit already sees the completed row
+    stored_distribution(monkeypatch, attempts=2)
+    asyncio.run(cache.get(None, QUESTION_ID))
+
+    cache.record(QUESTION_ID, SCORES, commit_started=commit_started)
+
+    assert QUESTION_ID not in cache._entries
+    assert asyncio.run(cache.get(None, QUESTION_ID)).attempt_count == 2
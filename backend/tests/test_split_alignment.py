@@ -0,0 +1,104 @@
+"""Splitting a combined TTS alignment into per-chunk time ranges."""
+
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from app.services import analysis_service  # noqa: E402
+from app.services.analysis_service import COMBINED_TTS_SEPARATOR, split_alignment_by_chunks  # noqa: E402
+
+
+def timed_alignment(texts, char_seconds=0.1, separator_seconds=0.4, separator_times=None):
+    """Alignment for texts joined by the separator, one char_seconds per character."""
+    starts, ends = [], []
+    t = 0.0
+    for i, text in enumerate(texts):
+        if i:
+            for _ in COMBINED_TTS_SEPARATOR:
+                step = separator_seconds / len(COMBINED_TTS_SEPARATOR)
+                starts.append(separator_times if separator_times is not None else t)
+                ends.append(separator_times if separator_times is not None else t + step)
+                t += step
+        for _ in text:
+            starts.append(t)
+            ends.append(t + char_seconds)
+            t += char_seconds
+    return {"character_start_times_seconds": starts, "character_end_times_seconds": ends}
+
+
+def test_boundary_is_the_middle_of_the_pause():
+    texts = ["Hi.", "Yo!"]
+
+    ranges = split_alignment_by_chunks(texts, timed_alignment(texts))
+
+    # "Hi." ends at 0.3s and "Yo!" starts at 0.7s
+    assert ranges == [[0.0, 0.5], [0.5, 1.0]]
+
+
+def test_punctuation_belongs_to_the_chunk_and_separator_timing_is_ignored():
+    texts = ["Well, yes.", "No?"]
+    # Aligners often give whitespace a zero-length time at the start
+    alignment = timed_alignment(texts, separator_times=0.0)
+
+    ranges = split_alignment_by_chunks(texts, alignment)
+
+    # The full stop ends at 1.0s; "N" starts after the 0.4s pause at 1.4s
+    assert ranges == [[0.0, 1.2], [1.2, 1.7]]
+
+
+def test_empty_chunk_has_no_range_and_neighbours_share_the_pause():
+    texts = ["A.", "", "B."]
+
+    ranges = split_alignment_by_chunks(texts, timed_alignment(texts))
+
+    assert ranges[1] is None
+    # Two separators (0.8s) between "A." (ends 0.2s) and "B." (starts 1.0s)
+    assert ranges[0] == [0.0, 0.6]
+    assert ranges[2] == [0.6, 1.2]
+
+
+def test_short_alignment_is_rejected():
+    texts = ["First.", "Second."]
+    alignment = timed_alignment(texts)
+    for times in alignment.values():
+        del times[-3:]
+
+    with pytest.raises(ValueError):
+        split_alignment_by_chunks(texts, alignment)
+
+
+class FakeElevenLabs:
+    def __init__(self):
+        self.synthesized = []
+
+    async def text_to_speech_with_timestamps(self, text, voice_id, model_id, voice_settings):
+        # Alignment that stops short of the text
+        return b"ID3combined", timed_alignment([text[:-1]])
+
+    async def text_to_speech(self, text, voice_id, model_id, voice_settings):
+        self.synthesized.append(text)
+        return b"ID3" + text.encode()
+
+    async def delete_voice(self, voice_id):
+        pass
+
+
+def test_short_alignment_falls_back_to_per_chunk(monkeypatch):
+    elevenlabs = FakeElevenLabs()
+    monkeypatch.setattr(analysis_service, "get_elevenlabs_service", lambda: elevenlabs)
+    monkeypatch.setattr(analysis_service.settings, "TTS_MODE", "combined")
+    feedbacks = [SimpleNamespace(corrected_text=text) for text in ("First.", "Second.")]
+
+    chunks = asyncio.run(analysis_service.generate_chunk_tts(
+        "voice_1", [{}, {}], feedbacks, "recording_01TESTRECORDING0000000002", "q1"
+    ))
+
+    assert sorted(elevenlabs.synthesized) == ["First.", "Second."]
+    assert all(chunk is not None and chunk.time_range is None for chunk in chunks)
@@ -0,0 +1,81 @@
+"""The TTS cache saves syntheses only where a chunk is requested twice (stream mode)."""
+
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["STORAGE_LOCAL_DIR"] = tempfile.mkdtemp()
+os.environ.setdefault("URL_SIGNING_SECRET", "test-secret")
+
+from app.services import analysis_service, tts_stream  # noqa: E402
+from app.services.storage_service import storage_service  # noqa: E402
+from app.services.tts_stream import tts_stream_registry  # noqa: E402
+
+RECORDING_ID = "recording_01TESTRECORDING0000000000"
+
+
+class FakeElevenLabs:
+    def __init__(self):
+        self.synthesized = []
+        self.streamed = []
+        self.deleted = []
+
+    async def text_to_speech(self, text, voice_id, model_id, voice_settings):
+        self.synthesized.append(text)
+        return b"ID3" + text.encode()
+
+    async def stream_text_to_speech(self, text, voice_id, model_id, voice_settings):
+        self.streamed.append(text)
+        for piece in (b"ID3", text.encode()):
+            yield piece
+
+    async def delete_voice(self, voice_id):
+        self.deleted.append(voice_id)
+
+
+def feedbacks(*texts):
+    return [SimpleNamespace(corrected_text=text) for text in texts]
+
+
+def test_release_renders_only_chunks_not_streamed(monkeypatch):
+    elevenlabs = FakeElevenLabs()
+    monkeypatch.setattr(tts_stream, "get_elevenlabs_service", lambda: elevenlabs)
+
+    async def scenario():
+        chunks = analysis_service.register_chunk_tts_stream(
+            "voice_1", feedbacks("First chunk.", "Second chunk."), RECORDING_ID
+        )
+        session = tts_stream_registry.acquire(RECORDING_ID)
+        streamed = b"".join([piece async for piece in tts_stream_registry.stream_chunk(session, 0)])
+        await tts_stream_registry.release(RECORDING_ID)
+        return chunks, streamed
+
+    chunks, streamed = asyncio.run(scenario())
+
+    assert streamed == b"ID3First chunk."
+    assert elevenlabs.streamed == ["First chunk."]
+    # The streamed chunk was stored, so release only synthesizes the other one
+    assert elevenlabs.synthesized == ["Second chunk."]
+    assert elevenlabs.deleted == ["voice_1"]
+    for chunk, text in zip(chunks, ("First chunk.", "Second chunk.")):
+        audio = asyncio.run(storage_service.download_audio(storage_service.bucket_recordings, chunk.object_key))
+        assert audio == b"ID3" + text.encode()
+
+
+def test_per_chunk_mode_stores_without_lookup(monkeypatch):
+    elevenlabs = FakeElevenLabs()
+    monkeypatch.setattr(analysis_service, "get_elevenlabs_service", lambda: elevenlabs)
+
+    async def no_lookup(bucket, object_key):
+        raise AssertionError(f"unexpected lookup of {object_key}")
+
+    monkeypatch.setattr(storage_service, "get_object_metadata", no_lookup)
+
+    chunks = asyncio.run(analysis_service.generate_chunk_tts_parallel(
+        "voice_2", [{}], feedbacks("Only chunk."), "recording_01TESTRECORDING0000000001", "q1"
+    ))
+
+    assert chunks[0] is not None
+    assert elevenlabs.synthesized == ["Only chunk."]
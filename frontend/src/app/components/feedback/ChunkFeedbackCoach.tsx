@@ -62,16 +62,23 @@ export const BetterVersion: React.FC<{
   correctedText: string;
   correctionExplanation: string;
   clonedAudioUrl?: string;
+  clonedAudioRange?: [number, number] | null;
   chunkId: number;
 }> = ({ 
   correctedText, 
   correctionExplanation, 
-  clonedAudioUrl
+  clonedAudioUrl,
+  clonedAudioRange
 }) => {
   const handleCopy = () => {
     navigator.clipboard.writeText(correctedText);
   };
 
+  // Combined TTS: all chunks share one file, play only this chunk's range (media fragment)
+  const clonedAudioSrc = clonedAudioUrl && clonedAudioRange
+    ? `${clonedAudioUrl}#t=${clonedAudioRange[0]},${clonedAudioRange[1]}`
+    : clonedAudioUrl;
+
   return (
     <div className="bg-gray-100 border-2 border-gray-300 rounded-xl p-5">
       <div className="flex items-center justify-between mb-3">
@@ -113,9 +120,9 @@ export const BetterVersion: React.FC<{
             <h5 className="text-sm font-semibold text-gray-900">听听用自己声音讲出来的满分示例吧！ (AI Voice Clone)</h5>
           </div>
           <audio 
-            key={clonedAudioUrl}
+            key={clonedAudioSrc}
             controls 
-            src={clonedAudioUrl}
+            src={clonedAudioSrc}
             preload="auto"
             className="w-full"
             style={{ height: '40px' }}
@@ -132,8 +139,9 @@ export const BetterVersion: React.FC<{
 export const ChunkFeedbackCoach: React.FC<{ 
   feedback: ChunkFeedbackStructured;
   clonedAudioUrl?: string;
+  clonedAudioRange?: [number, number] | null;
   chunkId: number;
-}> = ({ feedback, clonedAudioUrl, chunkId }) => {
+}> = ({ feedback, clonedAudioUrl, clonedAudioRange, chunkId }) => {
   return (
     <div className="space-y-6">
       {/* Coach Overview */}
@@ -150,6 +158,7 @@ export const ChunkFeedbackCoach: React.FC<{
         correctedText={feedback.corrected_text}
         correctionExplanation={feedback.correction_explanation}
         clonedAudioUrl={clonedAudioUrl}
+        clonedAudioRange={clonedAudioRange}
         chunkId={chunkId}
       />
     </div>
@@ -350,6 +350,7 @@ export const ReportPage: React.FC<ReportPageProps> = ({
   // Extract data from V2 structure
   const totalScore = report.global_evaluation.total_score;
   const level = report.global_evaluation.level;
+  const totalPercentile = report.score_percentiles?.total_score;
   const deliveryScore = report.global_evaluation.score_breakdown.delivery;
   const languageScore = report.global_evaluation.score_breakdown.language_use;
   const topicScore = report.global_evaluation.score_breakdown.topic_development;
@@ -491,6 +492,7 @@ export const ReportPage: React.FC<ReportPageProps> = ({
             <ChunkFeedbackCoach
               feedback={chunk.feedback_structured}
               clonedAudioUrl={chunk.cloned_audio_url}
+              clonedAudioRange={chunk.cloned_audio_range}
               chunkId={chunk.chunk_id}
             />
           </div>
@@ -533,6 +535,11 @@ export const ReportPage: React.FC<ReportPageProps> = ({
               </span>
             </div>
           </div>
+          {totalPercentile != null && (
+            <div className="text-xs text-gray-500 mt-2">
+              超过本题 {Math.round(totalPercentile)}% 的作答
+            </div>
+          )}
         </div>
         
         {/* AI Summary - Enhanced Gradient Card */}
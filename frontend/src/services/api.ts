@@ -124,6 +124,7 @@ export interface ChunkAnalysis {
   text: string;
   feedback_structured: ChunkFeedbackStructured;
   cloned_audio_url?: string;  // URL to cloned voice audio (corrected version)
+  cloned_audio_range?: [number, number] | null;  // [start, end] within cloned_audio_url when shared by all chunks
 }
 
 export interface ViewpointExtension {
@@ -142,6 +143,8 @@ export interface ReportJSONV2 {
   full_transcript: FullTranscript;
   chunks: ChunkAnalysis[];
   viewpoint_extensions?: ViewpointExtensions;
+  // Percentile rank (0-100) of each score among earlier attempts at the question
+  score_percentiles?: Record<string, number> | null;
 }
 
 // Legacy V1 interfaces (kept for backward compatibility)
@@ -212,6 +215,7 @@ export type SSEStepStatus = 'start' | 'completed';
 export interface SSEStepEvent {
   type: SSEStepType;
   status: SSEStepStatus;
+  analysis_id?: number | null;  // Set once the analysis exists; used to reconnect
 }
 
 export interface SSECompletedEvent {
@@ -366,31 +370,60 @@ export async function getRecordingReport(recordingId: string): Promise<Recording
   return response.json();
 }
 
+interface UploadUrlResponse {
+  recording_id: string;
+  object_key: string;
+  upload_url: string;
+  method: string;
+  headers: Record<string, string>;
+  expires_in: number;
+}
+
 /**
- * Submit audio for AI analysis with SSE streaming progress
+ * Upload a recording straight to storage via a presigned URL
  * Requires authentication
- * @param audioBlob - The recorded audio as a Blob
- * @param questionId - The ID of the question being answered
- * @param onEvent - Callback for each SSE event
+ * @returns The object key to pass to POST /analysis
  */
-export async function submitAnalysisWithSSE(
-  audioBlob: Blob,
-  questionId: string,
-  onEvent: (event: SSEEvent) => void
-): Promise<void> {
-  const formData = new FormData();
-  formData.append('audio', audioBlob, 'recording.webm');
-  formData.append('question_id', questionId);
-  
-  const response = await authenticatedFetch(`${API_BASE_URL}/analysis`, {
+async function uploadRecordingDirect(audioBlob: Blob, questionId: string): Promise<string> {
+  const response = await authenticatedFetch(`${API_BASE_URL}/analysis/uploads`, {
     method: 'POST',
-    body: formData,
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      question_id: questionId,
+      content_type: audioBlob.type || 'audio/webm',
+    }),
   });
   
   if (!response.ok) {
-    throw new Error(`Failed to start analysis: ${response.statusText}`);
+    throw new Error(`Failed to get upload URL: ${response.statusText}`);
+  }
+  
+  const upload: UploadUrlResponse = await response.json();
+  const uploadResponse = await fetch(upload.upload_url, {
+    method: upload.method,
+    headers: upload.headers,
+    body: audioBlob,
+  });
+  
+  if (!uploadResponse.ok) {
+    throw new Error(`Failed to upload recording: ${uploadResponse.statusText}`);
   }
   
+  return upload.object_key;
+}
+
+// Reconnect attempts after the analysis stream drops, and the delay before each
+const SSE_MAX_RECONNECTS = 5;
+const SSE_RECONNECT_DELAY_MS = 1000;
+
+/**
+ * Read an SSE response, calling onEvent with each event's ID and data
+ * @returns true if the stream ended with a completed or error event
+ */
+async function readSSEStream(
+  response: Response,
+  onEvent: (id: number | null, event: SSEEvent) => void
+): Promise<boolean> {
   if (!response.body) {
     throw new Error('No response body for SSE stream');
   }
@@ -398,6 +431,8 @@ export async function submitAnalysisWithSSE(
   const reader = response.body.getReader();
   const decoder = new TextDecoder();
   let buffer = '';
+  let eventId: number | null = null;
+  let finished = false;
   
   while (true) {
     const { done, value } = await reader.read();
@@ -413,17 +448,102 @@ export async function submitAnalysisWithSSE(
     buffer = lines.pop() || '';  // Keep incomplete line in buffer
     
     for (const line of lines) {
-      if (line.startsWith('data: ')) {
+      if (line.startsWith('id: ')) {
+        eventId = Number(line.slice(4).trim());
+      } else if (line.startsWith('data: ')) {
         const jsonStr = line.slice(6).trim();
         if (jsonStr) {
           try {
             const event = JSON.parse(jsonStr) as SSEEvent;
-            onEvent(event);
+            onEvent(eventId, event);
+            if (event.type === 'completed' || event.type === 'error') {
+              finished = true;
+            }
           } catch (e) {
             console.error('Failed to parse SSE event:', jsonStr, e);
           }
         }
+        eventId = null;
+      }
+    }
+  }
+  
+  return finished;
+}
+
+/**
+ * Submit audio for AI analysis with SSE streaming progress
+ * Requires authentication
+ * 
+ * If the stream drops before the final event, reattaches via
+ * GET /analysis/{id}/events with Last-Event-ID so no event is missed.
+ * @param audioBlob - The recorded audio as a Blob
+ * @param questionId - The ID of the question being answered
+ * @param onEvent - Callback for each SSE event
+ */
+export async function submitAnalysisWithSSE(
+  audioBlob: Blob,
+  questionId: string,
+  onEvent: (event: SSEEvent) => void
+): Promise<void> {
+  const formData = new FormData();
+  formData.append('question_id', questionId);
+  
+  try {
+    // Upload straight to storage so the API server never buffers the recording
+    formData.append('object_key', await uploadRecordingDirect(audioBlob, questionId));
+  } catch (e) {
+    console.warn('Direct upload failed, falling back to multipart upload:', e);
+    formData.append('audio', audioBlob, 'recording.webm');
+  }
+  
+  const response = await authenticatedFetch(`${API_BASE_URL}/analysis`, {
+    method: 'POST',
+    body: formData,
+  });
+  
+  if (!response.ok) {
+    throw new Error(`Failed to start analysis: ${response.statusText}`);
+  }
+  
+  let analysisId: number | null = null;
+  let lastEventId = 0;
+  const handleEvent = (id: number | null, event: SSEEvent) => {
+    if (id !== null) {
+      lastEventId = id;
+    }
+    if ('analysis_id' in event && event.analysis_id) {
+      analysisId = event.analysis_id;
+    }
+    onEvent(event);
+  };
+  
+  let finished = false;
+  try {
+    finished = await readSSEStream(response, handleEvent);
+  } catch (e) {
+    console.warn('Analysis stream interrupted:', e);
+  }
+  
+  for (let attempt = 1; !finished && attempt <= SSE_MAX_RECONNECTS; attempt++) {
+    if (analysisId === null) {
+      throw new Error('Analysis stream closed before the analysis started');
+    }
+    await new Promise((resolve) => setTimeout(resolve, SSE_RECONNECT_DELAY_MS * attempt));
+    try {
+      const retry = await authenticatedFetch(`${API_BASE_URL}/analysis/${analysisId}/events`, {
+        headers: { 'Last-Event-ID': String(lastEventId) },
+      });
+      if (!retry.ok) {
+        throw new Error(`Failed to reconnect: ${retry.statusText}`);
       }
+      finished = await readSSEStream(retry, handleEvent);
+    } catch (e) {
+      console.warn(`Analysis stream reconnect ${attempt} failed:`, e);
     }
   }
+  
+  if (!finished) {
+    throw new Error('Lost connection to the analysis stream');
+  }
 }
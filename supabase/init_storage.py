@@ -2,7 +2,9 @@
 """
 Initialize Supabase Storage buckets and upload question audio files.
 
-Run this after `supabase start` to set up storage.
+Run this after `supabase start` to set up storage. Files are synced:
+each bucket is listed once and only missing or changed objects (by
+ETag/MD5) are uploaded, in parallel, so re-runs are nearly free.
 
 Usage:
     cd supabase
@@ -11,14 +13,20 @@ Usage:
     export STORAGE_ACCESS_KEY="your-access-key"
     export STORAGE_SECRET_KEY="your-secret-key"
     
-    python init_storage.py
+    python init_storage.py [--workers N] [--force]
 """
 
+import argparse
+import hashlib
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
@@ -28,6 +36,10 @@ STORAGE_ACCESS_KEY = os.getenv("STORAGE_ACCESS_KEY", "")
 STORAGE_SECRET_KEY = os.getenv("STORAGE_SECRET_KEY", "")
 STORAGE_REGION = os.getenv("STORAGE_REGION", "local")
 
+# Files above the threshold are uploaded in parts of this size
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
 # Buckets to create
 BUCKETS = [
     "toefl-questions",   # For question audio files
@@ -57,7 +69,7 @@ SEED_RECORDINGS = {
 }
 
 
-def create_client():
+def create_client(max_pool_connections: int = 10):
     """Create S3 client for Supabase Storage."""
     if not STORAGE_ACCESS_KEY or not STORAGE_SECRET_KEY:
         print("Error: STORAGE_ACCESS_KEY and STORAGE_SECRET_KEY not set")
@@ -73,7 +85,11 @@ def create_client():
         aws_access_key_id=STORAGE_ACCESS_KEY,
         aws_secret_access_key=STORAGE_SECRET_KEY,
         region_name=STORAGE_REGION,
-        config=BotoConfig(signature_version='s3v4')
+        config=BotoConfig(
+            signature_version='s3v4',
+            # One pooled connection per upload thread
+            max_pool_connections=max_pool_connections
+        )
     )
 
 
@@ -98,72 +114,151 @@ def ensure_bucket(client, bucket_name: str) -> bool:
             return False
 
 
-def upload_question_audio(client, bucket_name: str):
-    """Upload question audio files to the questions bucket."""
-    print(f"\nUploading to: {bucket_name}")
-    print("-" * 50)
+@dataclass
+class SyncStats:
+    """Totals for one bucket sync."""
+    uploaded: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    bytes_uploaded: int = 0
+    elapsed: float = 0.0
+
+
+def list_bucket(client, bucket_name: str) -> dict[str, str]:
+    """List every object in a bucket once: key -> ETag (without quotes)."""
+    etags = {}
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name):
+        for obj in page.get("Contents", []):
+            etags[obj["Key"]] = obj["ETag"].strip('"')
+    return etags
+
+
+def local_etags(path: Path) -> set[str]:
+    """
+    ETags S3 would report for a local file.
     
-    if not QUESTIONS_DIR.exists():
-        print(f"⚠️  Questions directory not found: {QUESTIONS_DIR}")
-        return
+    Single-part uploads use the MD5 of the content; multipart uploads use
+    the MD5 of the part MD5s plus "-<parts>", for our part size.
+    """
+    md5 = hashlib.md5()
+    part_digests = []
+    with open(path, "rb") as f:
+        while chunk := f.read(MULTIPART_CHUNKSIZE):
+            md5.update(chunk)
+            part_digests.append(hashlib.md5(chunk).digest())
+    etags = {md5.hexdigest()}
+    if len(part_digests) > 1:
+        etags.add(f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}")
+    return etags
+
+
+def sync_files(client, bucket_name: str, local_dir: Path, files: dict[str, str],
+               workers: int, force: bool = False) -> SyncStats:
+    """
+    Upload local files whose content differs from the bucket.
     
-    for local_file, storage_path in QUESTION_AUDIO_FILES.items():
-        local_path = QUESTIONS_DIR / local_file
-        
-        if not local_path.exists():
-            print(f"⚠️  File not found: {local_path}")
-            continue
-        
-        try:
-            with open(local_path, "rb") as f:
-                client.put_object(
-                    Bucket=bucket_name,
-                    Key=storage_path,
-                    Body=f,
-                    ContentType="audio/mpeg"
-                )
-            print(f"✅ Uploaded: {local_file} → {storage_path}")
-        except Exception as e:
-            print(f"❌ Failed: {local_file} - {e}")
-
-
-def upload_seed_recordings(client, bucket_name: str):
-    """Upload seed recording files to the recordings bucket."""
-    print(f"\nUploading to: {bucket_name}")
+    Lists the bucket once, compares ETags with local MD5s and uploads only
+    missing or changed objects through a bounded thread pool (multipart
+    above MULTIPART_THRESHOLD).
+    
+    Args:
+        client: S3 client
+        bucket_name: Target bucket
+        local_dir: Directory holding the local files
+        files: local file name -> storage path
+        workers: Maximum concurrent uploads
+        force: Upload every file regardless of ETags
+    """
+    print(f"\nSyncing to: {bucket_name}")
     print("-" * 50)
+    stats = SyncStats()
     
-    if not RECORDINGS_DIR.exists():
-        print(f"⚠️  Recordings directory not found: {RECORDINGS_DIR}")
-        print("   (This is expected on fresh installations)")
-        return
+    if not local_dir.exists():
+        print(f"⚠️  Directory not found: {local_dir}")
+        return stats
+    
+    start = time.perf_counter()
+    try:
+        remote = {} if force else list_bucket(client, bucket_name)
+    except ClientError as e:
+        print(f"❌ Failed to list {bucket_name}: {e}")
+        return stats
     
-    for local_file, storage_path in SEED_RECORDINGS.items():
-        local_path = RECORDINGS_DIR / local_file
-        
+    pending = []
+    for local_file, storage_path in files.items():
+        local_path = local_dir / local_file
         if not local_path.exists():
             print(f"⚠️  File not found: {local_path}")
             continue
-        
-        try:
-            with open(local_path, "rb") as f:
-                client.put_object(
-                    Bucket=bucket_name,
-                    Key=storage_path,
-                    Body=f,
-                    ContentType="audio/mpeg"
-                )
-            print(f"✅ Uploaded: {local_file} → {storage_path}")
-        except Exception as e:
-            print(f"❌ Failed: {local_file} - {e}")
+        if remote.get(storage_path) in local_etags(local_path):
+            stats.unchanged += 1
+            continue
+        pending.append((local_file, local_path, storage_path))
+    
+    transfer_config = TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_concurrency=1,  # Parallelism comes from the outer pool
+    )
+    
+    def upload(local_path: Path, storage_path: str) -> None:
+        client.upload_file(
+            str(local_path), bucket_name, storage_path,
+            ExtraArgs={"ContentType": "audio/mpeg"},
+            Config=transfer_config,
+        )
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(upload, local_path, storage_path): (local_file, local_path, storage_path)
+            for local_file, local_path, storage_path in pending
+        }
+        for future in as_completed(futures):
+            local_file, local_path, storage_path = futures[future]
+            try:
+                future.result()
+                stats.uploaded += 1
+                stats.bytes_uploaded += local_path.stat().st_size
+                print(f"✅ Uploaded: {local_file} → {storage_path}")
+            except Exception as e:
+                stats.failed += 1
+                print(f"❌ Failed: {local_file} - {e}")
+    
+    stats.elapsed = time.perf_counter() - start
+    print(f"   {stats.uploaded} uploaded, {stats.unchanged} unchanged, {stats.failed} failed")
+    return stats
+
+
+def print_summary(results: list[SyncStats]) -> None:
+    """Print totals and throughput across all synced buckets."""
+    elapsed = max(sum(r.elapsed for r in results), 1e-6)
+    uploaded = sum(r.uploaded for r in results)
+    checked = uploaded + sum(r.unchanged + r.failed for r in results)
+    bytes_uploaded = sum(r.bytes_uploaded for r in results)
+    print(
+        f"\n📊 {checked} objects checked, {uploaded} uploaded "
+        f"({bytes_uploaded / 1e6:.1f} MB) in {elapsed:.2f}s: "
+        f"{checked / elapsed:.0f} objects/s, {bytes_uploaded / elapsed / 1e6:.1f} MB/s"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Initialize Supabase Storage buckets and sync seed audio.")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent uploads (default: 8)")
+    parser.add_argument("--force", action="store_true", help="Re-upload every file, even if unchanged")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+    
     print("=" * 60)
     print("Supabase Storage Initialization")
     print("=" * 60)
     print(f"\nEndpoint: {STORAGE_ENDPOINT}")
     
-    client = create_client()
+    client = create_client(max_pool_connections=args.workers)
     
     # Step 1: Create all buckets
     print("\n📦 Creating buckets...")
@@ -172,13 +267,19 @@ def main():
     for bucket in BUCKETS:
         ensure_bucket(client, bucket)
     
-    # Step 2: Upload question audio files
-    print("\n🎵 Uploading question audio files...")
-    upload_question_audio(client, "toefl-questions")
+    # Step 2: Sync question audio files
+    print("\n🎵 Syncing question audio files...")
+    results = [sync_files(client, "toefl-questions", QUESTIONS_DIR, QUESTION_AUDIO_FILES,
+                          args.workers, args.force)]
+    
+    # Step 3: Sync seed recording files
+    print("\n🎤 Syncing seed recordings...")
+    results.append(sync_files(client, "toefl-recordings", RECORDINGS_DIR, SEED_RECORDINGS,
+                              args.workers, args.force))
+    if not RECORDINGS_DIR.exists():
+        print("   (This is expected on fresh installations)")
     
-    # Step 3: Upload seed recording files
-    print("\n🎤 Uploading seed recordings...")
-    upload_seed_recordings(client, "toefl-recordings")
+    print_summary(results)
     
     # Done
     print("\n" + "=" * 60)
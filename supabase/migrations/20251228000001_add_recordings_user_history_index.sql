@@ -0,0 +1,12 @@
+-- Migration: 005_add_recordings_user_history_index
+-- Description: Composite index for paginated practice history (GET /me/recordings)
+-- Created: 2025-12-28
+
+-- Keyset pagination walks (user_id, created_at DESC, recording_id DESC) directly;
+-- question_id is included so the join to questions needs no heap lookup for the key
+CREATE INDEX IF NOT EXISTS idx_recordings_user_history
+ON recordings (user_id, created_at DESC, recording_id DESC)
+INCLUDE (question_id);
+
+-- Superseded: user_id is the leading column of idx_recordings_user_history
+DROP INDEX IF EXISTS idx_recordings_user_id;
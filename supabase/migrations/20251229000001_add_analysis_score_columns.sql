@@ -0,0 +1,20 @@
+-- Migration: 006_add_analysis_score_columns
+-- Description: Typed score columns extracted from report_json for indexed analytics
+-- Created: 2025-12-29
+
+-- Populated by the backend when an analysis completes.
+-- Existing rows: run backend/backfill_score_columns.py after this migration
+-- (batched, so it does not hold a long lock on analysis_results).
+ALTER TABLE analysis_results
+ADD COLUMN IF NOT EXISTS total_score SMALLINT,
+ADD COLUMN IF NOT EXISTS delivery REAL,
+ADD COLUMN IF NOT EXISTS language_use REAL,
+ADD COLUMN IF NOT EXISTS topic_development REAL,
+ADD COLUMN IF NOT EXISTS level VARCHAR(20),
+ADD COLUMN IF NOT EXISTS analysis_version VARCHAR(10);
+
+-- Score indexes are built CONCURRENTLY in the next two migrations, which must
+-- not run inside a transaction
+
+COMMENT ON COLUMN analysis_results.total_score IS 'report_json.global_evaluation.total_score (0-30)';
+COMMENT ON COLUMN analysis_results.analysis_version IS 'report_json.analysis_version; set once score columns are populated';
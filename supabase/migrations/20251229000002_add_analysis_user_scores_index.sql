@@ -0,0 +1,13 @@
+-- Migration: 006b_add_analysis_user_scores_index
+-- Description: Covering index for per-user score aggregates, built without blocking writes
+-- Created: 2025-12-29
+
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so this
+-- file holds this one statement only. If the build fails it leaves an INVALID
+-- index behind: DROP INDEX CONCURRENTLY it and apply this migration again.
+
+-- Per-user aggregates (optionally per question); covering, so they are index-only scans
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_results_user_scores
+ON analysis_results (user_id, question_id)
+INCLUDE (total_score, delivery, language_use, topic_development)
+WHERE status = 'completed';
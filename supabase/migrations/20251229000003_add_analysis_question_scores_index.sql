@@ -0,0 +1,13 @@
+-- Migration: 006c_add_analysis_question_scores_index
+-- Description: Covering index for per-question score aggregates, built without blocking writes
+-- Created: 2025-12-29
+
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so this
+-- file holds this one statement only. If the build fails it leaves an INVALID
+-- index behind: DROP INDEX CONCURRENTLY it and apply this migration again.
+
+-- Per-question aggregates across all users
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_results_question_scores
+ON analysis_results (question_id)
+INCLUDE (total_score, delivery, language_use, topic_development)
+WHERE status = 'completed';
@@ -0,0 +1,21 @@
+-- Migration: 007_add_user_progress
+-- Description: Per-user progress rollup maintained as analyses complete (GET /me/progress)
+-- Created: 2025-12-30
+
+-- One row per user, updated in the same transaction that completes an analysis.
+-- Existing data: run backend/rebuild_user_progress.py after this migration.
+CREATE TABLE IF NOT EXISTS user_progress (
+    user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+    attempt_count INTEGER NOT NULL DEFAULT 0,
+    score_sums JSONB NOT NULL DEFAULT '{}'::jsonb,
+    score_counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    best_total_score SMALLINT,
+    recent_attempts JSONB NOT NULL DEFAULT '[]'::jsonb,
+    question_bests JSONB NOT NULL DEFAULT '{}'::jsonb,
+    last_attempt_at TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON COLUMN user_progress.score_sums IS 'Running sum per score dimension (total_score, delivery, language_use, topic_development)';
+COMMENT ON COLUMN user_progress.recent_attempts IS 'Last N attempts with scores, newest first (ring buffer)';
+COMMENT ON COLUMN user_progress.question_bests IS 'question_id -> {total_score, recording_id} of the best attempt';
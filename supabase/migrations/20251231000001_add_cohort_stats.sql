@@ -0,0 +1,81 @@
+-- Migration: 008_add_cohort_stats
+-- Description: Cohorts (classes) and materialized views for teacher dashboards
+-- Created: 2025-12-31
+
+-- A cohort is a class owned by a teacher
+CREATE TABLE IF NOT EXISTS cohorts (
+    cohort_id VARCHAR(50) PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    teacher_id UUID NOT NULL REFERENCES auth.users(id),
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_cohorts_teacher_id ON cohorts(teacher_id);
+
+CREATE TABLE IF NOT EXISTS cohort_members (
+    cohort_id VARCHAR(50) NOT NULL REFERENCES cohorts(cohort_id) ON DELETE CASCADE,
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    joined_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (cohort_id, user_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cohort_members_user_id ON cohort_members(user_id);
+
+-- Per-cohort totals: members, active students, completed analyses, average scores
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_cohort_summary AS
+SELECT
+    c.cohort_id,
+    COUNT(DISTINCT m.user_id) AS member_count,
+    COUNT(DISTINCT a.user_id) AS active_student_count,
+    COUNT(a.id) AS completed_count,
+    AVG(a.total_score)::REAL AS avg_total_score,
+    AVG(a.delivery)::REAL AS avg_delivery,
+    AVG(a.language_use)::REAL AS avg_language_use,
+    AVG(a.topic_development)::REAL AS avg_topic_development,
+    MAX(a.created_at) AS last_attempt_at
+FROM cohorts c
+LEFT JOIN cohort_members m ON m.cohort_id = c.cohort_id
+LEFT JOIN analysis_results a ON a.user_id = m.user_id AND a.status = 'completed'
+GROUP BY c.cohort_id;
+
+-- Per-cohort, per-question attempt counts and average scores
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_cohort_question_stats AS
+SELECT
+    m.cohort_id,
+    a.question_id,
+    COUNT(*) AS attempt_count,
+    COUNT(DISTINCT a.user_id) AS student_count,
+    AVG(a.total_score)::REAL AS avg_total_score,
+    AVG(a.delivery)::REAL AS avg_delivery,
+    AVG(a.language_use)::REAL AS avg_language_use,
+    AVG(a.topic_development)::REAL AS avg_topic_development,
+    MAX(a.created_at) AS last_attempt_at
+FROM analysis_results a
+JOIN cohort_members m ON m.user_id = a.user_id
+WHERE a.status = 'completed' AND a.question_id IS NOT NULL
+GROUP BY m.cohort_id, a.question_id;
+
+-- Per-cohort, per-question distribution of total scores (0-30)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_cohort_score_histogram AS
+SELECT
+    m.cohort_id,
+    a.question_id,
+    a.total_score,
+    COUNT(*) AS attempt_count
+FROM analysis_results a
+JOIN cohort_members m ON m.user_id = a.user_id
+WHERE a.status = 'completed' AND a.question_id IS NOT NULL AND a.total_score IS NOT NULL
+GROUP BY m.cohort_id, a.question_id, a.total_score;
+
+-- Unique indexes are required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+-- and double as the keyset pagination order of the read endpoints
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_cohort_summary
+ON mv_cohort_summary (cohort_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_cohort_question_stats
+ON mv_cohort_question_stats (cohort_id, question_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_cohort_score_histogram
+ON mv_cohort_score_histogram (cohort_id, question_id, total_score);
+
+COMMENT ON MATERIALIZED VIEW mv_cohort_summary IS 'Refreshed concurrently by the backend every COHORT_STATS_REFRESH_SECONDS';
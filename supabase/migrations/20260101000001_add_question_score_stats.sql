@@ -0,0 +1,19 @@
+-- Migration: 009_add_question_score_stats
+-- Description: Per-question score histograms for percentile ranks (GET /questions/{id}/stats)
+-- Created: 2026-01-01
+
+-- One row per question, updated in the same transaction that completes an analysis
+-- by incrementing one element of each array.
+-- Existing data: run backend/backfill_score_columns.py after this migration.
+CREATE TABLE IF NOT EXISTS question_score_stats (
+    question_id VARCHAR(50) PRIMARY KEY REFERENCES questions(question_id) ON DELETE CASCADE,
+    attempt_count INTEGER NOT NULL DEFAULT 0,
+    total_score_hist INTEGER[] NOT NULL DEFAULT array_fill(0, ARRAY[31]),
+    delivery_hist INTEGER[] NOT NULL DEFAULT array_fill(0, ARRAY[41]),
+    language_use_hist INTEGER[] NOT NULL DEFAULT array_fill(0, ARRAY[41]),
+    topic_development_hist INTEGER[] NOT NULL DEFAULT array_fill(0, ARRAY[41]),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON COLUMN question_score_stats.total_score_hist IS 'Attempts per total_score 0..30 (element i+1 = score i)';
+COMMENT ON COLUMN question_score_stats.delivery_hist IS 'Attempts per delivery score 0.0..4.0 in 0.1 bins (element i+1 = score i/10)';
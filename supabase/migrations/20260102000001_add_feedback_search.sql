@@ -0,0 +1,58 @@
+-- Migration: 010_add_feedback_search
+-- Description: Full-text search over report feedback and transcripts (GET /me/feedback/search)
+-- Created: 2026-01-02
+
+-- One row per report chunk, written in the same transaction that completes an analysis.
+-- CJK characters are spaced out before parsing so each becomes its own lexeme
+-- (no built-in parser segments Chinese); queries apply the same rule.
+CREATE TABLE IF NOT EXISTS feedback_documents (
+    analysis_id INTEGER NOT NULL REFERENCES analysis_results(id) ON DELETE CASCADE,
+    chunk_id INTEGER NOT NULL,
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    recording_id VARCHAR(50) NOT NULL,
+    question_id VARCHAR(50),
+    chunk_type VARCHAR(50),
+    created_at TIMESTAMP NOT NULL,
+    weaknesses TEXT,
+    overview TEXT,
+    corrected_text TEXT,
+    transcript TEXT,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', regexp_replace(coalesce(weaknesses, ''), '([㐀-鿿豈-﫿])', ' \1 ', 'g')), 'A') ||
+        setweight(to_tsvector('english', regexp_replace(coalesce(overview, ''), '([㐀-鿿豈-﫿])', ' \1 ', 'g')), 'B') ||
+        setweight(to_tsvector('english', regexp_replace(coalesce(corrected_text, ''), '([㐀-鿿豈-﫿])', ' \1 ', 'g')), 'C') ||
+        setweight(to_tsvector('english', regexp_replace(coalesce(transcript, ''), '([㐀-鿿豈-﫿])', ' \1 ', 'g')), 'D')
+    ) STORED,
+    PRIMARY KEY (analysis_id, chunk_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_feedback_documents_search
+    ON feedback_documents USING GIN (search_vector);
+
+-- Per-user newest-first scans (the planner ANDs this with the GIN index)
+CREATE INDEX IF NOT EXISTS idx_feedback_documents_user_recent
+    ON feedback_documents (user_id, created_at, analysis_id, chunk_id);
+
+-- Index reports completed before this migration
+INSERT INTO feedback_documents (
+    analysis_id, chunk_id, user_id, recording_id, question_id, chunk_type, created_at,
+    weaknesses, overview, corrected_text, transcript
+)
+SELECT
+    ar.id,
+    COALESCE((chunk.value->>'chunk_id')::INTEGER, (chunk.ordinality - 1)::INTEGER),
+    ar.user_id,
+    ar.recording_id,
+    ar.question_id,
+    chunk.value->>'chunk_type',
+    ar.created_at,
+    (SELECT string_agg(w, E'\n') FROM jsonb_array_elements_text(chunk.value->'feedback_structured'->'weaknesses') AS w),
+    chunk.value->'feedback_structured'->>'overview',
+    chunk.value->'feedback_structured'->>'corrected_text',
+    chunk.value->>'text'
+FROM analysis_results ar
+CROSS JOIN LATERAL jsonb_array_elements(ar.report_json->'chunks') WITH ORDINALITY AS chunk(value, ordinality)
+WHERE ar.status = 'completed'
+  AND ar.user_id IS NOT NULL
+  AND jsonb_typeof(ar.report_json->'chunks') = 'array'
+ON CONFLICT (analysis_id, chunk_id) DO NOTHING;
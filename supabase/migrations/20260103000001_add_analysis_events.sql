@@ -0,0 +1,16 @@
+-- Migration: 011_add_analysis_events
+-- Description: Per-analysis SSE event log for reattachable streams (GET /analysis/{id}/events)
+-- Created: 2026-01-03
+
+-- One row per progress event, written as the pipeline publishes it. Workers
+-- keep recent runs in memory; this table serves replays from other workers.
+-- Rows are deleted ANALYSIS_EVENTS_RETENTION_SECONDS after the run finishes.
+CREATE TABLE IF NOT EXISTS analysis_events (
+    analysis_id INTEGER NOT NULL REFERENCES analysis_results(id) ON DELETE CASCADE,
+    event_id INTEGER NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (analysis_id, event_id)
+);
+
+COMMENT ON COLUMN analysis_events.event_id IS 'SSE event ID (1-based, per analysis), echoed back as Last-Event-ID';